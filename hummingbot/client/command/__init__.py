@@ -9,6 +9,7 @@ from .help_command import HelpCommand
 from .history_command import HistoryCommand
 from .import_command import ImportCommand
 from .mqtt_command import MQTTCommand
+from .network_metrics_command import NetworkMetricsCommand
 from .order_book_command import OrderBookCommand
 from .pmm_script_command import PMMScriptCommand
 from .previous_strategy_command import PreviousCommand
@@ -40,4 +41,5 @@ __all__ = [
     StopCommand,
     TickerCommand,
     MQTTCommand,
+    NetworkMetricsCommand,
 ]
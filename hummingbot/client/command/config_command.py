@@ -78,9 +78,16 @@ client_configs_to_display = ["autofill_import",
                              "global_token_name",
                              "global_token_symbol",
                              "rate_limits_share_pct",
+                             "rate_limits_shared_budget",
                              "commands_timeout",
                              "create_command_timeout",
                              "other_commands_timeout",
+                             "http_client",
+                             "connections_limit",
+                             "connections_limit_per_host",
+                             "keepalive_timeout",
+                             "dns_cache_ttl",
+                             "warm_connections",
                              "tables_format",
                              "tick_size",
                              "market_data_collection",
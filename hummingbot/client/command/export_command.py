@@ -6,6 +6,7 @@ from sqlalchemy.orm import Query, Session
 
 from hummingbot.client.config.security import Security
 from hummingbot.client.settings import DEFAULT_LOG_FILE_PATH
+from hummingbot.core.network_metrics import NetworkMetrics
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.model.trade_fill import TradeFill
 
@@ -16,13 +17,15 @@ if TYPE_CHECKING:
 class ExportCommand:
     def export(self,  # type: HummingbotApplication
                option):
-        if option is None or option not in ("keys", "trades"):
+        if option is None or option not in ("keys", "trades", "network_metrics"):
             self.notify("Invalid export option.")
             return
         elif option == "keys":
             safe_ensure_future(self.export_keys())
         elif option == "trades":
             safe_ensure_future(self.export_trades())
+        elif option == "network_metrics":
+            safe_ensure_future(self.export_network_metrics())
 
     async def export_keys(self,  # type: HummingbotApplication
                           ):
@@ -89,6 +92,31 @@ class ExportCommand:
             self.placeholder_mode = False
             self.app.hide_input = False
 
+    async def export_network_metrics(self,  # type: HummingbotApplication
+                                     ):
+        network_metrics = NetworkMetrics.get_instance()
+        rows = ([{"type": "rest", **row} for row in network_metrics.rest_endpoints_rows()]
+                + [{"type": "ws", **row} for row in network_metrics.ws_streams_rows()])
+        if len(rows) == 0:
+            self.notify("No network metrics to export.")
+            return
+        self.placeholder_mode = True
+        self.app.hide_input = True
+        path = self.client_config_map.log_file_path
+        if path is None:
+            path = str(DEFAULT_LOG_FILE_PATH)
+        file_name = await self.prompt_new_export_file_name(path)
+        if file_name is not None:
+            file_path = os.path.join(path, file_name)
+            try:
+                pd.DataFrame(rows).to_csv(file_path, header=True, index=False)
+                self.notify(f"Successfully exported network metrics to {file_path}")
+            except Exception as e:
+                self.notify(f"Error exporting network metrics to {path}: {e}")
+        self.app.change_prompt(prompt=">>> ")
+        self.placeholder_mode = False
+        self.app.hide_input = False
+
     def _get_trades_from_session(self,  # type: HummingbotApplication
                                  start_timestamp: int,
                                  session: Session,
@@ -0,0 +1,71 @@
+import threading
+from typing import TYPE_CHECKING, List
+
+import pandas as pd
+
+from hummingbot.client.ui.interface_utils import format_df_for_printout
+from hummingbot.core.network_metrics import NetworkMetrics
+from hummingbot.core.utils.async_utils import safe_ensure_future
+
+if TYPE_CHECKING:
+    from hummingbot.client.hummingbot_application import HummingbotApplication  # noqa: F401
+
+
+class NetworkMetricsCommand:
+    def network_metrics(self,  # type: HummingbotApplication
+                        reset: bool = False):
+        if threading.current_thread() != threading.main_thread():
+            self.ev_loop.call_soon_threadsafe(self.network_metrics, reset)
+            return
+        safe_ensure_future(self.show_network_metrics(reset))
+
+    async def show_network_metrics(self,  # type: HummingbotApplication
+                                   reset: bool = False):
+        network_metrics = NetworkMetrics.get_instance()
+        if reset:
+            network_metrics.reset()
+            self.notify("\n  Network metrics reset.")
+            return
+        rest_rows = network_metrics.rest_endpoints_rows()
+        ws_rows = network_metrics.ws_streams_rows()
+        if len(rest_rows) == 0 and len(ws_rows) == 0:
+            self.notify("\n  No network metrics collected yet.")
+            return
+        lines = []
+        if len(rest_rows) > 0:
+            lines.extend(["", "  REST requests (times in ms):"] + self._rest_metrics_lines(rest_rows))
+        if len(ws_rows) > 0:
+            lines.extend(["", "  WebSocket streams (times in ms):"] + self._ws_metrics_lines(ws_rows))
+        self.notify("\n".join(lines))
+
+    def _rest_metrics_lines(self,  # type: HummingbotApplication
+                            rows) -> List[str]:
+        columns = ["Limit ID", "Requests", "Errors", "Throttle avg", "Throttle p99",
+                   "Network avg", "Network p50", "Network p99", "Decode avg", "Received KB"]
+        data = [[row["limit_id"],
+                 row["requests"],
+                 row["errors"],
+                 round(row["throttle_wait_avg_ms"], 1),
+                 round(row["throttle_wait_p99_ms"], 1),
+                 round(row["network_avg_ms"], 1),
+                 round(row["network_p50_ms"], 1),
+                 round(row["network_p99_ms"], 1),
+                 round(row["decode_avg_ms"], 2),
+                 round(row["response_bytes"] / 1e3, 1)] for row in rows]
+        df = pd.DataFrame(data=data, columns=columns)
+        return ["    " + line for line in format_df_for_printout(df, self.client_config_map.tables_format).split("\n")]
+
+    def _ws_metrics_lines(self,  # type: HummingbotApplication
+                          rows) -> List[str]:
+        columns = ["URL", "Messages", "Msg/s", "Inter-arrival p50", "Inter-arrival p99", "Decode avg", "Decode p99",
+                   "Received KB"]
+        data = [[row["url"],
+                 row["messages"],
+                 round(row["messages_per_second"], 1),
+                 round(row["inter_arrival_p50_ms"], 1),
+                 round(row["inter_arrival_p99_ms"], 1),
+                 round(row["decode_avg_ms"], 3),
+                 round(row["decode_p99_ms"], 3),
+                 round(row["received_bytes"] / 1e3, 1)] for row in rows]
+        df = pd.DataFrame(data=data, columns=columns)
+        return ["    " + line for line in format_df_for_printout(df, self.client_config_map.tables_format).split("\n")]
@@ -14,6 +14,7 @@ from hummingbot.client.config.config_helpers import (
 )
 from hummingbot.client.config.security import Security
 from hummingbot.client.settings import ethereum_wallet_required, required_exchanges
+from hummingbot.client.ui.interface_utils import format_df_for_printout
 from hummingbot.connector.connector_base import ConnectorBase
 from hummingbot.core.network_iterator import NetworkStatus
 from hummingbot.core.utils.async_utils import safe_ensure_future
@@ -66,6 +67,25 @@ class StatusCommand:
 
         return "\n".join(lines)
 
+    def _format_clock_tick_stats(self,  # type: HummingbotApplication
+                                 ) -> str:
+        if self.clock is None or self.clock.tick_overruns < 1:
+            return ""
+        lines: List[str] = [f"\n  Clock tick overruns: {self.clock.tick_overruns} "
+                            f"(ticks longer than {self.clock.tick_size}s)"]
+        data = [[stats.name,
+                 stats.ticks_count,
+                 round(stats.average_duration * 1e3, 2),
+                 round(stats.percentile(99) * 1e3, 2),
+                 round(stats.max_duration * 1e3, 2),
+                 stats.overruns]
+                for stats in sorted(self.clock.tick_stats.values(), key=lambda s: s.average_duration, reverse=True)]
+        df = pd.DataFrame(data=data, columns=["Iterator", "Ticks", "Avg (ms)", "p99 (ms)", "Max (ms)", "Overruns"])
+        lines.extend(["    " + line for line in format_df_for_printout(
+            df,
+            table_format=self.client_config_map.tables_format).split("\n")])
+        return "\n".join(lines)
+
     async def strategy_status(self, live: bool = False):
         active_paper_exchanges = [exchange for exchange in self.markets.keys() if exchange.endswith("paper_trade")]
 
@@ -75,7 +95,7 @@ class StatusCommand:
             st_status = await self.strategy.format_status()
         else:
             st_status = self.strategy.format_status()
-        status = paper_trade + "\n" + st_status
+        status = paper_trade + "\n" + st_status + self._format_clock_tick_stats()
         if self._pmm_script_iterator is not None and live is False:
             self._pmm_script_iterator.request_status()
         return status
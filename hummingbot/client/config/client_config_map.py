@@ -34,6 +34,7 @@ from hummingbot.connector.exchange_base import ExchangeBase
 from hummingbot.core.rate_oracle.rate_oracle import RATE_ORACLE_SOURCES, RateOracle
 from hummingbot.core.rate_oracle.sources.rate_source_base import RateSourceBase
 from hummingbot.core.utils.kill_switch import ActiveKillSwitch, KillSwitch, PassThroughKillSwitch
+from hummingbot.core.web_assistant.connections.data_types import HTTPClientConfig
 from hummingbot.notifier.telegram_notifier import TelegramNotifier
 from hummingbot.pmm_script.pmm_script_iterator import PMMScriptIterator
 from hummingbot.strategy.strategy_base import StrategyBase
@@ -667,6 +668,66 @@ class CommandsTimeoutConfigMap(BaseClientModel):
         return super().validate_decimal(v, field)
 
 
+class HTTPClientConfigMap(BaseClientModel):
+    connections_limit: int = Field(
+        default=HTTPClientConfig.limit,
+        ge=0,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Maximum number of simultaneous HTTP connections of each connector (0 for no limit)"
+            ),
+        ),
+    )
+    connections_limit_per_host: int = Field(
+        default=HTTPClientConfig.limit_per_host,
+        ge=0,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Maximum number of simultaneous HTTP connections of each connector to the same host (0 for no limit)"
+            ),
+        ),
+    )
+    keepalive_timeout: float = Field(
+        default=HTTPClientConfig.keepalive_timeout,
+        gt=0,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Time to keep idle HTTP connections open to reuse them (in seconds)"
+            ),
+        ),
+    )
+    dns_cache_ttl: int = Field(
+        default=HTTPClientConfig.dns_cache_ttl,
+        ge=0,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Time to cache the resolved exchange addresses (in seconds, 0 to disable the cache)"
+            ),
+        ),
+    )
+    warm_connections: int = Field(
+        default=HTTPClientConfig.warm_connections,
+        ge=0,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Number of HTTP connections to open in advance when a connector starts"
+            ),
+        ),
+    )
+
+    class Config:
+        title = "http_client"
+
+    def build_http_client_config(self) -> HTTPClientConfig:
+        return HTTPClientConfig(
+            limit=self.connections_limit,
+            limit_per_host=self.connections_limit_per_host,
+            keepalive_timeout=self.keepalive_timeout,
+            dns_cache_ttl=self.dns_cache_ttl,
+            warm_connections=self.warm_connections,
+        )
+
+
 class AnonymizedMetricsMode(BaseClientModel, ABC):
     @abstractmethod
     def get_collector(
@@ -998,7 +1059,22 @@ class ClientConfigMap(BaseClientModel):
             ),
         ),
     )
+    rate_limits_shared_budget: bool = Field(
+        default=False,
+        description=("Share the API rate limits of each exchange with the other bot instances running on this host."
+                     "\nWhen enabled, the allocated rate limits are split equally between the running instances."),
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Do you want to share the API rate limits with the other bot instances running on this host?"
+                " (Yes/No)"
+            ),
+        ),
+    )
     commands_timeout: CommandsTimeoutConfigMap = Field(default=CommandsTimeoutConfigMap())
+    http_client: HTTPClientConfigMap = Field(
+        default=HTTPClientConfigMap(),
+        description="Connection pool settings of the HTTP clients used by the connectors",
+    )
     tables_format: ClientConfigEnum(
         value="TabulateFormats",  # noqa: F821
         names={e: e for e in tabulate_formats},
@@ -158,7 +158,8 @@ def load_parser(hummingbot: "HummingbotApplication", command_tabs) -> [ThrowingA
     exit_parser.set_defaults(func=hummingbot.exit)
 
     export_parser = subparsers.add_parser("export", help="Export secure information")
-    export_parser.add_argument("option", nargs="?", choices=("keys", "trades"), help="Export choices")
+    export_parser.add_argument("option", nargs="?", choices=("keys", "trades", "network_metrics"),
+                               help="Export choices")
     export_parser.set_defaults(func=hummingbot.export)
 
     ticker_parser = subparsers.add_parser("ticker", help="Show market ticker of current order book")
@@ -167,6 +168,12 @@ def load_parser(hummingbot: "HummingbotApplication", command_tabs) -> [ThrowingA
     ticker_parser.add_argument("--market", type=str, dest="market", help="The market (trading pair) of the order book")
     ticker_parser.set_defaults(func=hummingbot.ticker)
 
+    network_metrics_parser = subparsers.add_parser(
+        "network_metrics", help="Show the latency and throughput of the connectors' REST requests and websockets")
+    network_metrics_parser.add_argument("--reset", default=False, action="store_true", dest="reset",
+                                        help="Discard the metrics collected so far")
+    network_metrics_parser.set_defaults(func=hummingbot.network_metrics)
+
     pmm_script_parser = subparsers.add_parser("pmm_script", help="Send command to running PMM script instance")
     pmm_script_parser.add_argument("cmd", nargs="?", default=None, help="Command")
     pmm_script_parser.add_argument("args", nargs="*", default=None, help="Arguments")
@@ -113,6 +113,20 @@ class BinanceExchange(ExchangePyBase):
     def is_trading_required(self) -> bool:
         return self._trading_required
 
+    @property
+    def is_order_book_parallel_init_enabled(self) -> bool:
+        # The snapshot requests are sent through the connector throttler
+        return True
+
+    @property
+    def is_order_book_direct_diff_dispatch_enabled(self) -> bool:
+        return True
+
+    @property
+    def is_order_book_resync_on_gap_enabled(self) -> bool:
+        # The diffs carry the first update ID (U), and each one starts right after the previous one
+        return True
+
     def supported_order_types(self):
         return [OrderType.LIMIT, OrderType.LIMIT_MAKER, OrderType.MARKET]
 
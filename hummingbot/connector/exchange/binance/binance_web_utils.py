@@ -6,6 +6,8 @@ from hummingbot.connector.utils import TimeSynchronizerRESTPreProcessor
 from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
 from hummingbot.core.web_assistant.auth import AuthBase
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod
+from hummingbot.core.web_assistant.connections.json_codec import fast_json_codec
+from hummingbot.core.web_assistant.rest_request_coalescer import RESTRequestCoalescer
 from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
 
 
@@ -46,7 +48,10 @@ def build_api_factory(
         auth=auth,
         rest_pre_processors=[
             TimeSynchronizerRESTPreProcessor(synchronizer=time_synchronizer, time_provider=time_provider),
-        ])
+        ],
+        json_codec=fast_json_codec(),
+        # The trading rules and the trading pair symbols are requested concurrently from the exchange info endpoint
+        rest_request_coalescer=RESTRequestCoalescer())
     return api_factory
 
 
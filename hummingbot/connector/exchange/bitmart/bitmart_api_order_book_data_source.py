@@ -2,11 +2,7 @@ import asyncio
 import json
 from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
-from hummingbot.connector.exchange.bitmart import (
-    bitmart_constants as CONSTANTS,
-    bitmart_utils as utils,
-    bitmart_web_utils as web_utils,
-)
+from hummingbot.connector.exchange.bitmart import bitmart_constants as CONSTANTS, bitmart_web_utils as web_utils
 from hummingbot.core.data_type.common import TradeType
 from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
@@ -184,15 +180,19 @@ class BitmartAPIOrderBookDataSource(OrderBookTrackerDataSource):
     async def _process_websocket_messages(self, websocket_assistant: WSAssistant):
         async for ws_response in websocket_assistant.iter_messages():
             data: Dict[str, Any] = ws_response.data
-            decompressed_data = utils.decompress_ws_message(data)
+            if isinstance(data, bytes):
+                # Binary frames the websocket connection could not decompress
+                self.logger().warning(f"Undecodable binary message received through the order book data source "
+                                      f"connection ({data})")
+                continue
             try:
-                if type(decompressed_data) == str:
-                    json_data = json.loads(decompressed_data)
+                if isinstance(data, str):
+                    json_data = json.loads(data)
                 else:
-                    json_data = decompressed_data
+                    json_data = data
             except Exception:
                 self.logger().warning(f"Invalid event message received through the order book data source "
-                                      f"connection ({decompressed_data})")
+                                      f"connection ({data})")
                 continue
 
             if "errorCode" in json_data or "errorMessage" in json_data:
@@ -2,7 +2,7 @@ import asyncio
 import json
 from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
-from hummingbot.connector.exchange.bitmart import bitmart_constants as CONSTANTS, bitmart_utils as utils
+from hummingbot.connector.exchange.bitmart import bitmart_constants as CONSTANTS
 from hummingbot.connector.exchange.bitmart.bitmart_auth import BitmartAuth
 from hummingbot.core.data_type.user_stream_tracker_data_source import UserStreamTrackerDataSource
 from hummingbot.core.web_assistant.connections.data_types import WSJSONRequest, WSResponse
@@ -82,17 +82,21 @@ class BitmartAPIUserStreamDataSource(UserStreamTrackerDataSource):
     async def _process_websocket_messages(self, websocket_assistant: WSAssistant, queue: asyncio.Queue):
         async for ws_response in websocket_assistant.iter_messages():
             data: Dict[str, Any] = ws_response.data
-            decompressed_data = utils.decompress_ws_message(data)
+            if isinstance(data, bytes):
+                # Binary frames the websocket connection could not decompress
+                self.logger().warning(f"Undecodable binary message received through the user stream data source "
+                                      f"connection ({data})")
+                continue
             try:
-                if type(decompressed_data) == str:
-                    json_data = json.loads(decompressed_data)
+                if isinstance(data, str):
+                    json_data = json.loads(data)
                 else:
-                    json_data = decompressed_data
+                    json_data = data
             except asyncio.CancelledError:
                 raise
             except Exception:
                 self.logger().warning(f"Invalid event message received through the order book data source "
-                                      f"connection ({decompressed_data})")
+                                      f"connection ({data})")
                 continue
 
             if "errorCode" in json_data or "errorMessage" in json_data:
@@ -26,19 +26,8 @@ def is_exchange_information_valid(exchange_info: Dict[str, Any]) -> bool:
     return exchange_info.get("trade_status", None) == "trading"
 
 
-# Decompress WebSocket messages
-def decompress_ws_message(message):
-    if type(message) == bytes:
-        decompress = zlib.decompressobj(-zlib.MAX_WBITS)
-        inflated = decompress.decompress(message)
-        inflated += decompress.flush()
-        return inflated.decode('UTF-8')
-    else:
-        return message
-
-
 def compress_ws_message(message):
-    if type(message) == str:
+    if isinstance(message, str):
         message = message.encode()
         compress = zlib.compressobj(wbits=-zlib.MAX_WBITS)
         deflated = compress.compress(message)
@@ -7,6 +7,7 @@ from hummingbot.connector.utils import TimeSynchronizerRESTPreProcessor
 from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
 from hummingbot.core.web_assistant.auth import AuthBase
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod
+from hummingbot.core.web_assistant.connections.ws_frame_decompressor import WSFrameDecompressor
 from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
 
 
@@ -36,6 +37,7 @@ def build_api_factory(
     api_factory = WebAssistantsFactory(
         throttler=throttler,
         auth=auth,
+        ws_frame_decompressor=WSFrameDecompressor(encoding="deflate"),
         rest_pre_processors=[
             TimeSynchronizerRESTPreProcessor(synchronizer=time_synchronizer, time_provider=time_provider),
         ])
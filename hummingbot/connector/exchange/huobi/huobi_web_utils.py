@@ -2,10 +2,11 @@ from typing import Callable, Optional
 
 import hummingbot.connector.exchange.huobi.huobi_constants as CONSTANTS
 from hummingbot.connector.time_synchronizer import TimeSynchronizer
-from hummingbot.connector.utils import GZipCompressionWSPostProcessor, TimeSynchronizerRESTPreProcessor
+from hummingbot.connector.utils import TimeSynchronizerRESTPreProcessor
 from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
 from hummingbot.core.web_assistant.auth import AuthBase
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod
+from hummingbot.core.web_assistant.connections.ws_frame_decompressor import WSFrameDecompressor
 from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
 
 
@@ -31,7 +32,8 @@ def build_api_factory(throttler: Optional[AsyncThrottler] = None,
     api_factory = WebAssistantsFactory(
         throttler=throttler,
         auth=auth,
-        ws_post_processors=[GZipCompressionWSPostProcessor()],
+        # The market streams send their messages compressed with gzip, the account and order streams do not
+        ws_frame_decompressor=WSFrameDecompressor(encoding="gzip"),
         rest_pre_processors=[
             TimeSynchronizerRESTPreProcessor(synchronizer=time_synchronizer, time_provider=time_provider),
         ])
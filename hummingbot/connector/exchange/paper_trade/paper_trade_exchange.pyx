@@ -320,6 +320,18 @@ cdef class PaperTradeExchange(ExchangeBase):
         self.c_process_market_orders()
         self.c_process_crossed_limit_orders()
 
+    cdef double c_next_event_timestamp(self, double timestamp):
+        # Resting limit orders have to be checked against the order books on every tick, while queued market orders
+        # only need the tick at which they are executed
+        cdef:
+            QueuedOrder front_order
+        if not self._bid_limit_orders.empty() or not self._ask_limit_orders.empty():
+            return timestamp
+        if len(self._queued_orders) > 0:
+            front_order = self._queued_orders[0]
+            return front_order.create_timestamp + self.TRADE_EXECUTION_DELAY
+        return math.inf
+
     cdef str c_buy(self,
                    str trading_pair_str,
                    object amount,
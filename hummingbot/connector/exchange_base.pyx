@@ -1,7 +1,8 @@
 import asyncio
 from decimal import Decimal
-from typing import Dict, List, Iterator, Mapping, Optional, TYPE_CHECKING
+from typing import Dict, List, Iterable, Iterator, Mapping, Optional, TYPE_CHECKING
 
+import numpy as np
 from bidict import bidict
 
 from hummingbot.connector.budget_checker import BudgetChecker
@@ -9,7 +10,11 @@ from hummingbot.connector.connector_base import ConnectorBase
 from hummingbot.core.data_type.common import OrderType, PriceType, TradeType
 from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.data_type.order_book import OrderBook
-from hummingbot.core.data_type.order_book_query_result import ClientOrderBookQueryResult, OrderBookQueryResult
+from hummingbot.core.data_type.order_book_query_result import (
+    ClientOrderBookQueryResult,
+    OrderBookQueryResult,
+    OrderBookVolumesQueryResult,
+)
 from hummingbot.core.data_type.order_book_row import ClientOrderBookRow
 from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
 from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee
@@ -60,6 +65,13 @@ cdef class ExchangeBase(ConnectorBase):
     def order_book_tracker(self) -> Optional[OrderBookTracker]:
         return self._order_book_tracker
 
+    def is_order_book_ready(self, trading_pair: str) -> bool:
+        """
+        Tells if the order book of the trading pair is initialized, even if the books of other trading pairs are not
+        yet.
+        """
+        return self._order_book_tracker is not None and self._order_book_tracker.is_order_book_ready(trading_pair)
+
     async def trading_pair_symbol_map(self):
         if not self.trading_pair_symbol_map_ready():
             async with self._mapping_initialization_lock:
@@ -255,6 +267,22 @@ cdef class ExchangeBase(ConnectorBase):
     def get_vwap_for_volume(self, trading_pair: str, is_buy: bool, volume: Decimal):
         return self.c_get_vwap_for_volume(trading_pair, is_buy, volume)
 
+    def get_vwap_for_volumes(self, trading_pair: str, is_buy: bool, volumes: Iterable) -> OrderBookVolumesQueryResult:
+        """
+        Queries the order book for several volumes with a single walk from the top of book.
+        Unlike the single volume queries the results are float64 NumPy arrays, one value per queried volume.
+
+        :param trading_pair: the trading pair of the order book to query
+        :param is_buy: True to query the ask side, False to query the bid side
+        :param volumes: the base volumes to query (NumPy array or any iterable of numbers)
+        :return: the price of the level that fills each volume, the VWAP to fill it and the volume that can be filled
+        """
+        cdef:
+            OrderBook order_book = self.c_get_order_book(trading_pair)
+        if not isinstance(volumes, np.ndarray):
+            volumes = np.fromiter((float(volume) for volume in volumes), dtype=np.float64)
+        return order_book.get_vwap_for_volumes(is_buy, volumes)
+
     def get_price_for_quote_volume(self, trading_pair: str, is_buy: bool, volume: Decimal):
         return self.c_get_price_for_quote_volume(trading_pair, is_buy, volume)
 
@@ -15,7 +15,9 @@ from hummingbot.connector.time_synchronizer import TimeSynchronizer
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.connector.utils import get_new_client_order_id
 from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
-from hummingbot.core.api_throttler.data_types import RateLimit
+from hummingbot.core.api_throttler.async_throttler_base import request_priority
+from hummingbot.core.api_throttler.data_types import RateLimit, RequestPriority
+from hummingbot.core.api_throttler.shared_rate_limit_budget import SharedRateLimitBudget
 from hummingbot.core.data_type.cancellation_result import CancellationResult
 from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState, OrderUpdate, TradeUpdate
@@ -70,13 +72,18 @@ class ExchangePyBase(ExchangeBase, ABC):
         # init Auth and Api factory
         self._auth: AuthBase = self.authenticator
         self._web_assistants_factory: WebAssistantsFactory = self._create_web_assistants_factory()
+        self._web_assistants_factory.set_http_client_config(
+            client_config_map.http_client.build_http_client_config())
 
         # init OrderBook Data Source and Tracker
         self._orderbook_ds: OrderBookTrackerDataSource = self._create_order_book_data_source()
         self._set_order_book_tracker(OrderBookTracker(
             data_source=self._orderbook_ds,
             trading_pairs=self.trading_pairs,
-            domain=self.domain))
+            domain=self.domain,
+            parallel_init=self.is_order_book_parallel_init_enabled,
+            direct_diff_dispatch=self.is_order_book_direct_diff_dispatch_enabled,
+            resync_on_gap=self.is_order_book_resync_on_gap_enabled))
 
         # init UserStream Data Source and Tracker
         self._user_stream_tracker = self._create_user_stream_tracker()
@@ -149,6 +156,31 @@ class ExchangePyBase(ExchangeBase, ABC):
     def is_trading_required(self) -> bool:
         raise NotImplementedError
 
+    @property
+    def is_order_book_parallel_init_enabled(self) -> bool:
+        """
+        Connectors whose order book data source requests the snapshots through the connector throttler can override
+        this to initialize the order books in parallel
+        """
+        return False
+
+    @property
+    def is_order_book_direct_diff_dispatch_enabled(self) -> bool:
+        """
+        Connectors whose order book data source writes the diffs to the output queue given to
+        `listen_for_order_book_diffs` can override this to have the diffs dispatched straight to their order book
+        """
+        return False
+
+    @property
+    def is_order_book_resync_on_gap_enabled(self) -> bool:
+        """
+        Connectors can override this to request a new snapshot of an order book when diffs are missing. The gaps are
+        detected by the order book data source `is_sequence_gap`, which has to match the way the exchange sequences
+        its diffs
+        """
+        return False
+
     @property
     def order_books(self) -> Dict[str, OrderBook]:
         return self.order_book_tracker.order_books
@@ -466,15 +498,16 @@ class ExchangePyBase(ExchangeBase, ABC):
             )
 
     async def _place_order_and_process_update(self, order: InFlightOrder, **kwargs) -> str:
-        exchange_order_id, update_timestamp = await self._place_order(
-            order_id=order.client_order_id,
-            trading_pair=order.trading_pair,
-            amount=order.amount,
-            trade_type=order.trade_type,
-            order_type=order.order_type,
-            price=order.price,
-            **kwargs,
-        )
+        with request_priority(RequestPriority.CREATE):
+            exchange_order_id, update_timestamp = await self._place_order(
+                order_id=order.client_order_id,
+                trading_pair=order.trading_pair,
+                amount=order.amount,
+                trade_type=order.trade_type,
+                order_type=order.order_type,
+                price=order.price,
+                **kwargs,
+            )
 
         order_update: OrderUpdate = OrderUpdate(
             client_order_id=order.client_order_id,
@@ -537,7 +570,8 @@ class ExchangePyBase(ExchangeBase, ABC):
                 self.logger().error(f"Failed to cancel order {order.client_order_id}", exc_info=True)
 
     async def _execute_order_cancel_and_process_update(self, order: InFlightOrder) -> bool:
-        cancelled = await self._place_cancel(order.client_order_id, order)
+        with request_priority(RequestPriority.CANCEL):
+            cancelled = await self._place_cancel(order.client_order_id, order)
         if cancelled:
             update_timestamp = self.current_timestamp
             if update_timestamp is None or math.isnan(update_timestamp):
@@ -666,7 +700,11 @@ class ExchangePyBase(ExchangeBase, ABC):
         - The background task to process the events received through the user stream tracker (websocket connection)
         """
         self._stop_network()
+        if self._client_config.rate_limits_shared_budget:
+            self._throttler.set_shared_budget(SharedRateLimitBudget(budget_id=self.name))
         self.order_book_tracker.start()
+        if self._web_assistants_factory.http_client_config.warm_connections > 0:
+            safe_ensure_future(self._warm_up_connections())
         if self.is_trading_required:
             self._trading_rules_polling_task = safe_ensure_future(self._trading_rules_polling_loop())
             self._trading_fees_polling_task = safe_ensure_future(self._trading_fees_polling_loop())
@@ -681,6 +719,7 @@ class ExchangePyBase(ExchangeBase, ABC):
         tasks that require the connection with the exchange to work.
         """
         self._stop_network()
+        self._throttler.set_shared_budget(None)
 
     async def check_network(self) -> NetworkStatus:
         """
@@ -729,7 +768,8 @@ class ExchangePyBase(ExchangeBase, ABC):
         """
         while True:
             try:
-                await safe_gather(self._update_trading_rules())
+                with request_priority(RequestPriority.HOUSEKEEPING):
+                    await safe_gather(self._update_trading_rules())
                 await self._sleep(self.TRADING_RULES_INTERVAL)
             except NotImplementedError:
                 raise
@@ -749,7 +789,8 @@ class ExchangePyBase(ExchangeBase, ABC):
         """
         while True:
             try:
-                await safe_gather(self._update_trading_fees())
+                with request_priority(RequestPriority.HOUSEKEEPING):
+                    await safe_gather(self._update_trading_fees())
                 await self._sleep(self.TRADING_FEES_INTERVAL)
             except NotImplementedError:
                 raise
@@ -934,7 +975,8 @@ class ExchangePyBase(ExchangeBase, ABC):
         )
 
     async def _update_all_balances(self):
-        await self._update_balances()
+        with request_priority(RequestPriority.HOUSEKEEPING):
+            await self._update_balances()
         if not self.real_time_balance_update:
             # This is only required for exchanges that do not provide balance update notifications through websocket
             self._in_flight_orders_snapshot = {k: copy.copy(v) for k, v in self.in_flight_orders.items()}
@@ -943,7 +985,8 @@ class ExchangePyBase(ExchangeBase, ABC):
     async def _update_orders_fills(self, orders: List[InFlightOrder]):
         for order in orders:
             try:
-                trade_updates = await self._all_trade_updates_for_order(order=order)
+                with request_priority(RequestPriority.ORDER_STATUS):
+                    trade_updates = await self._all_trade_updates_for_order(order=order)
                 for trade_update in trade_updates:
                     self._order_tracker.process_trade_update(trade_update)
             except asyncio.CancelledError:
@@ -983,7 +1026,8 @@ class ExchangePyBase(ExchangeBase, ABC):
     async def _update_orders_with_error_handler(self, orders: List[InFlightOrder], error_handler: Callable):
         for order in orders:
             try:
-                order_update = await self._request_order_status(tracked_order=order)
+                with request_priority(RequestPriority.ORDER_STATUS):
+                    order_update = await self._request_order_status(tracked_order=order)
                 self._order_tracker.process_order_update(order_update)
             except asyncio.CancelledError:
                 raise
@@ -1069,6 +1113,21 @@ class ExchangePyBase(ExchangeBase, ABC):
     async def _make_network_check_request(self):
         await self._api_get(path_url=self.check_network_request_path)
 
+    async def _warm_up_connections(self):
+        """
+        Opens the configured number of HTTP connections in advance with concurrent network check requests, so the
+        first orders reuse them instead of paying the connection and TLS handshake latency
+        """
+        warm_connections = self._web_assistants_factory.http_client_config.warm_connections
+        with request_priority(RequestPriority.HOUSEKEEPING):
+            results = await safe_gather(
+                *[self._make_network_check_request() for _ in range(warm_connections)],
+                return_exceptions=True)
+        failures = [result for result in results if isinstance(result, Exception)]
+        if len(failures) > 0:
+            self.logger().debug(f"Could not warm up {len(failures)} of {warm_connections} connections "
+                                f"({failures[0]}).")
+
     async def _make_trading_rules_request(self) -> Any:
         exchange_info = await self._api_get(path_url=self.trading_rules_request_path)
         return exchange_info
@@ -2,10 +2,10 @@ import asyncio
 import logging
 import time
 from abc import ABC, abstractmethod
-from decimal import Decimal
-from typing import List, Tuple
+from typing import List, Optional, Set, Tuple
 
-from hummingbot.core.api_throttler.data_types import RateLimit, TaskLog
+from hummingbot.core.api_throttler.data_types import DEFAULT_PRIORITY, RateLimit, RequestPriority, TaskLog, TaskLogs
+from hummingbot.core.network_metrics import NetworkMetrics
 from hummingbot.logger.logger import HummingbotLogger
 
 arc_logger = None
@@ -28,12 +28,14 @@ class AsyncRequestContextBase(ABC):
         return arc_logger
 
     def __init__(self,
-                 task_logs: List[TaskLog],
+                 task_logs: TaskLogs,
                  rate_limit: RateLimit,
                  related_limits: List[Tuple[RateLimit, int]],
                  lock: asyncio.Lock,
                  safety_margin_pct: float,
                  retry_interval: float = 0.1,
+                 priority: RequestPriority = DEFAULT_PRIORITY,
+                 waiting_requests: Optional[Set["AsyncRequestContextBase"]] = None,
                  ):
         """
         Asynchronous context associated with each API request.
@@ -42,38 +44,57 @@ class AsyncRequestContextBase(ABC):
         :param related_limits: List of linked rate limits with its corresponding weight associated with this API Request
         :param lock: A shared asyncio.Lock used between all instances of APIRequestContextBase
         :param retry_interval: Time between each limit check
+        :param priority: The priority class of the API request
+        :param waiting_requests: Shared set of the requests waiting for capacity. A request does not take capacity
+            while a request with higher priority is waiting for any of its rate limits
         """
-        self._task_logs: List[TaskLog] = task_logs
+        self._task_logs: TaskLogs = task_logs
         self._rate_limit: RateLimit = rate_limit
         self._related_limits: List[Tuple[RateLimit, int]] = related_limits
         self._lock: asyncio.Lock = lock
         self._safety_margin_pct: float = safety_margin_pct
         self._retry_interval: float = retry_interval
+        self._priority: RequestPriority = priority
+        self._waiting_requests: Set[AsyncRequestContextBase] = waiting_requests if waiting_requests is not None else set()
+        self._limit_ids: Set[str] = {limit.limit_id for limit, _ in related_limits}
+        if rate_limit is not None:
+            self._limit_ids.add(rate_limit.limit_id)
+
+    @property
+    def priority(self) -> RequestPriority:
+        return self._priority
 
     def flush(self):
         """
         Remove task logs that have passed rate limit periods
         :return:
         """
-        now: Decimal = Decimal(str(time.time()))
-        for task in self._task_logs:
-            task_limit: RateLimit = task.rate_limit
-            elapsed: Decimal = now - Decimal(str(task.timestamp))
-            if elapsed > Decimal(str(task_limit.time_interval * (1 + self._safety_margin_pct))):
-                self._task_logs.remove(task)
+        self._task_logs.flush(now=time.time(), safety_margin_pct=self._safety_margin_pct)
 
     @abstractmethod
     def within_capacity(self) -> bool:
         raise NotImplementedError
 
+    def yields_to_higher_priority(self) -> bool:
+        """
+        :return: True if a request with higher priority is waiting for capacity on any of this request's rate limits
+        """
+        return any(request.priority < self._priority and not self._limit_ids.isdisjoint(request._limit_ids)
+                   for request in self._waiting_requests)
+
     async def acquire(self):
-        while True:
-            async with self._lock:
-                self.flush()
+        wait_start = time.perf_counter()
+        self._waiting_requests.add(self)
+        try:
+            while True:
+                async with self._lock:
+                    self.flush()
 
-                if self.within_capacity():
-                    break
-            await asyncio.sleep(self._retry_interval)
+                    if not self.yields_to_higher_priority() and self.within_capacity():
+                        break
+                await asyncio.sleep(self._retry_interval)
+        finally:
+            self._waiting_requests.discard(self)
         async with self._lock:
             now = time.time()
             # Each related limit is represented as it own individual TaskLog
@@ -87,6 +108,10 @@ class AsyncRequestContextBase(ABC):
             for limit, weight in self._related_limits:
                 self._task_logs.append(TaskLog(timestamp=now, rate_limit=limit, weight=weight))
 
+        if self._rate_limit is not None:
+            NetworkMetrics.get_instance().record_throttle_wait(limit_id=self._rate_limit.limit_id,
+                                                               duration=time.perf_counter() - wait_start)
+
     async def __aenter__(self):
         await self.acquire()
 
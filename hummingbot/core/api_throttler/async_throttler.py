@@ -1,13 +1,12 @@
 import time
-from decimal import Decimal
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 from hummingbot.core.api_throttler.async_request_context_base import (
     MAX_CAPACITY_REACHED_WARNING_INTERVAL,
     AsyncRequestContextBase,
 )
 from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
-from hummingbot.core.api_throttler.data_types import RateLimit
+from hummingbot.core.api_throttler.data_types import RateLimit, RequestPriority
 
 
 class AsyncRequestContext(AsyncRequestContextBase):
@@ -27,10 +26,9 @@ class AsyncRequestContext(AsyncRequestContextBase):
                                                             self._rate_limit.weight)] + self._related_limits
             now: float = self._time()
             for rate_limit, weight in list_of_limits:
-                capacity_used: int = sum([task.weight
-                                          for task in self._task_logs
-                                          if rate_limit.limit_id == task.rate_limit.limit_id and
-                                          Decimal(str(now)) - Decimal(str(task.timestamp)) - Decimal(str(task.rate_limit.time_interval * self._safety_margin_pct)) <= task.rate_limit.time_interval])
+                capacity_used: int = self._task_logs.capacity_used(limit_id=rate_limit.limit_id,
+                                                                   now=now,
+                                                                   safety_margin_pct=self._safety_margin_pct)
 
                 if capacity_used + weight > rate_limit.limit:
                     if self._last_max_cap_warning_ts < now - MAX_CAPACITY_REACHED_WARNING_INTERVAL:
@@ -51,7 +49,8 @@ class AsyncThrottler(AsyncThrottlerBase):
     """
     Handles call rate limits by providing async context (async with), it delays as needed to make sure calls stay
     within defined limits.
-    A task can have multiple call rates (weight), though tasks are still ordered in sequence as they come (FIFO).
+    A task can have multiple call rates (weight), though tasks are still ordered in sequence as they come (FIFO), except
+    that waiting tasks with a higher priority (see RequestPriority) get the freed capacity of their limits first.
     (i.e)
         Pool 0 - rate limit is 100 calls per second
         Pool 1 - rate limit is 10 calls per second
@@ -59,11 +58,13 @@ class AsyncThrottler(AsyncThrottlerBase):
         this (whether it belongs to Pool 0 or Pool 1) will have to wait for new capacity (some of the Task A flushed out).
     """
 
-    def execute_task(self, limit_id: str) -> AsyncRequestContext:
+    def execute_task(self, limit_id: str, priority: Optional[RequestPriority] = None) -> AsyncRequestContext:
         """
         Creates an async context where code within the context (a task) can be run only when all rate
         limits have capacity for the new task.
         :param limit_id: the limit_id associated with the APi request
+        :param priority: the priority class of the API request. If not provided, the priority assigned to the current
+            context with request_priority() is used
         :return: An async context (used with async with syntax)
         """
         rate_limit, related_rate_limits = self.get_related_limits(limit_id=limit_id)
@@ -74,4 +75,6 @@ class AsyncThrottler(AsyncThrottlerBase):
             lock=self._lock,
             safety_margin_pct=self._safety_margin_pct,
             retry_interval=self._retry_interval,
+            priority=self.get_request_priority(priority),
+            waiting_requests=self._waiting_requests,
         )
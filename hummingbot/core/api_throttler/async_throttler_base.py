@@ -3,13 +3,36 @@ import copy
 import logging
 import math
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from contextvars import ContextVar
 from decimal import Decimal
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 
 from hummingbot.core.api_throttler.async_request_context_base import AsyncRequestContextBase
-from hummingbot.core.api_throttler.data_types import RateLimit, TaskLog
+from hummingbot.core.api_throttler.data_types import DEFAULT_PRIORITY, RateLimit, RequestPriority, TaskLogs
+from hummingbot.core.api_throttler.shared_rate_limit_budget import SharedRateLimitBudget
+from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.logger.logger import HummingbotLogger
 
+# Priority of the requests executed in the current context, when it is not passed to execute_task
+_request_priority: ContextVar[Optional[RequestPriority]] = ContextVar("throttler_request_priority", default=None)
+
+
+@contextmanager
+def request_priority(priority: RequestPriority):
+    """
+    Assigns a priority to all the throttled requests executed within the context (including the ones executed by tasks
+    created within it), so callers can prioritize requests made by connector specific code.
+    (i.e.)
+        with request_priority(RequestPriority.CANCEL):
+            await self._place_cancel(order_id, tracked_order)
+    """
+    token = _request_priority.set(priority)
+    try:
+        yield
+    finally:
+        _request_priority.reset(token)
+
 
 class AsyncThrottlerBase(ABC):
     """
@@ -42,11 +65,17 @@ class AsyncThrottlerBase(ABC):
         # If configured, users can define the percentage of rate limits to allocate to the throttler.
         share_percentage = limits_share_percentage or self._client_config_map().rate_limits_share_pct
         self.limits_pct: Decimal = share_percentage / 100
+        self._configured_limits_pct: Decimal = self.limits_pct
+
+        # Optional budget shared with the throttlers of other processes, that reduces limits_pct to this process part
+        self._shared_budget: Optional[SharedRateLimitBudget] = None
+        self._shared_budget_participants: int = 1
+        self._shared_budget_task: Optional[asyncio.Task] = None
 
         self.set_rate_limits(rate_limits)
 
-        # List of TaskLog used to determine the API requests within a set time window.
-        self._task_logs: List[TaskLog] = []
+        # TaskLogs used to determine the API requests within a set time window.
+        self._task_logs: TaskLogs = TaskLogs()
 
         # Throttler Parameters
         self._retry_interval: float = retry_interval
@@ -55,8 +84,12 @@ class AsyncThrottlerBase(ABC):
         # Shared asyncio.Lock instance to prevent multiple async ContextManager from accessing the _task_logs variable
         self._lock = asyncio.Lock()
 
+        # Requests waiting for capacity, used to give the freed capacity to the requests with higher priority first
+        self._waiting_requests: Set[AsyncRequestContextBase] = set()
+
     def set_rate_limits(self, rate_limits: List[RateLimit]):
         # Rate Limit Definitions
+        self._rate_limit_definitions: List[RateLimit] = copy.deepcopy(rate_limits)
         self._rate_limits: List[RateLimit] = copy.deepcopy(rate_limits)
 
         for rate_limit in self._rate_limits:
@@ -65,6 +98,66 @@ class AsyncThrottlerBase(ABC):
         # Dictionary of path_url to RateLimit
         self._id_to_limit_map: Dict[str, RateLimit] = {limit.limit_id: limit for limit in self._rate_limits}
 
+    def set_shared_budget(self, shared_budget: Optional[SharedRateLimitBudget]):
+        """
+        Starts sharing the rate limits with the throttlers of other processes using the same budget, or stops sharing
+        them if the budget is None.
+        When called with a running event loop, a background task sends the heartbeats and updates the participants
+        count every heartbeat interval, running the file operations in the default executor. This keeps the heartbeat
+        alive while the bot sends no requests, and keeps the file IO out of execute_task.
+        """
+        if self._shared_budget_task is not None:
+            self._shared_budget_task.cancel()
+            self._shared_budget_task = None
+        if self._shared_budget is not None:
+            self._shared_budget.unregister()
+        self._shared_budget = shared_budget
+        participants = 1
+        if shared_budget is not None:
+            shared_budget.register()
+            participants = shared_budget.participants_count
+            try:
+                asyncio.get_running_loop()
+                self._shared_budget_task = safe_ensure_future(self._shared_budget_refresh_loop(shared_budget))
+            except RuntimeError:
+                # No running event loop, the participants count is only updated by update_shared_budget_share
+                pass
+        self.update_shared_budget_share(participants)
+
+    def update_shared_budget_share(self, participants: int):
+        """
+        Adjusts the rate limits to this throttler part of the shared budget, if the number of participants changed
+
+        :param participants: the number of participants sharing the budget, including this throttler
+        """
+        if participants != self._shared_budget_participants:
+            self.logger().info(f"Using 1/{participants} of the rate limits shared with other bot processes.")
+            self._shared_budget_participants = participants
+            self.limits_pct = self._configured_limits_pct / participants
+            self.set_rate_limits(self._rate_limit_definitions)
+
+    async def _shared_budget_refresh_loop(self, shared_budget: SharedRateLimitBudget):
+        loop = asyncio.get_running_loop()
+        while True:
+            try:
+                await self._sleep(shared_budget.heartbeat_interval)
+                participants = await loop.run_in_executor(None, shared_budget.refresh, True)
+                self.update_shared_budget_share(participants)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().network(
+                    "Unexpected error updating the shared rate limits budget.",
+                    exc_info=True,
+                    app_warning_msg="Could not update the shared rate limits budget.",
+                )
+
+    async def _sleep(self, delay: float):
+        """
+        Method created to enable tests to prevent processes from sleeping
+        """
+        await asyncio.sleep(delay)
+
     def _client_config_map(self):
         from hummingbot.client.hummingbot_application import HummingbotApplication  # avoids circular import
 
@@ -84,6 +177,14 @@ class AsyncThrottlerBase(ABC):
 #
         return rate_limit, related_limits
 
+    def get_request_priority(self, priority: Optional[RequestPriority] = None) -> RequestPriority:
+        """
+        :return: the given priority, or the one assigned with request_priority() to the current context, or the default
+        """
+        if priority is None:
+            priority = _request_priority.get()
+        return priority if priority is not None else DEFAULT_PRIORITY
+
     @abstractmethod
-    def execute_task(self, limit_id: str) -> AsyncRequestContextBase:
+    def execute_task(self, limit_id: str, priority: Optional[RequestPriority] = None) -> AsyncRequestContextBase:
         raise NotImplementedError
@@ -1,5 +1,11 @@
+from collections import deque
 from dataclasses import dataclass
+from enum import IntEnum
 from typing import (
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
     List,
     Optional,
 )
@@ -49,8 +55,98 @@ class RateLimit:
                f"weight: {self.weight}, linked_limits: {self.linked_limits}"
 
 
+class RequestPriority(IntEnum):
+    """
+    Priority classes of the throttled requests. When a rate limit is at capacity, the waiting requests with the lowest
+    value get the freed capacity first.
+    """
+    CANCEL = 0
+    CREATE = 1
+    ORDER_STATUS = 2
+    MARKET_DATA = 3
+    HOUSEKEEPING = 4
+
+
+DEFAULT_PRIORITY = RequestPriority.MARKET_DATA
+
+
 @dataclass
 class TaskLog:
     timestamp: float
     rate_limit: RateLimit
     weight: int
+
+
+class TaskLogs:
+    """
+    Logged tasks indexed by rate limit id. The tasks of each rate limit form a sliding window ordered by timestamp,
+    with its used capacity kept as a running sum, so that expiring old tasks and checking the used capacity of a limit
+    are O(1) amortized instead of going through all the logged tasks.
+    Tasks are expected to be appended in timestamp order.
+    """
+
+    def __init__(self, task_logs: Optional[Iterable[TaskLog]] = None):
+        self._windows: Dict[str, Deque[TaskLog]] = {}
+        self._used_capacity: Dict[str, int] = {}
+        for task_log in task_logs or []:
+            self.append(task_log)
+
+    def __len__(self) -> int:
+        return sum(len(window) for window in self._windows.values())
+
+    def __iter__(self) -> Iterator[TaskLog]:
+        for window in list(self._windows.values()):
+            yield from window
+
+    def append(self, task_log: TaskLog):
+        limit_id = task_log.rate_limit.limit_id
+        window = self._windows.get(limit_id)
+        if window is None:
+            window = deque()
+            self._windows[limit_id] = window
+            self._used_capacity[limit_id] = 0
+        window.append(task_log)
+        self._used_capacity[limit_id] += task_log.weight
+
+    def remove(self, task_log: TaskLog):
+        limit_id = task_log.rate_limit.limit_id
+        self._windows[limit_id].remove(task_log)
+        self._used_capacity[limit_id] -= task_log.weight
+        if len(self._windows[limit_id]) == 0:
+            del self._windows[limit_id]
+            del self._used_capacity[limit_id]
+
+    def clear(self):
+        self._windows.clear()
+        self._used_capacity.clear()
+
+    def capacity_used(self, limit_id: str, now: float, safety_margin_pct: float) -> int:
+        """
+        :return: the total weight of the tasks logged for the rate limit within its time interval (extended by the
+            safety margin) as of `now`
+        """
+        self._expire(limit_id, now, safety_margin_pct)
+        return self._used_capacity.get(limit_id, 0)
+
+    def flush(self, now: float, safety_margin_pct: float):
+        """
+        Removes the tasks that have passed their rate limit time interval (extended by the safety margin)
+        """
+        for limit_id in list(self._windows):
+            self._expire(limit_id, now, safety_margin_pct)
+
+    def _expire(self, limit_id: str, now: float, safety_margin_pct: float):
+        window = self._windows.get(limit_id)
+        if window is None:
+            return
+        while len(window) > 0:
+            task_log = window[0]
+            # Compared in microseconds to avoid float rounding errors at the edge of the time interval
+            if (round((now - task_log.timestamp) * 1e6)
+                    <= round(task_log.rate_limit.time_interval * (1 + safety_margin_pct) * 1e6)):
+                break
+            window.popleft()
+            self._used_capacity[limit_id] -= task_log.weight
+        if len(window) == 0:
+            del self._windows[limit_id]
+            del self._used_capacity[limit_id]
@@ -0,0 +1,117 @@
+import logging
+import os
+import tempfile
+import time
+from typing import Optional
+
+from hummingbot.logger.logger import HummingbotLogger
+
+BUDGETS_DIRECTORY_NAME = "hummingbot_rate_limit_budgets"
+
+
+class SharedRateLimitBudget:
+    """
+    Splits the rate limits of an exchange between the bot processes that run on the same host.
+    Each throttler using the budget keeps a heartbeat file in a directory shared by all the processes, and uses an
+    equal part of the limits for each live participant. Participants that stop sending heartbeats (e.g. a killed
+    process) are ignored after a few heartbeat intervals.
+    """
+
+    _logger: Optional[HummingbotLogger] = None
+
+    HEARTBEAT_INTERVAL = 5.0
+    # Number of heartbeat intervals without heartbeats after which a participant is considered gone
+    STALE_HEARTBEATS = 3
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self,
+                 budget_id: str,
+                 directory: Optional[str] = None,
+                 heartbeat_interval: float = HEARTBEAT_INTERVAL):
+        """
+        :param budget_id: identifier of the shared budget (i.e. the exchange name), all the throttlers with the same
+            budget id split the limits
+        :param directory: directory for the heartbeat files. Defaults to a directory in the system temporary folder
+        :param heartbeat_interval: time in seconds between heartbeats, and between updates of the participants count
+        """
+        self._budget_id = budget_id
+        self._directory = directory or os.path.join(tempfile.gettempdir(), BUDGETS_DIRECTORY_NAME, budget_id)
+        self._heartbeat_interval = heartbeat_interval
+        self._participant_id = f"{os.getpid()}-{id(self):x}"
+        self._heartbeat_path = os.path.join(self._directory, self._participant_id)
+        self._last_refresh_timestamp = 0.0
+        self._participants_count = 1
+        self._registered = False
+
+    @property
+    def budget_id(self) -> str:
+        return self._budget_id
+
+    @property
+    def heartbeat_interval(self) -> float:
+        return self._heartbeat_interval
+
+    @property
+    def participants_count(self) -> int:
+        return self._participants_count
+
+    def register(self):
+        os.makedirs(self._directory, exist_ok=True)
+        self._registered = True
+        self.refresh(force=True)
+
+    def unregister(self):
+        self._registered = False
+        try:
+            os.remove(self._heartbeat_path)
+        except FileNotFoundError:
+            pass
+        self._participants_count = 1
+
+    def refresh(self, force: bool = False) -> int:
+        """
+        Sends a heartbeat and updates the number of live participants, at most once per heartbeat interval unless
+        forced. Does nothing once the budget is unregistered, so a refresh running in an executor thread does not
+        recreate the heartbeat file removed by unregister.
+
+        :return: the number of participants sharing the budget, including this one
+        """
+        now = self._time()
+        if not self._registered:
+            return self._participants_count
+        if force or now - self._last_refresh_timestamp >= self._heartbeat_interval:
+            self._last_refresh_timestamp = now
+            try:
+                self._send_heartbeat()
+                self._participants_count = self._count_live_participants(now=now)
+            except OSError:
+                self.logger().warning(f"Could not update the shared rate limits budget {self._budget_id}.",
+                                      exc_info=True)
+        return self._participants_count
+
+    def _send_heartbeat(self):
+        with open(self._heartbeat_path, "a"):
+            os.utime(self._heartbeat_path)
+
+    def _count_live_participants(self, now: float) -> int:
+        stale_threshold = now - self._heartbeat_interval * self.STALE_HEARTBEATS
+        participants_count = 0
+        for participant_id in os.listdir(self._directory):
+            path = os.path.join(self._directory, participant_id)
+            try:
+                if participant_id == self._participant_id or os.path.getmtime(path) >= stale_threshold:
+                    participants_count += 1
+                else:
+                    os.remove(path)
+            except FileNotFoundError:
+                # Removed by another participant
+                pass
+        return max(1, participants_count)
+
+    def _time(self) -> float:
+        return time.time()
@@ -10,3 +10,11 @@ cdef class Clock:
         list _current_context
         double _current_tick
         bint _started
+        bint _fast_forward
+        dict _tick_stats
+        int _tick_overruns
+        double _last_overrun_log_time
+
+    cdef c_record_iterator_tick(self, object iterator, double duration)
+    cdef c_record_tick(self, double duration, object slowest_iterator)
+    cdef double c_next_backtest_tick(self, double timestamp)
@@ -3,14 +3,30 @@
 import asyncio
 import logging
 import time
-from typing import List
+from typing import Dict, List
+
+from libc.math cimport ceil, INFINITY, isinf, isnan
 
 from hummingbot.core.time_iterator import TimeIterator
 from hummingbot.core.time_iterator cimport TimeIterator
 from hummingbot.core.clock_mode import ClockMode
+from hummingbot.core.tick_timing_stats import TickTimingStats
 from hummingbot.logger import HummingbotLogger
 
 s_logger = None
+# Fraction of the clock tick size an iterator can be ticked before its next tick time, to absorb rounding errors
+cdef double TICK_TOLERANCE = 1e-3
+# Minimum wall time in seconds between two tick overrun warnings
+cdef double OVERRUN_LOG_INTERVAL = 60.0
+
+
+cdef inline bint is_tick_due(TimeIterator iterator, double timestamp, double tolerance):
+    if iterator._tick_interval == 0:
+        return True
+    if isinf(iterator._tick_interval) or timestamp < iterator._next_tick_timestamp - tolerance:
+        return False
+    iterator._next_tick_timestamp = timestamp + iterator._tick_interval
+    return True
 
 
 cdef class Clock:
@@ -21,12 +37,19 @@ cdef class Clock:
             s_logger = logging.getLogger(__name__)
         return s_logger
 
-    def __init__(self, clock_mode: ClockMode, tick_size: float = 1.0, start_time: float = 0.0, end_time: float = 0.0):
+    def __init__(self,
+                 clock_mode: ClockMode,
+                 tick_size: float = 1.0,
+                 start_time: float = 0.0,
+                 end_time: float = 0.0,
+                 fast_forward: bool = False):
         """
         :param clock_mode: either real time mode or back testing mode
         :param tick_size: time interval of each tick
         :param start_time: (back testing mode only) start of simulation in UNIX timestamp
         :param end_time: (back testing mode only) end of simulation in UNIX timestamp. NaN to simulate to end of data.
+        :param fast_forward: (back testing mode only) jump directly to the next tick at which a child iterator has
+        something to do, as reported by its next_event_timestamp(), instead of running every tick
         """
         self._clock_mode = clock_mode
         self._tick_size = tick_size
@@ -36,6 +59,10 @@ cdef class Clock:
         self._child_iterators = []
         self._current_context = None
         self._started = False
+        self._fast_forward = fast_forward
+        self._tick_stats = {}
+        self._tick_overruns = 0
+        self._last_overrun_log_time = 0
 
     @property
     def clock_mode(self) -> ClockMode:
@@ -57,6 +84,50 @@ cdef class Clock:
     def current_timestamp(self) -> float:
         return self._current_tick
 
+    @property
+    def fast_forward(self) -> bool:
+        return self._fast_forward
+
+    @property
+    def tick_overruns(self) -> int:
+        """
+        Number of real time ticks that took longer than the tick size to run through all the child iterators
+        """
+        return self._tick_overruns
+
+    @property
+    def tick_stats(self) -> Dict[TimeIterator, TickTimingStats]:
+        """
+        Tick timing statistics of each child iterator (real time mode only)
+        """
+        return self._tick_stats
+
+    def reset_tick_stats(self):
+        self._tick_stats.clear()
+        self._tick_overruns = 0
+
+    cdef c_record_iterator_tick(self, object iterator, double duration):
+        stats = self._tick_stats.get(iterator)
+        if stats is None:
+            stats = TickTimingStats(name=getattr(iterator, "display_name", None) or type(iterator).__name__)
+            self._tick_stats[iterator] = stats
+        stats.record(duration, self._tick_size)
+
+    cdef c_record_tick(self, double duration, object slowest_iterator):
+        cdef double now
+        if duration <= self._tick_size:
+            return
+        self._tick_overruns += 1
+        now = time.time()
+        if now - self._last_overrun_log_time >= OVERRUN_LOG_INTERVAL:
+            self._last_overrun_log_time = now
+            slowest_stats = self._tick_stats.get(slowest_iterator)
+            self.logger().warning(
+                f"Clock tick took {duration:.3f}s, longer than the tick size ({self._tick_size}s). "
+                f"Slowest iterator: {slowest_stats.name} ({slowest_stats.last_duration:.3f}s). "
+                f"{self._tick_overruns} tick overruns so far."
+            )
+
     def __enter__(self) -> Clock:
         if self._current_context is not None:
             raise EnvironmentError("Clock context is not re-entrant.")
@@ -70,6 +141,7 @@ cdef class Clock:
         self._current_context = None
 
     def add_iterator(self, iterator: TimeIterator):
+        (<TimeIterator>iterator)._next_tick_timestamp = 0
         if self._current_context is not None:
             self._current_context.append(iterator)
         if self._started:
@@ -81,6 +153,7 @@ cdef class Clock:
             (<TimeIterator>iterator).c_stop(self)
             self._current_context.remove(iterator)
         self._child_iterators.remove(iterator)
+        self._tick_stats.pop(iterator, None)
 
     async def run(self):
         await self.run_til(float("nan"))
@@ -90,6 +163,12 @@ cdef class Clock:
             TimeIterator child_iterator
             double now = time.time()
             double next_tick_time
+            double tolerance = self._tick_size * TICK_TOLERANCE
+            double tick_start
+            double iterator_start
+            double iterator_duration
+            double slowest_duration
+            TimeIterator slowest_iterator
 
         if self._current_context is None:
             raise EnvironmentError("run() and run_til() can only be used within the context of a `with...` statement.")
@@ -112,9 +191,15 @@ cdef class Clock:
                 await asyncio.sleep(next_tick_time - now)
                 self._current_tick = next_tick_time
 
-                # Run through all the child iterators.
+                # Run through all the child iterators that are due for a tick.
+                tick_start = time.perf_counter()
+                slowest_iterator = None
+                slowest_duration = -1
                 for ci in self._current_context:
                     child_iterator = ci
+                    if not is_tick_due(child_iterator, self._current_tick, tolerance):
+                        continue
+                    iterator_start = time.perf_counter()
                     try:
                         child_iterator.c_tick(self._current_tick)
                     except StopIteration:
@@ -122,13 +207,42 @@ cdef class Clock:
                         return
                     except Exception:
                         self.logger().error("Unexpected error running clock tick.", exc_info=True)
+                    iterator_duration = time.perf_counter() - iterator_start
+                    self.c_record_iterator_tick(child_iterator, iterator_duration)
+                    if iterator_duration > slowest_duration:
+                        slowest_iterator = child_iterator
+                        slowest_duration = iterator_duration
+                if slowest_iterator is not None:
+                    self.c_record_tick(time.perf_counter() - tick_start, slowest_iterator)
         finally:
             for ci in self._current_context:
                 child_iterator = ci
                 child_iterator._clock = None
 
+    cdef double c_next_backtest_tick(self, double timestamp):
+        cdef:
+            TimeIterator child_iterator
+            double next_tick = self._current_tick + self._tick_size
+            double next_event = INFINITY
+
+        for ci in self._child_iterators:
+            child_iterator = ci
+            next_event = min(next_event, child_iterator.c_next_event_timestamp(self._current_tick))
+            if next_event <= next_tick:
+                return next_tick
+        if not isnan(timestamp):
+            next_event = min(next_event, timestamp)
+        if isinf(next_event):
+            return next_event
+        return self._current_tick + ceil(
+            (next_event - self._tick_size * TICK_TOLERANCE - self._current_tick) / self._tick_size
+        ) * self._tick_size
+
     def backtest_til(self, timestamp: float):
-        cdef TimeIterator child_iterator
+        cdef:
+            TimeIterator child_iterator
+            double tolerance = self._tick_size * TICK_TOLERANCE
+            double next_tick
 
         if not self._started:
             for ci in self._child_iterators:
@@ -138,9 +252,18 @@ cdef class Clock:
 
         try:
             while not (self._current_tick >= timestamp):
-                self._current_tick += self._tick_size
+                if self._fast_forward:
+                    next_tick = self.c_next_backtest_tick(timestamp)
+                    if isinf(next_tick):
+                        # Nothing left to happen before the end of the simulation
+                        break
+                    self._current_tick = next_tick
+                else:
+                    self._current_tick += self._tick_size
                 for ci in self._child_iterators:
                     child_iterator = ci
+                    if not is_tick_due(child_iterator, self._current_tick, tolerance):
+                        continue
                     try:
                         child_iterator.c_tick(self._current_tick)
                     except StopIteration:
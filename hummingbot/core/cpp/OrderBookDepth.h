@@ -0,0 +1,132 @@
+#ifndef _ORDER_BOOK_DEPTH_H
+#define _ORDER_BOOK_DEPTH_H
+
+#include <cmath>
+#include <stddef.h>
+
+// Cumulative depth queries over a range of order book levels sorted from the best to the worst price.
+//
+// They work with any iterator over OrderBookEntry (std::set iterators, reverse iterators, vector iterators), so the
+// same walk is shared by every order book storage without creating any Python object per level. Result arguments
+// must be initialized by the caller (price to NaN, volume to 0) and are only updated by the walk.
+
+template <typename Iterator>
+void getPriceForVolume(Iterator it, Iterator end, double volume, double &resultPrice, double &cumulativeVolume) {
+    for (; it != end; ++it) {
+        cumulativeVolume += (*it).getAmount();
+        if (cumulativeVolume >= volume) {
+            resultPrice = (*it).getPrice();
+            return;
+        }
+    }
+}
+
+template <typename Iterator>
+void getPriceForQuoteVolume(Iterator it,
+                            Iterator end,
+                            double quoteVolume,
+                            double &resultPrice,
+                            double &cumulativeQuoteVolume) {
+    for (; it != end; ++it) {
+        cumulativeQuoteVolume += (*it).getAmount() * (*it).getPrice();
+        if (cumulativeQuoteVolume >= quoteVolume) {
+            resultPrice = (*it).getPrice();
+            return;
+        }
+    }
+}
+
+template <typename Iterator>
+void getVwapForVolume(Iterator it, Iterator end, double volume, double &resultVwap, double &totalVolume) {
+    double totalCost = 0;
+    for (; it != end; ++it) {
+        double amount = (*it).getAmount();
+        if (totalVolume + amount >= volume) {
+            totalCost += (volume - totalVolume) * (*it).getPrice();
+            totalVolume = volume;
+            resultVwap = totalCost / totalVolume;
+            return;
+        }
+        totalCost += amount * (*it).getPrice();
+        totalVolume += amount;
+    }
+}
+
+template <typename Iterator>
+void getQuoteVolumeForBaseAmount(Iterator it, Iterator end, double baseAmount, double &cumulativeQuoteVolume) {
+    double cumulativeBaseAmount = 0;
+    for (; it != end; ++it) {
+        double amount = (*it).getAmount();
+        if (amount + cumulativeBaseAmount >= baseAmount) {
+            cumulativeQuoteVolume += (baseAmount - cumulativeBaseAmount) * (*it).getPrice();
+            return;
+        }
+        cumulativeBaseAmount += amount;
+        cumulativeQuoteVolume += amount * (*it).getPrice();
+    }
+}
+
+template <typename Iterator>
+void getVolumeForPrice(Iterator it,
+                       Iterator end,
+                       bool isBuy,
+                       double price,
+                       bool quoteVolume,
+                       double &resultPrice,
+                       double &cumulativeVolume) {
+    for (; it != end; ++it) {
+        double levelPrice = (*it).getPrice();
+        if (isBuy ? levelPrice > price : levelPrice < price) {
+            return;
+        }
+        cumulativeVolume += quoteVolume ? (*it).getAmount() * levelPrice : (*it).getAmount();
+        resultPrice = levelPrice;
+    }
+}
+
+template <typename Iterator>
+void getDepthForSortedVolumes(Iterator it,
+                              Iterator end,
+                              const double *volumes,
+                              size_t count,
+                              double *resultPrices,
+                              double *resultVwaps,
+                              double *resultVolumes) {
+    // Answers getPriceForVolume() and getVwapForVolume() for several volumes, sorted in ascending order, with a
+    // single walk. The results of each volume are written at the same index in the result arrays.
+    double cumulativeVolume = 0;
+    double cumulativeCost = 0;
+    size_t i = 0;
+    for (; it != end && i < count; ++it) {
+        double amount = (*it).getAmount();
+        double price = (*it).getPrice();
+        while (i < count && cumulativeVolume + amount >= volumes[i]) {
+            resultPrices[i] = price;
+            resultVwaps[i] = (cumulativeCost + (volumes[i] - cumulativeVolume) * price) / volumes[i];
+            resultVolumes[i] = volumes[i];
+            ++i;
+        }
+        cumulativeVolume += amount;
+        cumulativeCost += amount * price;
+    }
+    for (; i < count; ++i) {
+        resultPrices[i] = NAN;
+        resultVwaps[i] = NAN;
+        resultVolumes[i] = cumulativeVolume;
+    }
+}
+
+template <typename Iterator>
+size_t copyLevels(Iterator it, Iterator end, size_t maxLevels, double *output) {
+    // Writes up to maxLevels levels as consecutive (price, amount, updateId) triplets and returns how many were
+    // written.
+    size_t count = 0;
+    for (; it != end && count < maxLevels; ++it, ++count) {
+        output[count * 3] = (*it).getPrice();
+        output[count * 3 + 1] = (*it).getAmount();
+        output[count * 3 + 2] = (double)(*it).getUpdateId();
+    }
+    return count;
+}
+
+#endif
@@ -79,6 +79,18 @@ void truncateOverlapEntriesCentralised(std::set<OrderBookEntry> &bidBook, std::s
     }
 }
 
+void truncateDepth(std::set<OrderBookEntry> &book, size_t maxLevels, bool isBid) {
+    // Removes the levels furthest from the top of book, the lowest bids or the highest asks, until at most maxLevels
+    // are left.
+    while (book.size() > maxLevels) {
+        if (isBid) {
+            book.erase(book.begin());
+        } else {
+            book.erase(std::prev(book.end()));
+        }
+    }
+}
+
 double OrderBookEntry::getPrice() const {
     return this->price;
 }
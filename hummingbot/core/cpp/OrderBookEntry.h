@@ -25,4 +25,6 @@ class OrderBookEntry {
         int64_t getUpdateId() const;
 };
 
+void truncateDepth(std::set<OrderBookEntry> &book, size_t maxLevels, bool isBid);
+
 #endif
@@ -0,0 +1,298 @@
+#include "OrderBookLadder.h"
+#include "OrderBookDepth.h"
+#include <algorithm>
+
+OrderBookLadder::OrderBookLadder() {
+    this->isBid = true;
+    this->depthIndexEnabled = false;
+    this->validDepthIndexSize = 0;
+}
+
+OrderBookLadder::OrderBookLadder(bool isBid) {
+    this->isBid = isBid;
+    this->depthIndexEnabled = false;
+    this->validDepthIndexSize = 0;
+}
+
+OrderBookLadder::OrderBookLadder(const OrderBookLadder &other) {
+    this->levels = other.levels;
+    this->isBid = other.isBid;
+    this->depthIndexEnabled = other.depthIndexEnabled;
+    this->cumulativeAmounts = other.cumulativeAmounts;
+    this->cumulativeQuoteAmounts = other.cumulativeQuoteAmounts;
+    this->validDepthIndexSize = other.validDepthIndexSize;
+}
+
+OrderBookLadder &OrderBookLadder::operator=(const OrderBookLadder &other) {
+    this->levels = other.levels;
+    this->isBid = other.isBid;
+    this->depthIndexEnabled = other.depthIndexEnabled;
+    this->cumulativeAmounts = other.cumulativeAmounts;
+    this->cumulativeQuoteAmounts = other.cumulativeQuoteAmounts;
+    this->validDepthIndexSize = other.validDepthIndexSize;
+    return *this;
+}
+
+bool OrderBookLadder::isWorse(double a, double b) const {
+    return this->isBid ? a < b : a > b;
+}
+
+std::vector<OrderBookEntry>::iterator OrderBookLadder::findPosition(double price) {
+    // Returns the first level that is not worse than the price, i.e. either the level at that price or the position
+    // where a new level with that price has to be inserted.
+    return std::lower_bound(
+        this->levels.begin(),
+        this->levels.end(),
+        price,
+        [this](const OrderBookEntry &level, double value) { return this->isWorse(level.getPrice(), value); }
+    );
+}
+
+void OrderBookLadder::invalidateDepthIndex(size_t position) {
+    if (position < this->validDepthIndexSize) {
+        this->validDepthIndexSize = position;
+    }
+}
+
+void OrderBookLadder::updateDepthIndex() {
+    size_t levelsCount = this->levels.size();
+    this->cumulativeAmounts.resize(levelsCount);
+    this->cumulativeQuoteAmounts.resize(levelsCount);
+    for (size_t i = this->validDepthIndexSize; i < levelsCount; ++i) {
+        const OrderBookEntry &level = this->levels[i];
+        double previousAmount = i > 0 ? this->cumulativeAmounts[i - 1] : 0;
+        double previousQuoteAmount = i > 0 ? this->cumulativeQuoteAmounts[i - 1] : 0;
+        this->cumulativeAmounts[i] = previousAmount + level.getAmount();
+        this->cumulativeQuoteAmounts[i] = previousQuoteAmount + level.getAmount() * level.getPrice();
+    }
+    this->validDepthIndexSize = levelsCount;
+}
+
+double OrderBookLadder::sumFromTop(const std::vector<double> &cumulative, size_t levelsCount) const {
+    // Sum of the amounts of the levelsCount levels closest to the top of book.
+    size_t size = this->levels.size();
+    if (levelsCount == 0) {
+        return 0;
+    }
+    double total = cumulative[size - 1];
+    return levelsCount >= size ? total : total - cumulative[size - levelsCount - 1];
+}
+
+size_t OrderBookLadder::levelsCountForSum(const std::vector<double> &cumulative, double target) const {
+    // Smallest number of levels from the top of book whose sum reaches the target, or 0 if the whole side does not.
+    size_t size = this->levels.size();
+    if (size == 0 || this->sumFromTop(cumulative, size) < target) {
+        return 0;
+    }
+    size_t low = 1;
+    size_t high = size;
+    while (low < high) {
+        size_t middle = low + (high - low) / 2;
+        if (this->sumFromTop(cumulative, middle) >= target) {
+            high = middle;
+        } else {
+            low = middle + 1;
+        }
+    }
+    return low;
+}
+
+void OrderBookLadder::clear() {
+    this->levels.clear();
+    this->invalidateDepthIndex(0);
+}
+
+void OrderBookLadder::reserve(size_t capacity) {
+    this->levels.reserve(capacity);
+}
+
+size_t OrderBookLadder::size() const {
+    return this->levels.size();
+}
+
+bool OrderBookLadder::empty() const {
+    return this->levels.empty();
+}
+
+OrderBookLadder::const_iterator OrderBookLadder::begin() const {
+    return this->levels.rbegin();
+}
+
+OrderBookLadder::const_iterator OrderBookLadder::end() const {
+    return this->levels.rend();
+}
+
+const OrderBookEntry &OrderBookLadder::getLevel(size_t depth) const {
+    return this->levels[this->levels.size() - 1 - depth];
+}
+
+const OrderBookEntry &OrderBookLadder::getBest() const {
+    return this->levels.back();
+}
+
+void OrderBookLadder::popBest() {
+    this->levels.pop_back();
+    this->invalidateDepthIndex(this->levels.size());
+}
+
+void OrderBookLadder::applyDiff(const OrderBookEntry &entry) {
+    // Diffs with 0 amounts mean deletion.
+    std::vector<OrderBookEntry>::iterator position = this->findPosition(entry.getPrice());
+    bool found = position != this->levels.end() && (*position).getPrice() == entry.getPrice();
+    this->invalidateDepthIndex(position - this->levels.begin());
+    if (entry.getAmount() > 0) {
+        if (found) {
+            *position = entry;
+        } else {
+            this->levels.insert(position, entry);
+        }
+    } else if (found) {
+        this->levels.erase(position);
+    }
+}
+
+void OrderBookLadder::assignEntries(const std::vector<OrderBookEntry> &entries) {
+    // Same semantics as inserting the entries one by one into a std::set: the first entry seen for a price is kept.
+    this->levels.assign(entries.begin(), entries.end());
+    this->invalidateDepthIndex(0);
+    std::stable_sort(
+        this->levels.begin(),
+        this->levels.end(),
+        [this](const OrderBookEntry &a, const OrderBookEntry &b) { return this->isWorse(a.getPrice(), b.getPrice()); }
+    );
+    this->levels.erase(
+        std::unique(
+            this->levels.begin(),
+            this->levels.end(),
+            [](const OrderBookEntry &a, const OrderBookEntry &b) { return a.getPrice() == b.getPrice(); }
+        ),
+        this->levels.end()
+    );
+}
+
+void OrderBookLadder::truncate(size_t maxLevels) {
+    // Drops the levels furthest from the top of book. They sit at the front of the vector and the cumulative sums
+    // start from them, so the whole depth index has to be rebuilt.
+    size_t size = this->levels.size();
+    if (size <= maxLevels) {
+        return;
+    }
+    this->levels.erase(this->levels.begin(), this->levels.begin() + (size - maxLevels));
+    this->invalidateDepthIndex(0);
+}
+
+bool OrderBookLadder::isDepthIndexEnabled() const {
+    return this->depthIndexEnabled;
+}
+
+void OrderBookLadder::setDepthIndexEnabled(bool enabled) {
+    this->depthIndexEnabled = enabled;
+    this->invalidateDepthIndex(0);
+    if (!enabled) {
+        this->cumulativeAmounts.clear();
+        this->cumulativeQuoteAmounts.clear();
+    }
+}
+
+void OrderBookLadder::getPriceForVolume(double volume, double &resultPrice, double &cumulativeVolume) {
+    if (!this->depthIndexEnabled) {
+        ::getPriceForVolume(this->begin(), this->end(), volume, resultPrice, cumulativeVolume);
+        return;
+    }
+    this->updateDepthIndex();
+    size_t levelsCount = this->levelsCountForSum(this->cumulativeAmounts, volume);
+    if (levelsCount == 0) {
+        cumulativeVolume = this->sumFromTop(this->cumulativeAmounts, this->levels.size());
+    } else {
+        resultPrice = this->getLevel(levelsCount - 1).getPrice();
+        cumulativeVolume = this->sumFromTop(this->cumulativeAmounts, levelsCount);
+    }
+}
+
+void OrderBookLadder::getPriceForQuoteVolume(double quoteVolume, double &resultPrice, double &cumulativeQuoteVolume) {
+    if (!this->depthIndexEnabled) {
+        ::getPriceForQuoteVolume(this->begin(), this->end(), quoteVolume, resultPrice, cumulativeQuoteVolume);
+        return;
+    }
+    this->updateDepthIndex();
+    size_t levelsCount = this->levelsCountForSum(this->cumulativeQuoteAmounts, quoteVolume);
+    if (levelsCount == 0) {
+        cumulativeQuoteVolume = this->sumFromTop(this->cumulativeQuoteAmounts, this->levels.size());
+    } else {
+        resultPrice = this->getLevel(levelsCount - 1).getPrice();
+        cumulativeQuoteVolume = this->sumFromTop(this->cumulativeQuoteAmounts, levelsCount);
+    }
+}
+
+void OrderBookLadder::getVwapForVolume(double volume, double &resultVwap, double &totalVolume) {
+    if (!this->depthIndexEnabled) {
+        ::getVwapForVolume(this->begin(), this->end(), volume, resultVwap, totalVolume);
+        return;
+    }
+    this->updateDepthIndex();
+    size_t levelsCount = this->levelsCountForSum(this->cumulativeAmounts, volume);
+    if (levelsCount == 0) {
+        totalVolume = this->sumFromTop(this->cumulativeAmounts, this->levels.size());
+    } else {
+        double previousVolume = this->sumFromTop(this->cumulativeAmounts, levelsCount - 1);
+        double previousCost = this->sumFromTop(this->cumulativeQuoteAmounts, levelsCount - 1);
+        double totalCost = previousCost + (volume - previousVolume) * this->getLevel(levelsCount - 1).getPrice();
+        totalVolume = volume;
+        resultVwap = totalCost / totalVolume;
+    }
+}
+
+void OrderBookLadder::getQuoteVolumeForBaseAmount(double baseAmount, double &cumulativeQuoteVolume) {
+    if (!this->depthIndexEnabled) {
+        ::getQuoteVolumeForBaseAmount(this->begin(), this->end(), baseAmount, cumulativeQuoteVolume);
+        return;
+    }
+    this->updateDepthIndex();
+    size_t levelsCount = this->levelsCountForSum(this->cumulativeAmounts, baseAmount);
+    if (levelsCount == 0) {
+        cumulativeQuoteVolume = this->sumFromTop(this->cumulativeQuoteAmounts, this->levels.size());
+    } else {
+        double previousAmount = this->sumFromTop(this->cumulativeAmounts, levelsCount - 1);
+        double previousQuoteVolume = this->sumFromTop(this->cumulativeQuoteAmounts, levelsCount - 1);
+        cumulativeQuoteVolume = (
+            previousQuoteVolume + (baseAmount - previousAmount) * this->getLevel(levelsCount - 1).getPrice());
+    }
+}
+
+void OrderBookLadder::getVolumeForPrice(double price, bool quoteVolume, double &resultPrice, double &cumulativeVolume) {
+    // The bid ladder answers sell queries and the ask ladder answers buy queries.
+    if (!this->depthIndexEnabled) {
+        ::getVolumeForPrice(this->begin(), this->end(), !this->isBid, price, quoteVolume, resultPrice, cumulativeVolume);
+        return;
+    }
+    this->updateDepthIndex();
+    size_t levelsCount = this->levels.end() - this->findPosition(price);
+    if (levelsCount > 0) {
+        resultPrice = this->getLevel(levelsCount - 1).getPrice();
+        cumulativeVolume = this->sumFromTop(
+            quoteVolume ? this->cumulativeQuoteAmounts : this->cumulativeAmounts, levelsCount);
+    }
+}
+
+void truncateOverlapLadders(OrderBookLadder &bidLadder, OrderBookLadder &askLadder, const int &dex) {
+    // See truncateOverlapEntriesDex() and truncateOverlapEntriesCentralised() in OrderBookEntry.cpp for the rules
+    // used to decide which side of the book wins.
+    while (!bidLadder.empty() && !askLadder.empty()) {
+        const OrderBookEntry &topBid = bidLadder.getBest();
+        const OrderBookEntry &topAsk = askLadder.getBest();
+        if (topBid.getPrice() < topAsk.getPrice()) {
+            break;
+        }
+        bool bidWins;
+        if (dex != 0) {
+            bidWins = topBid.getAmount() * topBid.getPrice() > topAsk.getAmount() * topAsk.getPrice();
+        } else {
+            bidWins = topBid.getUpdateId() > topAsk.getUpdateId();
+        }
+        if (bidWins) {
+            askLadder.popBest();
+        } else {
+            bidLadder.popBest();
+        }
+    }
+}
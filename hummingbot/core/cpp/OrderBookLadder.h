@@ -0,0 +1,67 @@
+#ifndef _ORDER_BOOK_LADDER_H
+#define _ORDER_BOOK_LADDER_H
+
+#include <stdint.h>
+#include <stddef.h>
+#include <vector>
+#include "OrderBookEntry.h"
+
+// One side of an order book stored as a contiguous sorted array.
+//
+// Levels are kept from the worst price to the best price, so the top of book sits at the back of the vector. This
+// makes updates close to the touch - which is where most diffs land - cost only a short move of the few levels
+// above them, and iterating from the top of book is a linear walk over contiguous memory.
+//
+// The ladder can optionally maintain a cumulative depth index: running sums of the base and quote amounts from the
+// worst level up to each level. A change only invalidates the sums from the changed level up to the top of book, and
+// the index is brought up to date lazily on the next depth query, which then takes O(log n) instead of a walk over
+// the levels. Since the sums are accumulated from the far end of the book, results can differ from the walking
+// queries by floating point rounding.
+class OrderBookLadder {
+    std::vector<OrderBookEntry> levels;
+    bool isBid;
+    bool depthIndexEnabled;
+    std::vector<double> cumulativeAmounts;
+    std::vector<double> cumulativeQuoteAmounts;
+    size_t validDepthIndexSize;
+
+    bool isWorse(double a, double b) const;
+    std::vector<OrderBookEntry>::iterator findPosition(double price);
+    void invalidateDepthIndex(size_t position);
+    void updateDepthIndex();
+    double sumFromTop(const std::vector<double> &cumulative, size_t levelsCount) const;
+    size_t levelsCountForSum(const std::vector<double> &cumulative, double target) const;
+
+    public:
+        typedef std::vector<OrderBookEntry>::const_reverse_iterator const_iterator;
+
+        OrderBookLadder();
+        OrderBookLadder(bool isBid);
+        OrderBookLadder(const OrderBookLadder &other);
+        OrderBookLadder &operator=(const OrderBookLadder &other);
+
+        void clear();
+        void reserve(size_t capacity);
+        size_t size() const;
+        bool empty() const;
+        const_iterator begin() const;
+        const_iterator end() const;
+        const OrderBookEntry &getLevel(size_t depth) const;
+        const OrderBookEntry &getBest() const;
+        void popBest();
+        void applyDiff(const OrderBookEntry &entry);
+        void assignEntries(const std::vector<OrderBookEntry> &entries);
+        void truncate(size_t maxLevels);
+
+        bool isDepthIndexEnabled() const;
+        void setDepthIndexEnabled(bool enabled);
+        void getPriceForVolume(double volume, double &resultPrice, double &cumulativeVolume);
+        void getPriceForQuoteVolume(double quoteVolume, double &resultPrice, double &cumulativeQuoteVolume);
+        void getVwapForVolume(double volume, double &resultVwap, double &totalVolume);
+        void getQuoteVolumeForBaseAmount(double baseAmount, double &cumulativeQuoteVolume);
+        void getVolumeForPrice(double price, bool quoteVolume, double &resultPrice, double &cumulativeVolume);
+};
+
+void truncateOverlapLadders(OrderBookLadder &bidLadder, OrderBookLadder &askLadder, const int &dex);
+
+#endif
@@ -0,0 +1,37 @@
+# distutils: language=c++
+
+cdef extern from "../cpp/OrderBookDepth.h":
+    void getPriceForVolume[Iterator](Iterator it,
+                                     Iterator end,
+                                     double volume,
+                                     double &result_price,
+                                     double &cumulative_volume)
+    void getPriceForQuoteVolume[Iterator](Iterator it,
+                                          Iterator end,
+                                          double quote_volume,
+                                          double &result_price,
+                                          double &cumulative_quote_volume)
+    void getVwapForVolume[Iterator](Iterator it,
+                                    Iterator end,
+                                    double volume,
+                                    double &result_vwap,
+                                    double &total_volume)
+    void getQuoteVolumeForBaseAmount[Iterator](Iterator it,
+                                               Iterator end,
+                                               double base_amount,
+                                               double &cumulative_quote_volume)
+    void getVolumeForPrice[Iterator](Iterator it,
+                                     Iterator end,
+                                     bint is_buy,
+                                     double price,
+                                     bint quote_volume,
+                                     double &result_price,
+                                     double &cumulative_volume)
+    void getDepthForSortedVolumes[Iterator](Iterator it,
+                                            Iterator end,
+                                            const double *volumes,
+                                            size_t count,
+                                            double *result_prices,
+                                            double *result_vwaps,
+                                            double *result_volumes)
+    size_t copyLevels[Iterator](Iterator it, Iterator end, size_t max_levels, double *output)
@@ -14,3 +14,4 @@ cdef extern from "../cpp/OrderBookEntry.h":
         int64_t getUpdateId() const
 
     void truncateOverlapEntries(set[OrderBookEntry] &bid_book, set[OrderBookEntry] &ask_book, const bint &dex)
+    void truncateDepth(set[OrderBookEntry] &book, size_t max_levels, bint is_bid)
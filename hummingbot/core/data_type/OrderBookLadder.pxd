@@ -0,0 +1,34 @@
+# distutils: language=c++
+
+from libcpp.vector cimport vector
+from hummingbot.core.data_type.OrderBookEntry cimport OrderBookEntry
+
+cdef extern from "../cpp/OrderBookLadder.h":
+    cdef cppclass OrderBookLadder:
+        cppclass const_iterator:
+            pass
+        OrderBookLadder()
+        OrderBookLadder(bint isBid)
+        OrderBookLadder(const OrderBookLadder &other)
+        OrderBookLadder &operator=(const OrderBookLadder &other)
+        void clear()
+        void reserve(size_t capacity)
+        size_t size() const
+        bint empty() const
+        const_iterator begin() const
+        const_iterator end() const
+        const OrderBookEntry &getLevel(size_t depth) const
+        const OrderBookEntry &getBest() const
+        void popBest()
+        void applyDiff(const OrderBookEntry &entry)
+        void assignEntries(const vector[OrderBookEntry] &entries)
+        void truncate(size_t max_levels)
+        bint isDepthIndexEnabled() const
+        void setDepthIndexEnabled(bint enabled)
+        void getPriceForVolume(double volume, double &result_price, double &cumulative_volume)
+        void getPriceForQuoteVolume(double quote_volume, double &result_price, double &cumulative_quote_volume)
+        void getVwapForVolume(double volume, double &result_vwap, double &total_volume)
+        void getQuoteVolumeForBaseAmount(double base_amount, double &cumulative_quote_volume)
+        void getVolumeForPrice(double price, bint quote_volume, double &result_price, double &cumulative_volume)
+
+    void truncateOverlapLadders(OrderBookLadder &bid_ladder, OrderBookLadder &ask_ladder, const bint &dex)
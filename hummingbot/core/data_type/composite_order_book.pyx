@@ -1,7 +1,10 @@
 # distutils: language=c++
 # distutils: sources=hummingbot/core/cpp/OrderBookEntry.cpp
 
-from typing import Iterator
+from itertools import islice
+from typing import Iterator, Optional, Tuple
+
+import numpy as np
 
 from cython.operator cimport address as ref, dereference as deref, postincrement as inc
 from hummingbot.core.data_type.OrderBookEntry cimport OrderBookEntry
@@ -11,6 +14,8 @@ from libcpp.vector cimport vector
 from hummingbot.core.data_type.common import TradeType
 from hummingbot.core.data_type.order_book_row import OrderBookRow
 
+NaN = float("nan")
+
 cdef class CompositeOrderBook(OrderBook):
     """
     Record orders that are bought during back testing and used to simulate order book consumption without modifying
@@ -72,6 +77,11 @@ cdef class CompositeOrderBook(OrderBook):
 
         self._traded_order_book.c_apply_diffs(cpp_bids, cpp_asks, timestamp)
 
+    def snapshot_arrays(self, depth: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        bids_array = np.array(list(islice(self.bid_entries(), depth)), dtype=np.float64).reshape(-1, 3)
+        asks_array = np.array(list(islice(self.ask_entries(), depth)), dtype=np.float64).reshape(-1, 3)
+        return bids_array, asks_array
+
     def original_bid_entries(self) -> Iterator[OrderBookRow]:
         return super().bid_entries()
 
@@ -192,3 +202,120 @@ cdef class CompositeOrderBook(OrderBook):
                 return best_bid.price
         except Exception:
             raise
+
+    # The composite entries are only available through the bid_entries() and ask_entries() generators, so the depth
+    # queries walk them instead of the native order book sides used by OrderBook.
+
+    cdef OrderBookQueryResult c_get_price_for_volume(self, bint is_buy, double volume):
+        cdef:
+            double cumulative_volume = 0
+            double result_price = NaN
+
+        for order_book_row in (self.ask_entries() if is_buy else self.bid_entries()):
+            cumulative_volume += order_book_row.amount
+            if cumulative_volume >= volume:
+                result_price = order_book_row.price
+                break
+
+        return OrderBookQueryResult(NaN, volume, result_price, min(cumulative_volume, volume))
+
+    cdef OrderBookQueryResult c_get_vwap_for_volume(self, bint is_buy, double volume):
+        cdef:
+            double total_cost = 0
+            double total_volume = 0
+            double result_vwap = NaN
+
+        for order_book_row in (self.ask_entries() if is_buy else self.bid_entries()):
+            if total_volume + order_book_row.amount >= volume:
+                total_cost += (volume - total_volume) * order_book_row.price
+                total_volume = volume
+                result_vwap = total_cost / total_volume
+                break
+            total_cost += order_book_row.amount * order_book_row.price
+            total_volume += order_book_row.amount
+
+        return OrderBookQueryResult(NaN, volume, result_vwap, min(total_volume, volume))
+
+    cdef OrderBookQueryResult c_get_price_for_quote_volume(self, bint is_buy, double quote_volume):
+        cdef:
+            double cumulative_volume = 0
+            double result_price = NaN
+
+        for order_book_row in (self.ask_entries() if is_buy else self.bid_entries()):
+            cumulative_volume += order_book_row.amount * order_book_row.price
+            if cumulative_volume >= quote_volume:
+                result_price = order_book_row.price
+                break
+
+        return OrderBookQueryResult(NaN, quote_volume, result_price, min(cumulative_volume, quote_volume))
+
+    cdef OrderBookQueryResult c_get_quote_volume_for_base_amount(self, bint is_buy, double base_amount):
+        cdef:
+            double cumulative_volume = 0
+            double cumulative_base_amount = 0
+
+        for order_book_row in (self.ask_entries() if is_buy else self.bid_entries()):
+            if order_book_row.amount + cumulative_base_amount >= base_amount:
+                cumulative_volume += (base_amount - cumulative_base_amount) * order_book_row.price
+                break
+            cumulative_base_amount += order_book_row.amount
+            cumulative_volume += order_book_row.amount * order_book_row.price
+
+        return OrderBookQueryResult(NaN, base_amount, NaN, cumulative_volume)
+
+    cdef OrderBookQueryResult c_get_volume_for_price(self, bint is_buy, double price):
+        cdef:
+            double cumulative_volume = 0
+            double result_price = NaN
+
+        for order_book_row in (self.ask_entries() if is_buy else self.bid_entries()):
+            if (order_book_row.price > price) if is_buy else (order_book_row.price < price):
+                break
+            cumulative_volume += order_book_row.amount
+            result_price = order_book_row.price
+
+        return OrderBookQueryResult(price, NaN, result_price, cumulative_volume)
+
+    cdef OrderBookQueryResult c_get_quote_volume_for_price(self, bint is_buy, double price):
+        cdef:
+            double cumulative_volume = 0
+            double result_price = NaN
+
+        for order_book_row in (self.ask_entries() if is_buy else self.bid_entries()):
+            if (order_book_row.price > price) if is_buy else (order_book_row.price < price):
+                break
+            cumulative_volume += order_book_row.amount * order_book_row.price
+            result_price = order_book_row.price
+
+        return OrderBookQueryResult(price, NaN, result_price, cumulative_volume)
+
+    cdef c_get_depth_for_sorted_volumes(self,
+                                        bint is_buy,
+                                        const double *volumes,
+                                        size_t count,
+                                        double *result_prices,
+                                        double *result_vwaps,
+                                        double *result_volumes):
+        cdef:
+            double cumulative_volume = 0
+            double cumulative_cost = 0
+            size_t i = 0
+
+        for order_book_row in (self.ask_entries() if is_buy else self.bid_entries()):
+            if i >= count:
+                break
+            while i < count and cumulative_volume + order_book_row.amount >= volumes[i]:
+                result_prices[i] = order_book_row.price
+                result_vwaps[i] = (
+                    (cumulative_cost + (volumes[i] - cumulative_volume) * order_book_row.price) / volumes[i]
+                    if volumes[i] != 0 else NaN
+                )
+                result_volumes[i] = volumes[i]
+                i += 1
+            cumulative_volume += order_book_row.amount
+            cumulative_cost += order_book_row.amount * order_book_row.price
+        while i < count:
+            result_prices[i] = NaN
+            result_vwaps[i] = NaN
+            result_volumes[i] = cumulative_volume
+            i += 1
@@ -0,0 +1,34 @@
+# distutils: language=c++
+
+from libc.stdint cimport int64_t
+from libcpp.vector cimport vector
+
+from hummingbot.core.data_type.order_book cimport OrderBook
+from hummingbot.core.data_type.OrderBookEntry cimport OrderBookEntry
+from hummingbot.core.data_type.OrderBookLadder cimport OrderBookLadder
+from hummingbot.core.data_type.order_book_query_result cimport OrderBookQueryResult
+
+cdef class LadderOrderBook(OrderBook):
+    cdef:
+        OrderBookLadder _bid_ladder
+        OrderBookLadder _ask_ladder
+
+    cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id)
+    cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id)
+    cdef c_truncate_depth(self)
+    cdef double c_get_price(self, bint is_buy) except? -1
+    cdef OrderBookQueryResult c_get_price_for_volume(self, bint is_buy, double volume)
+    cdef OrderBookQueryResult c_get_price_for_quote_volume(self, bint is_buy, double quote_volume)
+    cdef OrderBookQueryResult c_get_volume_for_price(self, bint is_buy, double price)
+    cdef OrderBookQueryResult c_get_quote_volume_for_price(self, bint is_buy, double price)
+    cdef OrderBookQueryResult c_get_vwap_for_volume(self, bint is_buy, double volume)
+    cdef OrderBookQueryResult c_get_quote_volume_for_base_amount(self, bint is_buy, double base_amount)
+    cdef c_get_depth_for_sorted_volumes(self,
+                                        bint is_buy,
+                                        const double *volumes,
+                                        size_t count,
+                                        double *result_prices,
+                                        double *result_vwaps,
+                                        double *result_volumes)
+    cdef size_t c_get_levels_count(self, bint is_buy)
+    cdef size_t c_copy_levels(self, bint is_buy, size_t max_levels, double *output)
@@ -0,0 +1,181 @@
+# distutils: language=c++
+# distutils: sources=['hummingbot/core/cpp/OrderBookEntry.cpp', 'hummingbot/core/cpp/OrderBookLadder.cpp']
+
+from typing import Iterator
+
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.data_type.OrderBookDepth cimport copyLevels, getDepthForSortedVolumes
+from hummingbot.core.data_type.OrderBookLadder cimport truncateOverlapLadders
+
+NaN = float("nan")
+
+
+cdef class LadderOrderBook(OrderBook):
+    """
+    Order book that keeps each side as a contiguous array of price levels sorted from the worst to the best price,
+    instead of the std::set used by OrderBook.
+
+    Diffs are located with a binary search and, since most of them land close to the top of the book, inserting or
+    removing a level only moves the few levels above it. Iterating the book walks contiguous memory. It behaves
+    exactly like OrderBook and can be used wherever an OrderBook is expected, e.g. by setting
+    `OrderBookTrackerDataSource.order_book_create_function` in connectors tracking deep books.
+
+    When `depth_index` is enabled each side also keeps running sums of the base and quote amounts per level, so the
+    volume and VWAP queries are answered with a binary search instead of walking the levels. Only the sums between a
+    changed level and the top of book are recomputed, on the first query after the change. The results can differ
+    from the walking queries by floating point rounding.
+    """
+
+    def __init__(self, dex=False, depth_index=False, max_depth=None, depth_margin=None):
+        self._bid_ladder = OrderBookLadder(True)
+        self._ask_ladder = OrderBookLadder(False)
+        super().__init__(dex=dex, max_depth=max_depth, depth_margin=depth_margin)
+        self.depth_index = depth_index
+
+    @property
+    def depth_index(self) -> bool:
+        return self._bid_ladder.isDepthIndexEnabled()
+
+    @depth_index.setter
+    def depth_index(self, value: bool):
+        self._bid_ladder.setDepthIndexEnabled(value)
+        self._ask_ladder.setDepthIndexEnabled(value)
+
+    cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
+        for bid in bids:
+            self._bid_ladder.applyDiff(bid)
+        for ask in asks:
+            self._ask_ladder.applyDiff(ask)
+
+        # If any overlapping entries between the bid and ask books, centralised: newer entries win, dex: see OrderBookEntry.cpp
+        truncateOverlapLadders(self._bid_ladder, self._ask_ladder, self._dex)
+        self.c_truncate_depth()
+
+        # Record the current best prices, for faster c_get_price() calls.
+        if not self._bid_ladder.empty():
+            self._best_bid = self._bid_ladder.getBest().getPrice()
+        if not self._ask_ladder.empty():
+            self._best_ask = self._ask_ladder.getBest().getPrice()
+
+        # Remember the last diff update ID.
+        self._last_diff_uid = update_id
+        self.c_publish_top_of_book(update_id)
+
+    cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
+        self._bid_ladder.assignEntries(bids)
+        self._ask_ladder.assignEntries(asks)
+
+        if self._dex:
+            truncateOverlapLadders(self._bid_ladder, self._ask_ladder, self._dex)
+        self.c_truncate_depth()
+
+        # Record the current best prices, for faster c_get_price() calls.
+        self._best_bid = self._bid_ladder.getBest().getPrice() if not self._bid_ladder.empty() else float("NaN")
+        self._best_ask = self._ask_ladder.getBest().getPrice() if not self._ask_ladder.empty() else float("NaN")
+
+        # Remember the last snapshot update ID.
+        self._snapshot_uid = update_id
+        self.c_publish_top_of_book(update_id)
+
+    cdef c_truncate_depth(self):
+        if self._max_depth > 0:
+            self._bid_ladder.truncate(self._max_depth + self._depth_margin)
+            self._ask_ladder.truncate(self._max_depth + self._depth_margin)
+
+    def bid_entries(self) -> Iterator[OrderBookRow]:
+        cdef:
+            size_t depth = 0
+            OrderBookEntry entry
+        while depth < self._bid_ladder.size():
+            entry = self._bid_ladder.getLevel(depth)
+            yield OrderBookRow(entry.getPrice(), entry.getAmount(), entry.getUpdateId())
+            depth += 1
+
+    def ask_entries(self) -> Iterator[OrderBookRow]:
+        cdef:
+            size_t depth = 0
+            OrderBookEntry entry
+        while depth < self._ask_ladder.size():
+            entry = self._ask_ladder.getLevel(depth)
+            yield OrderBookRow(entry.getPrice(), entry.getAmount(), entry.getUpdateId())
+            depth += 1
+
+    cdef size_t c_get_levels_count(self, bint is_buy):
+        return self._ask_ladder.size() if is_buy else self._bid_ladder.size()
+
+    cdef size_t c_copy_levels(self, bint is_buy, size_t max_levels, double *output):
+        cdef:
+            OrderBookLadder *ladder = &self._ask_ladder if is_buy else &self._bid_ladder
+        return copyLevels(ladder.begin(), ladder.end(), max_levels, output)
+
+    cdef double c_get_price(self, bint is_buy) except? -1:
+        cdef:
+            OrderBookLadder *ladder = &self._ask_ladder if is_buy else &self._bid_ladder
+        if ladder.size() < 1:
+            raise EnvironmentError("Order book is empty - no price quote is possible.")
+        return self._best_ask if is_buy else self._best_bid
+
+    cdef OrderBookQueryResult c_get_price_for_volume(self, bint is_buy, double volume):
+        cdef:
+            double cumulative_volume = 0
+            double result_price = NaN
+            OrderBookLadder *ladder = &self._ask_ladder if is_buy else &self._bid_ladder
+
+        ladder.getPriceForVolume(volume, result_price, cumulative_volume)
+        return OrderBookQueryResult(NaN, volume, result_price, min(cumulative_volume, volume))
+
+    cdef OrderBookQueryResult c_get_vwap_for_volume(self, bint is_buy, double volume):
+        cdef:
+            double total_volume = 0
+            double result_vwap = NaN
+            OrderBookLadder *ladder = &self._ask_ladder if is_buy else &self._bid_ladder
+
+        ladder.getVwapForVolume(volume, result_vwap, total_volume)
+        return OrderBookQueryResult(NaN, volume, result_vwap, min(total_volume, volume))
+
+    cdef OrderBookQueryResult c_get_price_for_quote_volume(self, bint is_buy, double quote_volume):
+        cdef:
+            double cumulative_volume = 0
+            double result_price = NaN
+            OrderBookLadder *ladder = &self._ask_ladder if is_buy else &self._bid_ladder
+
+        ladder.getPriceForQuoteVolume(quote_volume, result_price, cumulative_volume)
+        return OrderBookQueryResult(NaN, quote_volume, result_price, min(cumulative_volume, quote_volume))
+
+    cdef OrderBookQueryResult c_get_quote_volume_for_base_amount(self, bint is_buy, double base_amount):
+        cdef:
+            double cumulative_volume = 0
+            OrderBookLadder *ladder = &self._ask_ladder if is_buy else &self._bid_ladder
+
+        ladder.getQuoteVolumeForBaseAmount(base_amount, cumulative_volume)
+        return OrderBookQueryResult(NaN, base_amount, NaN, cumulative_volume)
+
+    cdef OrderBookQueryResult c_get_volume_for_price(self, bint is_buy, double price):
+        cdef:
+            double cumulative_volume = 0
+            double result_price = NaN
+            OrderBookLadder *ladder = &self._ask_ladder if is_buy else &self._bid_ladder
+
+        ladder.getVolumeForPrice(price, False, result_price, cumulative_volume)
+        return OrderBookQueryResult(price, NaN, result_price, cumulative_volume)
+
+    cdef OrderBookQueryResult c_get_quote_volume_for_price(self, bint is_buy, double price):
+        cdef:
+            double cumulative_volume = 0
+            double result_price = NaN
+            OrderBookLadder *ladder = &self._ask_ladder if is_buy else &self._bid_ladder
+
+        ladder.getVolumeForPrice(price, True, result_price, cumulative_volume)
+        return OrderBookQueryResult(price, NaN, result_price, cumulative_volume)
+
+    cdef c_get_depth_for_sorted_volumes(self,
+                                        bint is_buy,
+                                        const double *volumes,
+                                        size_t count,
+                                        double *result_prices,
+                                        double *result_vwaps,
+                                        double *result_volumes):
+        cdef:
+            OrderBookLadder *ladder = &self._ask_ladder if is_buy else &self._bid_ladder
+
+        getDepthForSortedVolumes(ladder.begin(), ladder.end(), volumes, count, result_prices, result_vwaps, result_volumes)
@@ -20,10 +20,32 @@ cdef class OrderBook(PubSub):
     cdef double _last_applied_trade
     cdef double _last_trade_price_rest_updated
     cdef bint _dex
+    cdef size_t _max_depth
+    cdef size_t _depth_margin
+    cdef double _published_best_bid
+    cdef double _published_best_ask
+    cdef double _top_of_book_event_interval
+    cdef double _last_top_of_book_event
+    cdef int64_t _top_of_book_update_id
+    cdef object _trailing_top_of_book_event
 
     cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id)
     cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id)
     cdef c_apply_trade(self, object trade_event)
+    cdef c_truncate_depth(self)
+    cdef c_publish_top_of_book(self, int64_t update_id)
+    cdef c_apply_diff_columns(self,
+                              const double[:] bid_prices,
+                              const double[:] bid_amounts,
+                              const double[:] ask_prices,
+                              const double[:] ask_amounts,
+                              int64_t update_id)
+    cdef c_apply_snapshot_columns(self,
+                                  const double[:] bid_prices,
+                                  const double[:] bid_amounts,
+                                  const double[:] ask_prices,
+                                  const double[:] ask_amounts,
+                                  int64_t update_id)
     cdef c_apply_numpy_diffs(self,
                              np.ndarray[np.float64_t, ndim=2] bids_array,
                              np.ndarray[np.float64_t, ndim=2] asks_array)
@@ -37,3 +59,13 @@ cdef class OrderBook(PubSub):
     cdef OrderBookQueryResult c_get_quote_volume_for_price(self, bint is_buy, double price)
     cdef OrderBookQueryResult c_get_vwap_for_volume(self, bint is_buy, double volume)
     cdef OrderBookQueryResult c_get_quote_volume_for_base_amount(self, bint is_buy, double base_amount)
+    cdef c_get_depth_for_sorted_volumes(self,
+                                        bint is_buy,
+                                        const double *volumes,
+                                        size_t count,
+                                        double *result_prices,
+                                        double *result_vwaps,
+                                        double *result_volumes)
+    cdef object c_get_vwap_for_volumes(self, bint is_buy, np.ndarray[np.float64_t, ndim=1] volumes)
+    cdef size_t c_get_levels_count(self, bint is_buy)
+    cdef size_t c_copy_levels(self, bint is_buy, size_t max_levels, double *output)
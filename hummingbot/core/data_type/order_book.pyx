@@ -1,10 +1,11 @@
 # distutils: language=c++
 # distutils: sources=hummingbot/core/cpp/OrderBookEntry.cpp
-import bisect
+import asyncio
 import logging
 import time
 from typing import (
     Dict,
+    Iterable,
     Iterator,
     List,
     Optional,
@@ -20,24 +21,54 @@ from cython.operator cimport(
     postincrement as inc,
 )
 
-from hummingbot.core.data_type.order_book_message import OrderBookMessage
-from hummingbot.core.data_type.order_book_query_result import OrderBookQueryResult
+from hummingbot.core.data_type.order_book_message import OrderBookColumns, OrderBookMessage
+from hummingbot.core.data_type.order_book_query_result import OrderBookQueryResult, OrderBookVolumesQueryResult
 from hummingbot.core.data_type.order_book_row import OrderBookRow
-from hummingbot.core.data_type.OrderBookEntry cimport truncateOverlapEntries
+from hummingbot.core.data_type.OrderBookDepth cimport (
+    copyLevels,
+    getDepthForSortedVolumes,
+    getPriceForQuoteVolume,
+    getPriceForVolume,
+    getQuoteVolumeForBaseAmount,
+    getVolumeForPrice,
+    getVwapForVolume,
+)
+from hummingbot.core.data_type.OrderBookEntry cimport truncateDepth, truncateOverlapEntries
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.event.events import (
     OrderBookEvent,
+    OrderBookTopOfBookChangedEvent,
     OrderBookTradeEvent
 )
 
 cimport numpy as np
+from libc.math cimport isnan
 
 ob_logger = None
 NaN = float("nan")
 
 
+cdef inline columns_to_entries(const double[:] prices,
+                               const double[:] amounts,
+                               int64_t update_id,
+                               vector[OrderBookEntry] &entries):
+    cdef:
+        Py_ssize_t count = prices.shape[0]
+        Py_ssize_t i
+    if amounts.shape[0] != count:
+        raise ValueError(f"Price and amount columns differ in length ({count} != {amounts.shape[0]}).")
+    entries.reserve(count)
+    for i in range(count):
+        entries.push_back(OrderBookEntry(prices[i], amounts[i], update_id))
+
+
+cdef inline bint prices_differ(double a, double b):
+    return a != b and not (isnan(a) and isnan(b))
+
+
 cdef class OrderBook(PubSub):
     ORDER_BOOK_TRADE_EVENT_TAG = OrderBookEvent.TradeEvent.value
+    ORDER_BOOK_TOP_OF_BOOK_CHANGED_EVENT_TAG = OrderBookEvent.TopOfBookChangedEvent.value
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -46,7 +77,7 @@ cdef class OrderBook(PubSub):
             ob_logger = logging.getLogger(__name__)
         return ob_logger
 
-    def __init__(self, dex=False):
+    def __init__(self, dex=False, max_depth: Optional[int] = None, depth_margin: Optional[int] = None):
         super().__init__()
         self._snapshot_uid = 0
         self._last_diff_uid = 0
@@ -55,6 +86,14 @@ cdef class OrderBook(PubSub):
         self._last_applied_trade = -1000.0
         self._last_trade_price_rest_updated = -1000
         self._dex = dex
+        self._max_depth = 0
+        self._depth_margin = 0
+        self.set_max_depth(max_depth, depth_margin)
+        self._published_best_bid = self._published_best_ask = float("NaN")
+        self._top_of_book_event_interval = 0
+        self._last_top_of_book_event = -1000.0
+        self._top_of_book_update_id = 0
+        self._trailing_top_of_book_event = None
 
     cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
         cdef:
@@ -82,6 +121,7 @@ cdef class OrderBook(PubSub):
 
         # If any overlapping entries between the bid and ask books, centralised: newer entries win, dex: see OrderBookEntry.cpp
         truncateOverlapEntries(self._bid_book, self._ask_book, self._dex)
+        self.c_truncate_depth()
 
         # Record the current best prices, for faster c_get_price() calls.
         bid_iterator = self._bid_book.rbegin()
@@ -95,6 +135,7 @@ cdef class OrderBook(PubSub):
 
         # Remember the last diff update ID.
         self._last_diff_uid = update_id
+        self.c_publish_top_of_book(update_id)
 
     cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
         cdef:
@@ -129,12 +170,107 @@ cdef class OrderBook(PubSub):
                 top_ask = deref(ask_iterator)
                 best_ask_price = top_ask.getPrice()
 
+        self.c_truncate_depth()
+
         # Record the current best prices, for faster c_get_price() calls.
         self._best_bid = best_bid_price
         self._best_ask = best_ask_price
 
         # Remember the last snapshot update ID.
         self._snapshot_uid = update_id
+        self.c_publish_top_of_book(update_id)
+
+    cdef c_truncate_depth(self):
+        if self._max_depth > 0:
+            truncateDepth(self._bid_book, self._max_depth + self._depth_margin, True)
+            truncateDepth(self._ask_book, self._max_depth + self._depth_margin, False)
+
+    def set_max_depth(self, max_depth: Optional[int], depth_margin: Optional[int] = None):
+        """
+        Bounds the number of price levels kept on each side of the book. Levels beyond `max_depth + depth_margin` from
+        the top of book are dropped after every snapshot and diff. The margin (`max_depth` by default) keeps the levels
+        that refill the top `max_depth` when diffs remove levels close to the touch, so the top `max_depth` levels stay
+        complete as long as the diffs do not remove more than `depth_margin` of them between two snapshots. Queries
+        and snapshots only see the retained levels.
+
+        :param max_depth: number of levels to keep complete on each side, or None to keep every level
+        :param depth_margin: number of extra levels to keep below `max_depth`
+        """
+        if max_depth is None:
+            self._max_depth = 0
+            self._depth_margin = 0
+            return
+        if max_depth <= 0:
+            raise ValueError(f"The order book max depth must be positive ({max_depth} given).")
+        if depth_margin is None:
+            depth_margin = max_depth
+        if depth_margin < 0:
+            raise ValueError(f"The order book depth margin can't be negative ({depth_margin} given).")
+        self._max_depth = max_depth
+        self._depth_margin = depth_margin
+        self.c_truncate_depth()
+
+    @property
+    def max_depth(self) -> Optional[int]:
+        return self._max_depth if self._max_depth > 0 else None
+
+    @property
+    def depth_margin(self) -> int:
+        return self._depth_margin
+
+    cdef c_publish_top_of_book(self, int64_t update_id):
+        cdef:
+            double now
+
+        if not (prices_differ(self._best_bid, self._published_best_bid)
+                or prices_differ(self._best_ask, self._published_best_ask)):
+            return
+        if self._events.find(self.ORDER_BOOK_TOP_OF_BOOK_CHANGED_EVENT_TAG) == self._events.end():
+            return
+        now = time.perf_counter()
+        if now - self._last_top_of_book_event < self._top_of_book_event_interval:
+            self._top_of_book_update_id = update_id
+            self._schedule_trailing_top_of_book_event(
+                self._last_top_of_book_event + self._top_of_book_event_interval - now)
+            return
+        self._published_best_bid = self._best_bid
+        self._published_best_ask = self._best_ask
+        self._last_top_of_book_event = now
+        self.c_trigger_event(self.ORDER_BOOK_TOP_OF_BOOK_CHANGED_EVENT_TAG,
+                             OrderBookTopOfBookChangedEvent(time.time(), self._best_bid, self._best_ask, update_id))
+
+    def _schedule_trailing_top_of_book_event(self, delay: float):
+        if self._trailing_top_of_book_event is not None:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # Without a running event loop the change is published by the next update, or by
+            # publish_pending_top_of_book()
+            return
+        self._trailing_top_of_book_event = loop.call_later(delay, self.publish_pending_top_of_book)
+
+    def publish_pending_top_of_book(self):
+        """
+        Publishes the top of book change held back by `top_of_book_event_interval`, once the interval has elapsed.
+        """
+        if self._trailing_top_of_book_event is not None:
+            self._trailing_top_of_book_event.cancel()
+            self._trailing_top_of_book_event = None
+        self.c_publish_top_of_book(self._top_of_book_update_id)
+
+    @property
+    def top_of_book_event_interval(self) -> float:
+        """
+        Minimum number of seconds between two top of book changed events. A change happening sooner is published at
+        the end of the interval (by a callback scheduled in the running event loop), with the top of book at that
+        time, if it still differs from the last published one.
+        """
+        return self._top_of_book_event_interval
+
+    @top_of_book_event_interval.setter
+    def top_of_book_event_interval(self, value: float):
+        self._top_of_book_event_interval = value
 
     cdef c_apply_trade(self, object trade_event):
         self._last_trade_price = trade_event.price
@@ -171,12 +307,42 @@ cdef class OrderBook(PubSub):
 
     @property
     def snapshot(self) -> Tuple[pd.DataFrame, pd.DataFrame]:
-        bids_rows = list(self.bid_entries())
-        asks_rows = list(self.ask_entries())
-        bids_df = pd.DataFrame(data=bids_rows, columns=OrderBookRow._fields, dtype="float64")
-        asks_df = pd.DataFrame(data=asks_rows, columns=OrderBookRow._fields, dtype="float64")
+        bids_array, asks_array = self.snapshot_arrays()
+        bids_df = pd.DataFrame(data=bids_array, columns=OrderBookRow._fields, dtype="float64")
+        asks_df = pd.DataFrame(data=asks_array, columns=OrderBookRow._fields, dtype="float64")
         return bids_df, asks_df
 
+    def snapshot_arrays(self, depth: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Copies the bid and ask sides of the book, starting from the best price, into two float64 arrays with the
+        columns [price, amount, update_id]. The levels are copied straight from the book, which makes this much
+        cheaper than `snapshot` when only the top of the book is needed.
+
+        :param depth: the maximum number of levels to copy per side, all the levels if None
+        :return: a tuple with the bids and asks arrays
+        """
+        return self._side_array(False, depth), self._side_array(True, depth)
+
+    def _side_array(self, bint is_buy, depth: Optional[int]) -> np.ndarray:
+        cdef:
+            size_t levels_count = self.c_get_levels_count(is_buy)
+            np.ndarray[np.float64_t, ndim=2] levels
+
+        if depth is not None:
+            levels_count = min(levels_count, max(depth, 0))
+        levels = np.empty((levels_count, 3), dtype=np.float64)
+        if levels_count > 0:
+            levels_count = self.c_copy_levels(is_buy, levels_count, &levels[0, 0])
+        return levels[:levels_count]
+
+    cdef size_t c_get_levels_count(self, bint is_buy):
+        return self._ask_book.size() if is_buy else self._bid_book.size()
+
+    cdef size_t c_copy_levels(self, bint is_buy, size_t max_levels, double *output):
+        if is_buy:
+            return copyLevels(self._ask_book.begin(), self._ask_book.end(), max_levels, output)
+        return copyLevels(self._bid_book.rbegin(), self._bid_book.rend(), max_levels, output)
+
     def apply_diffs(self, bids: List[OrderBookRow], asks: List[OrderBookRow], update_id: int):
         cdef:
             vector[OrderBookEntry] cpp_bids
@@ -197,6 +363,42 @@ cdef class OrderBook(PubSub):
             cpp_asks.push_back(OrderBookEntry(row.price, row.amount, row.update_id))
         self.c_apply_snapshot(cpp_bids, cpp_asks, update_id)
 
+    def apply_diff_columns(self, bids: OrderBookColumns, asks: OrderBookColumns, update_id: int):
+        """
+        Applies a diff given as parallel float64 price and amount arrays per side (see
+        `OrderBookMessage.bid_columns`), without building an OrderBookRow per level.
+        """
+        self.c_apply_diff_columns(bids[0], bids[1], asks[0], asks[1], update_id)
+
+    def apply_snapshot_columns(self, bids: OrderBookColumns, asks: OrderBookColumns, update_id: int):
+        self.c_apply_snapshot_columns(bids[0], bids[1], asks[0], asks[1], update_id)
+
+    cdef c_apply_diff_columns(self,
+                              const double[:] bid_prices,
+                              const double[:] bid_amounts,
+                              const double[:] ask_prices,
+                              const double[:] ask_amounts,
+                              int64_t update_id):
+        cdef:
+            vector[OrderBookEntry] cpp_bids
+            vector[OrderBookEntry] cpp_asks
+        columns_to_entries(bid_prices, bid_amounts, update_id, cpp_bids)
+        columns_to_entries(ask_prices, ask_amounts, update_id, cpp_asks)
+        self.c_apply_diffs(cpp_bids, cpp_asks, update_id)
+
+    cdef c_apply_snapshot_columns(self,
+                                  const double[:] bid_prices,
+                                  const double[:] bid_amounts,
+                                  const double[:] ask_prices,
+                                  const double[:] ask_amounts,
+                                  int64_t update_id):
+        cdef:
+            vector[OrderBookEntry] cpp_bids
+            vector[OrderBookEntry] cpp_asks
+        columns_to_entries(bid_prices, bid_amounts, update_id, cpp_bids)
+        columns_to_entries(ask_prices, ask_amounts, update_id, cpp_asks)
+        self.c_apply_snapshot(cpp_bids, cpp_asks, update_id)
+
     def apply_trade(self, trade: OrderBookTradeEvent):
         self.c_apply_trade(trade)
 
@@ -324,49 +526,21 @@ cdef class OrderBook(PubSub):
             double result_price = NaN
 
         if is_buy:
-            for order_book_row in self.ask_entries():
-                cumulative_volume += order_book_row.amount
-                if cumulative_volume >= volume:
-                    result_price = order_book_row.price
-                    break
+            getPriceForVolume(self._ask_book.begin(), self._ask_book.end(), volume, result_price, cumulative_volume)
         else:
-            for order_book_row in self.bid_entries():
-                cumulative_volume += order_book_row.amount
-                if cumulative_volume >= volume:
-                    result_price = order_book_row.price
-                    break
+            getPriceForVolume(self._bid_book.rbegin(), self._bid_book.rend(), volume, result_price, cumulative_volume)
 
         return OrderBookQueryResult(NaN, volume, result_price, min(cumulative_volume, volume))
 
     cdef OrderBookQueryResult c_get_vwap_for_volume(self, bint is_buy, double volume):
         cdef:
-            double total_cost = 0
             double total_volume = 0
             double result_vwap = NaN
+
         if is_buy:
-            for order_book_row in self.ask_entries():
-                total_cost += order_book_row.amount * order_book_row.price
-                total_volume += order_book_row.amount
-                if total_volume >= volume:
-                    total_cost -= order_book_row.amount * order_book_row.price
-                    total_volume -= order_book_row.amount
-                    incremental_amount = volume - total_volume
-                    total_cost += incremental_amount * order_book_row.price
-                    total_volume += incremental_amount
-                    result_vwap = total_cost / total_volume
-                    break
+            getVwapForVolume(self._ask_book.begin(), self._ask_book.end(), volume, result_vwap, total_volume)
         else:
-            for order_book_row in self.bid_entries():
-                total_cost += order_book_row.amount * order_book_row.price
-                total_volume += order_book_row.amount
-                if total_volume >= volume:
-                    total_cost -= order_book_row.amount * order_book_row.price
-                    total_volume -= order_book_row.amount
-                    incremental_amount = volume - total_volume
-                    total_cost += incremental_amount * order_book_row.price
-                    total_volume += incremental_amount
-                    result_vwap = total_cost / total_volume
-                    break
+            getVwapForVolume(self._bid_book.rbegin(), self._bid_book.rend(), volume, result_vwap, total_volume)
 
         return OrderBookQueryResult(NaN, volume, result_vwap, min(total_volume, volume))
 
@@ -376,44 +550,24 @@ cdef class OrderBook(PubSub):
             double result_price = NaN
 
         if is_buy:
-            for order_book_row in self.ask_entries():
-                cumulative_volume += order_book_row.amount * order_book_row.price
-                if cumulative_volume >= quote_volume:
-                    result_price = order_book_row.price
-                    break
+            getPriceForQuoteVolume(
+                self._ask_book.begin(), self._ask_book.end(), quote_volume, result_price, cumulative_volume
+            )
         else:
-            for order_book_row in self.bid_entries():
-                cumulative_volume += order_book_row.amount * order_book_row.price
-                if cumulative_volume >= quote_volume:
-                    result_price = order_book_row.price
-                    break
+            getPriceForQuoteVolume(
+                self._bid_book.rbegin(), self._bid_book.rend(), quote_volume, result_price, cumulative_volume
+            )
 
         return OrderBookQueryResult(NaN, quote_volume, result_price, min(cumulative_volume, quote_volume))
 
     cdef OrderBookQueryResult c_get_quote_volume_for_base_amount(self, bint is_buy, double base_amount):
         cdef:
             double cumulative_volume = 0
-            double cumulative_base_amount = 0
-            double row_amount = 0
 
         if is_buy:
-            for order_book_row in self.ask_entries():
-                row_amount = order_book_row.amount
-                if row_amount + cumulative_base_amount >= base_amount:
-                    row_amount = base_amount - cumulative_base_amount
-                cumulative_base_amount += row_amount
-                cumulative_volume += row_amount * order_book_row.price
-                if cumulative_base_amount >= base_amount:
-                    break
+            getQuoteVolumeForBaseAmount(self._ask_book.begin(), self._ask_book.end(), base_amount, cumulative_volume)
         else:
-            for order_book_row in self.bid_entries():
-                row_amount = order_book_row.amount
-                if row_amount + cumulative_base_amount >= base_amount:
-                    row_amount = base_amount - cumulative_base_amount
-                cumulative_base_amount += row_amount
-                cumulative_volume += row_amount * order_book_row.price
-                if cumulative_base_amount >= base_amount:
-                    break
+            getQuoteVolumeForBaseAmount(self._bid_book.rbegin(), self._bid_book.rend(), base_amount, cumulative_volume)
 
         return OrderBookQueryResult(NaN, base_amount, NaN, cumulative_volume)
 
@@ -423,17 +577,13 @@ cdef class OrderBook(PubSub):
             double result_price = NaN
 
         if is_buy:
-            for order_book_row in self.ask_entries():
-                if order_book_row.price > price:
-                    break
-                cumulative_volume += order_book_row.amount
-                result_price = order_book_row.price
+            getVolumeForPrice(
+                self._ask_book.begin(), self._ask_book.end(), is_buy, price, False, result_price, cumulative_volume
+            )
         else:
-            for order_book_row in self.bid_entries():
-                if order_book_row.price < price:
-                    break
-                cumulative_volume += order_book_row.amount
-                result_price = order_book_row.price
+            getVolumeForPrice(
+                self._bid_book.rbegin(), self._bid_book.rend(), is_buy, price, False, result_price, cumulative_volume
+            )
 
         return OrderBookQueryResult(price, NaN, result_price, cumulative_volume)
 
@@ -443,20 +593,69 @@ cdef class OrderBook(PubSub):
             double result_price = NaN
 
         if is_buy:
-            for order_book_row in self.ask_entries():
-                if order_book_row.price > price:
-                    break
-                cumulative_volume += order_book_row.amount * order_book_row.price
-                result_price = order_book_row.price
+            getVolumeForPrice(
+                self._ask_book.begin(), self._ask_book.end(), is_buy, price, True, result_price, cumulative_volume
+            )
         else:
-            for order_book_row in self.bid_entries():
-                if order_book_row.price < price:
-                    break
-                cumulative_volume += order_book_row.amount * order_book_row.price
-                result_price = order_book_row.price
+            getVolumeForPrice(
+                self._bid_book.rbegin(), self._bid_book.rend(), is_buy, price, True, result_price, cumulative_volume
+            )
 
         return OrderBookQueryResult(price, NaN, result_price, cumulative_volume)
 
+    cdef c_get_depth_for_sorted_volumes(self,
+                                        bint is_buy,
+                                        const double *volumes,
+                                        size_t count,
+                                        double *result_prices,
+                                        double *result_vwaps,
+                                        double *result_volumes):
+        if is_buy:
+            getDepthForSortedVolumes(
+                self._ask_book.begin(), self._ask_book.end(), volumes, count, result_prices, result_vwaps, result_volumes
+            )
+        else:
+            getDepthForSortedVolumes(
+                self._bid_book.rbegin(), self._bid_book.rend(), volumes, count, result_prices, result_vwaps, result_volumes
+            )
+
+    cdef object c_get_vwap_for_volumes(self, bint is_buy, np.ndarray[np.float64_t, ndim=1] volumes):
+        cdef:
+            size_t count = len(volumes)
+            object order = np.argsort(volumes, kind="stable")
+            np.ndarray[np.float64_t, ndim=1] sorted_volumes = np.ascontiguousarray(volumes[order])
+            np.ndarray[np.float64_t, ndim=1] sorted_prices = np.empty(count, dtype=np.float64)
+            np.ndarray[np.float64_t, ndim=1] sorted_vwaps = np.empty(count, dtype=np.float64)
+            np.ndarray[np.float64_t, ndim=1] sorted_result_volumes = np.empty(count, dtype=np.float64)
+
+        if count > 0:
+            self.c_get_depth_for_sorted_volumes(is_buy,
+                                                &sorted_volumes[0],
+                                                count,
+                                                &sorted_prices[0],
+                                                &sorted_vwaps[0],
+                                                &sorted_result_volumes[0])
+
+        result_prices = np.empty(count, dtype=np.float64)
+        result_vwaps = np.empty(count, dtype=np.float64)
+        result_volumes = np.empty(count, dtype=np.float64)
+        result_prices[order] = sorted_prices
+        result_vwaps[order] = sorted_vwaps
+        result_volumes[order] = sorted_result_volumes
+        return OrderBookVolumesQueryResult(volumes, result_prices, result_vwaps, result_volumes)
+
+    def get_vwap_for_volumes(self, is_buy: bool, volumes: Iterable[float]) -> OrderBookVolumesQueryResult:
+        """
+        Answers get_price_for_volume() and get_vwap_for_volume() for several volumes with a single walk from the top
+        of book, instead of walking the book again for every volume.
+
+        :param is_buy: True to query the ask side, False to query the bid side
+        :param volumes: the base volumes to query (NumPy array or any sequence of floats), in any order
+        :return: the price of the level that fills each volume, the VWAP to fill it and the volume that can be filled
+        (prices and VWAPs are NaN for volumes the book side can't fill)
+        """
+        return self.c_get_vwap_for_volumes(is_buy, np.asarray(volumes, dtype=np.float64).ravel())
+
     def get_price_for_volume(self, is_buy: bool, volume: float) -> OrderBookQueryResult:
         return self.c_get_price_for_volume(is_buy, volume)
 
@@ -476,8 +675,9 @@ cdef class OrderBook(PubSub):
         return self.c_get_quote_volume_for_price(is_buy, price)
 
     def restore_from_snapshot_and_diffs(self, snapshot: OrderBookMessage, diffs: List[OrderBookMessage]):
-        replay_position = bisect.bisect_right(diffs, snapshot)
-        replay_diffs = diffs[replay_position:]
-        self.apply_snapshot(snapshot.bids, snapshot.asks, snapshot.update_id)
+        # OrderBookMessage.__lt__ is true for every diff, so it can't be used to find the diffs received after the
+        # snapshot
+        replay_diffs = [diff for diff in diffs if diff.update_id > snapshot.update_id]
+        self.apply_snapshot_columns(snapshot.bid_columns, snapshot.ask_columns, snapshot.update_id)
         for diff in replay_diffs:
-            self.apply_diffs(diff.bids, diff.asks, diff.update_id)
+            self.apply_diff_columns(diff.bid_columns, diff.ask_columns, diff.update_id)
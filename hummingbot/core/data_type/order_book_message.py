@@ -1,7 +1,9 @@
 from collections import namedtuple
 from enum import Enum
-from functools import total_ordering
-from typing import Dict, List, Optional
+from functools import cached_property, total_ordering
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
 
 from hummingbot.core.data_type.order_book_row import OrderBookRow
 
@@ -12,6 +14,31 @@ class OrderBookMessageType(Enum):
     TRADE = 3
 
 
+class OrderBookColumns(namedtuple("_OrderBookColumns", "prices, amounts")):
+    """
+    One side of an order book message as two parallel float64 arrays.
+    """
+    prices: np.ndarray
+    amounts: np.ndarray
+
+    @classmethod
+    def from_rows(cls, rows: Sequence) -> "OrderBookColumns":
+        """
+        Parses raw exchange rows (price, amount, *extra fields) into columns. Prices and amounts can be numbers or
+        numeric strings.
+        """
+        if len(rows) == 0:
+            return cls(np.empty(0, dtype=np.float64), np.empty(0, dtype=np.float64))
+        try:
+            array = np.array(rows, dtype=np.float64)
+        except (TypeError, ValueError):
+            # Ragged rows or non numeric extra fields
+            array = None
+        if array is None or array.ndim != 2 or array.shape[1] < 2:
+            array = np.array([(row[0], row[1]) for row in rows], dtype=np.float64)
+        return cls(array[:, 0], array[:, 1])
+
+
 @total_ordering
 class OrderBookMessage(namedtuple("_OrderBookMessage", "type, content, timestamp")):
     type: OrderBookMessageType
@@ -42,6 +69,10 @@ class OrderBookMessage(namedtuple("_OrderBookMessage", "type, content, timestamp
         else:
             return -1
 
+    @property
+    def has_first_update_id(self) -> bool:
+        return self.type is OrderBookMessageType.DIFF and "first_update_id" in self.content
+
     @property
     def trade_id(self) -> int:
         if self.type is OrderBookMessageType.TRADE:
@@ -64,6 +95,24 @@ class OrderBookMessage(namedtuple("_OrderBookMessage", "type, content, timestamp
             OrderBookRow(float(price), float(amount), self.update_id) for price, amount, *trash in self.content["bids"]
         ]
 
+    @cached_property
+    def ask_columns(self) -> OrderBookColumns:
+        """
+        The asks parsed once into parallel price and amount arrays, for `OrderBook.apply_diff_columns`.
+        """
+        if type(self).asks is not OrderBookMessage.asks:
+            return OrderBookColumns.from_rows([(row.price, row.amount) for row in self.asks])
+        return OrderBookColumns.from_rows(self.content["asks"])
+
+    @cached_property
+    def bid_columns(self) -> OrderBookColumns:
+        """
+        The bids parsed once into parallel price and amount arrays, for `OrderBook.apply_diff_columns`.
+        """
+        if type(self).bids is not OrderBookMessage.bids:
+            return OrderBookColumns.from_rows([(row.price, row.amount) for row in self.bids])
+        return OrderBookColumns.from_rows(self.content["bids"])
+
     @property
     def has_update_id(self) -> bool:
         return self.type in {OrderBookMessageType.DIFF, OrderBookMessageType.SNAPSHOT}
@@ -1,5 +1,7 @@
 # distutils: language=c++
 
+from collections import namedtuple
+
 cdef class OrderBookQueryResult:
     def __cinit__(self, double query_price, double query_volume, double result_price, double result_volume):
         self.query_price = query_price
@@ -14,3 +16,12 @@ cdef class ClientOrderBookQueryResult:
         self.query_volume = query_volume
         self.result_price = result_price
         self.result_volume = result_volume
+
+
+class OrderBookVolumesQueryResult(namedtuple("_OrderBookVolumesQueryResult",
+                                             "query_volumes, result_prices, result_vwaps, result_volumes")):
+    """
+    Result of a depth query for several volumes. Each field is a float64 NumPy array with one value per queried
+    volume, in the same order as the query volumes.
+    """
+    pass
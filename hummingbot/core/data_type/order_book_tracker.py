@@ -3,7 +3,7 @@ import logging
 import time
 from collections import defaultdict, deque
 from enum import Enum
-from typing import Deque, Dict, List, Optional, Tuple
+from typing import Callable, Deque, Dict, List, NamedTuple, Optional, Tuple
 
 import pandas as pd
 
@@ -12,7 +12,7 @@ from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.event.events import OrderBookTradeEvent
-from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.async_utils import safe_ensure_future, safe_gather
 from hummingbot.logger import HummingbotLogger
 
 
@@ -21,8 +21,34 @@ class OrderBookTrackerDataSourceType(Enum):
     EXCHANGE_API = 3
 
 
+class OrderBookDiffMetrics(NamedTuple):
+    queue_depth: int
+    diffs_applied_directly: int
+    diffs_queued: int
+    last_lag: float
+    max_lag: float
+    sequence_gaps: int
+
+
+class OrderBookDiffDispatcher:
+    """
+    Stands in for the diff stream queue handed to the data source in direct dispatch mode. The data sources only call
+    `put` or `put_nowait` on it, and each diff is dispatched to its trading pair right away.
+    """
+
+    def __init__(self, dispatch: Callable[[OrderBookMessage], None]):
+        self._dispatch = dispatch
+
+    def put_nowait(self, message: OrderBookMessage):
+        self._dispatch(message)
+
+    async def put(self, message: OrderBookMessage):
+        self._dispatch(message)
+
+
 class OrderBookTracker:
     PAST_DIFF_WINDOW_SIZE: int = 32
+    RESYNC_MIN_INTERVAL: float = 10.0
     _obt_logger: Optional[HummingbotLogger] = None
 
     @classmethod
@@ -31,11 +57,36 @@ class OrderBookTracker:
             cls._obt_logger = logging.getLogger(__name__)
         return cls._obt_logger
 
-    def __init__(self, data_source: OrderBookTrackerDataSource, trading_pairs: List[str], domain: Optional[str] = None):
+    def __init__(self,
+                 data_source: OrderBookTrackerDataSource,
+                 trading_pairs: List[str],
+                 domain: Optional[str] = None,
+                 order_book_max_depth: Optional[int] = None,
+                 order_book_depth_margin: Optional[int] = None,
+                 parallel_init: bool = False,
+                 direct_diff_dispatch: bool = False,
+                 resync_on_gap: bool = False):
+        """
+        :param parallel_init: fetch the initial snapshots of all trading pairs concurrently instead of one per
+            second. Only enable it when the data source sends its snapshot requests through the connector's
+            AsyncThrottler, which then paces them.
+        :param direct_diff_dispatch: have the data source hand each diff straight to its trading pair instead of going
+            through the diff stream queue and the diff router. The diff is applied right away when no earlier message
+            of the pair is waiting to be processed, and queued for `_track_single_book` otherwise.
+        :param resync_on_gap: request a new snapshot of a single order book when a diff does not follow the last
+            update applied to it, as decided by the data source `is_sequence_gap`. Resyncs of a trading pair are at
+            least `RESYNC_MIN_INTERVAL` seconds apart.
+        """
         self._domain: Optional[str] = domain
+        self._parallel_init: bool = parallel_init
+        self._direct_diff_dispatch: bool = direct_diff_dispatch
+        self._resync_on_gap: bool = resync_on_gap
+        self._order_book_max_depth: Optional[int] = order_book_max_depth
+        self._order_book_depth_margin: Optional[int] = order_book_depth_margin
         self._data_source: OrderBookTrackerDataSource = data_source
         self._trading_pairs: List[str] = trading_pairs
         self._order_books_initialized: asyncio.Event = asyncio.Event()
+        self._order_books_ready: Dict[str, asyncio.Event] = defaultdict(asyncio.Event)
         self._tracking_tasks: Dict[str, asyncio.Task] = {}
         self._order_books: Dict[str, OrderBook] = {}
         self._tracking_message_queues: Dict[str, asyncio.Queue] = {}
@@ -45,6 +96,14 @@ class OrderBookTracker:
         self._order_book_trade_stream: asyncio.Queue = asyncio.Queue()
         self._ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
         self._saved_message_queues: Dict[str, Deque[OrderBookMessage]] = defaultdict(lambda: deque(maxlen=1000))
+        self._diffs_applied_directly: Dict[str, int] = defaultdict(int)
+        self._diffs_queued: Dict[str, int] = defaultdict(int)
+        self._diff_dispatch_times: Dict[str, Deque[float]] = defaultdict(deque)
+        self._last_diff_lags: Dict[str, float] = defaultdict(float)
+        self._max_diff_lags: Dict[str, float] = defaultdict(float)
+        self._sequence_gaps: Dict[str, int] = defaultdict(int)
+        self._last_resync_timestamps: Dict[str, float] = {}
+        self._resync_tasks: Dict[str, asyncio.Task] = {}
 
         self._emit_trade_event_task: Optional[asyncio.Task] = None
         self._init_order_books_task: Optional[asyncio.Task] = None
@@ -68,6 +127,13 @@ class OrderBookTracker:
     def ready(self) -> bool:
         return self._order_books_initialized.is_set()
 
+    @property
+    def ready_trading_pairs(self) -> List[str]:
+        return [trading_pair for trading_pair in self._trading_pairs if self.is_order_book_ready(trading_pair)]
+
+    def is_order_book_ready(self, trading_pair: str) -> bool:
+        return trading_pair in self._order_books_ready and self._order_books_ready[trading_pair].is_set()
+
     @property
     def snapshot(self) -> Dict[str, Tuple[pd.DataFrame, pd.DataFrame]]:
         return {
@@ -75,6 +141,35 @@ class OrderBookTracker:
             for trading_pair, order_book in self._order_books.items()
         }
 
+    def diff_metrics(self, trading_pair: str) -> OrderBookDiffMetrics:
+        """
+        Diff processing statistics of a trading pair. The lags are the seconds queued diffs waited between their
+        dispatch and their application, and are only measured in direct dispatch mode.
+        """
+        message_queue: Optional[asyncio.Queue] = self._tracking_message_queues.get(trading_pair)
+        return OrderBookDiffMetrics(
+            queue_depth=len(self._saved_message_queues[trading_pair]) + (message_queue.qsize() if message_queue else 0),
+            diffs_applied_directly=self._diffs_applied_directly[trading_pair],
+            diffs_queued=self._diffs_queued[trading_pair],
+            last_lag=self._last_diff_lags[trading_pair],
+            max_lag=self._max_diff_lags[trading_pair],
+            sequence_gaps=self._sequence_gaps[trading_pair],
+        )
+
+    @property
+    def order_book_max_depth(self) -> Optional[int]:
+        return self._order_book_max_depth
+
+    def set_order_book_max_depth(self, max_depth: Optional[int], depth_margin: Optional[int] = None):
+        """
+        Bounds the number of levels kept by every tracked order book, including the ones already initialized
+        (see `OrderBook.set_max_depth`).
+        """
+        self._order_book_max_depth = max_depth
+        self._order_book_depth_margin = depth_margin
+        for order_book in self._order_books.values():
+            order_book.set_max_depth(max_depth, depth_margin)
+
     def start(self):
         self.stop()
         self._init_order_books_task = safe_ensure_future(
@@ -83,8 +178,10 @@ class OrderBookTracker:
         self._emit_trade_event_task = safe_ensure_future(
             self._emit_trade_event_loop()
         )
+        diff_output = (OrderBookDiffDispatcher(self._dispatch_diff_message) if self._direct_diff_dispatch
+                       else self._order_book_diff_stream)
         self._order_book_diff_listener_task = safe_ensure_future(
-            self._data_source.listen_for_order_book_diffs(self._ev_loop, self._order_book_diff_stream)
+            self._data_source.listen_for_order_book_diffs(self._ev_loop, diff_output)
         )
         self._order_book_trade_listener_task = safe_ensure_future(
             self._data_source.listen_for_trades(self._ev_loop, self._order_book_trade_stream)
@@ -95,9 +192,10 @@ class OrderBookTracker:
         self._order_book_stream_listener_task = safe_ensure_future(
             self._data_source.listen_for_subscriptions()
         )
-        self._order_book_diff_router_task = safe_ensure_future(
-            self._order_book_diff_router()
-        )
+        if not self._direct_diff_dispatch:
+            self._order_book_diff_router_task = safe_ensure_future(
+                self._order_book_diff_router()
+            )
         self._order_book_snapshot_router_task = safe_ensure_future(
             self._order_book_snapshot_router()
         )
@@ -137,11 +235,19 @@ class OrderBookTracker:
             for _, task in self._tracking_tasks.items():
                 task.cancel()
             self._tracking_tasks.clear()
+        for task in self._resync_tasks.values():
+            task.cancel()
+        self._resync_tasks.clear()
         self._order_books_initialized.clear()
+        for order_book_ready in self._order_books_ready.values():
+            order_book_ready.clear()
 
     async def wait_ready(self):
         await self._order_books_initialized.wait()
 
+    async def wait_order_book_ready(self, trading_pair: str):
+        await self._order_books_ready[trading_pair].wait()
+
     async def _update_last_trade_prices_loop(self):
         '''
         Updates last trade price for all order books through REST API, it is to initiate last_trade_price and as
@@ -170,21 +276,31 @@ class OrderBookTracker:
                 await asyncio.sleep(30)
 
     async def _initial_order_book_for_trading_pair(self, trading_pair: str) -> OrderBook:
-        return await self._data_source.get_new_order_book(trading_pair)
+        order_book = await self._data_source.get_new_order_book(trading_pair)
+        if self._order_book_max_depth is not None:
+            order_book.set_max_depth(self._order_book_max_depth, self._order_book_depth_margin)
+        return order_book
 
     async def _init_order_books(self):
         """
         Initialize order books
         """
-        for index, trading_pair in enumerate(self._trading_pairs):
-            self._order_books[trading_pair] = await self._initial_order_book_for_trading_pair(trading_pair)
-            self._tracking_message_queues[trading_pair] = asyncio.Queue()
-            self._tracking_tasks[trading_pair] = safe_ensure_future(self._track_single_book(trading_pair))
-            self.logger().info(f"Initialized order book for {trading_pair}. "
-                               f"{index + 1}/{len(self._trading_pairs)} completed.")
-            await self._sleep(delay=1)
+        if self._parallel_init:
+            await safe_gather(*[self._init_order_book(trading_pair) for trading_pair in self._trading_pairs])
+        else:
+            for trading_pair in self._trading_pairs:
+                await self._init_order_book(trading_pair)
+                await self._sleep(delay=1)
         self._order_books_initialized.set()
 
+    async def _init_order_book(self, trading_pair: str):
+        self._order_books[trading_pair] = await self._initial_order_book_for_trading_pair(trading_pair)
+        self._tracking_message_queues[trading_pair] = asyncio.Queue()
+        self._tracking_tasks[trading_pair] = safe_ensure_future(self._track_single_book(trading_pair))
+        self._order_books_ready[trading_pair].set()
+        self.logger().info(f"Initialized order book for {trading_pair}. "
+                           f"{len(self.ready_trading_pairs)}/{len(self._trading_pairs)} completed.")
+
     async def _order_book_diff_router(self):
         """
         Routes the real-time order book diff messages to the correct order book.
@@ -234,6 +350,77 @@ class OrderBookTracker:
                 )
                 await asyncio.sleep(5.0)
 
+    def _dispatch_diff_message(self, ob_message: OrderBookMessage):
+        """
+        Routes a diff message to its order book without going through the diff stream queue, applying it right away
+        when no other message of the trading pair is pending.
+        """
+        try:
+            trading_pair: str = ob_message.trading_pair
+
+            if trading_pair not in self._tracking_message_queues:
+                # Save diff messages received before snapshots are ready
+                self._saved_message_queues[trading_pair].append(ob_message)
+                return
+            message_queue: asyncio.Queue = self._tracking_message_queues[trading_pair]
+            order_book: OrderBook = self._order_books[trading_pair]
+
+            if order_book.snapshot_uid > ob_message.update_id:
+                return
+            if message_queue.empty() and len(self._saved_message_queues[trading_pair]) == 0:
+                self._apply_diff_message(trading_pair, order_book, ob_message)
+                self._diffs_applied_directly[trading_pair] += 1
+            else:
+                message_queue.put_nowait(ob_message)
+                self._diff_dispatch_times[trading_pair].append(time.perf_counter())
+                self._diffs_queued[trading_pair] += 1
+        except Exception:
+            self.logger().network(
+                "Unexpected error dispatching order book diff message.",
+                exc_info=True,
+                app_warning_msg="Unexpected error dispatching order book diff message."
+            )
+
+    def _apply_diff_message(self, trading_pair: str, order_book: OrderBook, message: OrderBookMessage):
+        if self._resync_on_gap and self._is_sequence_gap(order_book, message):
+            self._sequence_gaps[trading_pair] += 1
+            self._schedule_resync(trading_pair)
+        order_book.apply_diff_columns(message.bid_columns, message.ask_columns, message.update_id)
+        self._past_diffs_windows[trading_pair].append(message)
+
+    def _is_sequence_gap(self, order_book: OrderBook, message: OrderBookMessage) -> bool:
+        last_update_id = max(order_book.snapshot_uid, order_book.last_diff_uid)
+        return last_update_id > 0 and self._data_source.is_sequence_gap(last_update_id=last_update_id, message=message)
+
+    def _schedule_resync(self, trading_pair: str):
+        now = time.perf_counter()
+        if (trading_pair in self._resync_tasks
+                or now - self._last_resync_timestamps.get(trading_pair, -self.RESYNC_MIN_INTERVAL)
+                < self.RESYNC_MIN_INTERVAL):
+            return
+        self._last_resync_timestamps[trading_pair] = now
+        self._resync_tasks[trading_pair] = safe_ensure_future(self._resync_order_book(trading_pair))
+
+    async def _resync_order_book(self, trading_pair: str):
+        """
+        Fetches a new snapshot for an order book that missed diffs. The snapshot is queued behind the pending
+        messages of the trading pair and restored with the diffs received after it.
+        """
+        try:
+            self.logger().info(f"Order book diffs missing for {trading_pair}, requesting a new snapshot.")
+            snapshot: OrderBookMessage = await self._data_source.get_order_book_snapshot_message(trading_pair)
+            self._tracking_message_queues[trading_pair].put_nowait(snapshot)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self.logger().network(
+                f"Unexpected error fetching order book snapshot for {trading_pair}.",
+                exc_info=True,
+                app_warning_msg="Unexpected error fetching order book snapshot."
+            )
+        finally:
+            self._resync_tasks.pop(trading_pair, None)
+
     async def _order_book_snapshot_router(self):
         """
         Route the real-time order book snapshot messages to the correct order book.
@@ -264,16 +451,22 @@ class OrderBookTracker:
         while True:
             try:
                 saved_messages: Deque[OrderBookMessage] = self._saved_message_queues[trading_pair]
+                dispatch_times: Deque[float] = self._diff_dispatch_times[trading_pair]
 
                 # Process saved messages first if there are any
                 if len(saved_messages) > 0:
                     message = saved_messages.popleft()
+                    is_queued_message = False
                 else:
                     message = await message_queue.get()
+                    is_queued_message = True
 
                 if message.type is OrderBookMessageType.DIFF:
-                    order_book.apply_diffs(message.bids, message.asks, message.update_id)
-                    past_diffs_window.append(message)
+                    if is_queued_message and len(dispatch_times) > 0:
+                        lag = time.perf_counter() - dispatch_times.popleft()
+                        self._last_diff_lags[trading_pair] = lag
+                        self._max_diff_lags[trading_pair] = max(self._max_diff_lags[trading_pair], lag)
+                    self._apply_diff_message(trading_pair, order_book, message)
                     diff_messages_accepted += 1
 
                     # Output some statistics periodically.
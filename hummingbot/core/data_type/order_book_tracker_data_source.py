@@ -67,6 +67,31 @@ class OrderBookTrackerDataSource(metaclass=ABCMeta):
         order_book.apply_snapshot(snapshot_msg.bids, snapshot_msg.asks, snapshot_msg.update_id)
         return order_book
 
+    async def get_order_book_snapshot_message(self, trading_pair: str) -> OrderBookMessage:
+        """
+        Requests the current order book of a trading pair from the exchange
+
+        :param trading_pair: the trading pair for which the order book has to be retrieved
+
+        :return: a snapshot message with the exchange order book
+        """
+        return await self._order_book_snapshot(trading_pair=trading_pair)
+
+    def is_sequence_gap(self, last_update_id: int, message: OrderBookMessage) -> bool:
+        """
+        Used by the order book tracker, when it resyncs the order books on gaps, to detect missing diffs.
+        The default implementation is for exchanges whose diffs cover a range of update IDs (from `first_update_id`
+        to `update_id`) that starts right after the previous diff, like Binance spot, Gate.io and KuCoin. Diffs
+        without `first_update_id` are never considered a gap. Exchanges chaining the diffs differently (e.g. Binance
+        perpetual, which links each diff to the previous diff update ID) have to override it before enabling resyncs.
+
+        :param last_update_id: the last update ID applied to the order book
+        :param message: the diff message about to be applied
+
+        :return: True if there are diffs missing between the order book and the message
+        """
+        return message.has_first_update_id and message.first_update_id > last_update_id + 1
+
     async def listen_for_subscriptions(self):
         """
         Connects to the trade events and order diffs websocket endpoints and listens to the messages sent by the
@@ -230,17 +255,19 @@ class OrderBookTrackerDataSource(metaclass=ABCMeta):
         pass
 
     async def _process_websocket_messages(self, websocket_assistant: WSAssistant):
-        async for ws_response in websocket_assistant.iter_messages():
-            data: Dict[str, Any] = ws_response.data
-            if data is not None:  # data will be None when the websocket is disconnected
-                channel: str = self._channel_originating_message(event_message=data)
-                valid_channels = self._get_messages_queue_keys()
-                if channel in valid_channels:
-                    self._message_queue[channel].put_nowait(data)
-                else:
-                    await self._process_message_for_unknown_channel(
-                        event_message=data, websocket_assistant=websocket_assistant
-                    )
+        # The messages received in a burst are read and routed together, without a round trip per message
+        async for ws_responses in websocket_assistant.iter_message_batches():
+            valid_channels = self._get_messages_queue_keys()
+            for ws_response in ws_responses:
+                data: Dict[str, Any] = ws_response.data
+                if data is not None:  # data will be None when the websocket is disconnected
+                    channel: str = self._channel_originating_message(event_message=data)
+                    if channel in valid_channels:
+                        self._message_queue[channel].put_nowait(data)
+                    else:
+                        await self._process_message_for_unknown_channel(
+                            event_message=data, websocket_assistant=websocket_assistant
+                        )
 
     def _get_messages_queue_keys(self) -> List[str]:
         return [self._snapshot_messages_queue_key, self._diff_messages_queue_key, self._trade_messages_queue_key]
@@ -0,0 +1,11 @@
+from .event_listener cimport EventListener
+
+
+cdef class BatchEventListener(EventListener):
+    cdef:
+        dict _pending_events
+        object _flush_handle
+        double _flush_interval
+        size_t _max_batch_size
+    cdef c_call(self, object arg)
+    cdef c_flush(self)
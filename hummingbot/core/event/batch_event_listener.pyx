@@ -0,0 +1,87 @@
+import asyncio
+import logging
+from typing import List
+
+from libc.stdint cimport int64_t
+
+from hummingbot.core.event.event_listener cimport EventListener
+from hummingbot.core.pubsub cimport PubSub
+from hummingbot.logger import HummingbotLogger
+
+bel_logger = None
+
+
+cdef class BatchEventListener(EventListener):
+    """
+    Event listener that collects the events it receives and processes them in batches, instead of one call per event.
+
+    The events are grouped by event tag and publisher, and `process_events()` is called once per group with the
+    events in the order they were triggered. `current_event_tag` and `current_event_caller` are set during the call.
+    The pending events are delivered on the next event loop iteration, or after `flush_interval` seconds if it is
+    set, and right away once a group reaches `max_batch_size` events.
+    """
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        global bel_logger
+        if bel_logger is None:
+            bel_logger = logging.getLogger(__name__)
+        return bel_logger
+
+    def __init__(self, flush_interval: float = 0, max_batch_size: int = 0):
+        super().__init__()
+        self._pending_events = {}
+        self._flush_handle = None
+        self._flush_interval = flush_interval
+        self._max_batch_size = max_batch_size
+
+    def __call__(self, arg: any):
+        self.process_events([arg])
+
+    def process_events(self, events: List[any]):
+        raise NotImplementedError
+
+    @property
+    def pending_events_count(self) -> int:
+        return sum(len(events) for events in self._pending_events.values())
+
+    def flush(self):
+        self.c_flush()
+
+    cdef c_call(self, object arg):
+        key = (self._current_event_tag, self._current_event_caller)
+        events = self._pending_events.get(key)
+        if events is None:
+            events = []
+            self._pending_events[key] = events
+        events.append(arg)
+
+        if 0 < self._max_batch_size <= len(events):
+            self.c_flush()
+        elif self._flush_handle is None:
+            loop = asyncio.get_event_loop()
+            if self._flush_interval > 0:
+                self._flush_handle = loop.call_later(self._flush_interval, self.flush)
+            else:
+                self._flush_handle = loop.call_soon(self.flush)
+
+    cdef c_flush(self):
+        cdef:
+            int64_t previous_event_tag = self._current_event_tag
+            PubSub previous_event_caller = self._current_event_caller
+
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        pending_events = self._pending_events
+        self._pending_events = {}
+
+        for (event_tag, event_caller), events in pending_events.items():
+            self.c_set_event_info(event_tag, event_caller)
+            try:
+                self.process_events(events)
+            except Exception:
+                self.logger().error(f"Unexpected error while processing a batch of events {event_tag}.",
+                                    exc_info=True)
+        # A flush triggered by max_batch_size runs within the PubSub call of the last event
+        self.c_set_event_info(previous_event_tag, previous_event_caller)
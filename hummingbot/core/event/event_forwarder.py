@@ -1,7 +1,8 @@
 #!/usr/bin/env python
 
-from typing import Callable
+from typing import Callable, List
 
+from hummingbot.core.event.batch_event_listener import BatchEventListener
 from hummingbot.core.event.event_listener import EventListener
 from hummingbot.core.pubsub import PubSub
 
@@ -22,3 +23,15 @@ class SourceInfoEventForwarder(EventListener):
 
     def __call__(self, arg: any):
         self._to_function(self.current_event_tag, self.current_event_caller, arg)
+
+
+class BatchEventForwarder(BatchEventListener):
+    def __init__(self,
+                 to_function: Callable[[int, PubSub, List[any]], None],
+                 flush_interval: float = 0,
+                 max_batch_size: int = 0):
+        super().__init__(flush_interval=flush_interval, max_batch_size=max_batch_size)
+        self._to_function: Callable[[int, PubSub, List[any]], None] = to_function
+
+    def process_events(self, events: List[any]):
+        self._to_function(self.current_event_tag, self.current_event_caller, events)
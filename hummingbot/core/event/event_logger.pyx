@@ -10,17 +10,28 @@ from typing import (
 from hummingbot.core.event.event_listener cimport EventListener
 from hummingbot.core.event.events import OrderFilledEvent
 
+DEFAULT_MAX_EVENTS_PER_TYPE = 50
+
+
 cdef class EventLogger(EventListener):
-    def __init__(self, event_source: Optional[str] = None):
+    def __init__(self, event_source: Optional[str] = None, max_events: Optional[int] = None):
+        """
+        :param event_source: name of the source the logged events come from
+        :param max_events: when set, every event log (order fill events included) works as a ring buffer keeping
+        only the most recent `max_events` events. When not set, order fill events are all kept.
+        """
         super().__init__()
         self._event_source = event_source
+        self._max_events = max_events
         # We limit the amount of events we keep reference to the most recent ones
-        # But we keep all references to order fill events, because they are required for PnL calculation
-        self._generic_logged_events = deque(maxlen=50)
-        self._order_filled_logged_events = deque()
+        # But unless a max size is configured we keep all references to order fill events, because they are
+        # required for PnL calculation
+        self._generic_logged_events = deque(maxlen=max_events or DEFAULT_MAX_EVENTS_PER_TYPE)
+        self._order_filled_logged_events = deque(maxlen=max_events)
+        # Index of the logged events by event type
         self._logged_events = {OrderFilledEvent: self._order_filled_logged_events}
+        # Futures waiting for an event, by event type
         self._waiting = {}
-        self._wait_returns = {}
 
     @property
     def event_log(self) -> List[any]:
@@ -30,34 +41,47 @@ cdef class EventLogger(EventListener):
     def event_source(self) -> str:
         return self._event_source
 
+    @property
+    def max_events(self) -> Optional[int]:
+        return self._max_events
+
+    def events_of_type(self, event_type) -> List[any]:
+        return list(self._logged_events.get(event_type, ()))
+
     def clear(self):
         self._generic_logged_events.clear()
-        self._order_filled_logged_events.clear()
+        for logged_events in self._logged_events.values():
+            logged_events.clear()
 
     async def wait_for(self, event_type, timeout_seconds: float = 180):
-        notifier = asyncio.Event()
-        self._waiting[notifier] = event_type
-
-        async with timeout(timeout_seconds):
-            await notifier.wait()
+        future = asyncio.get_event_loop().create_future()
+        self._waiting.setdefault(event_type, []).append(future)
 
-        retval = self._wait_returns.get(notifier)
-        if notifier in self._wait_returns:
-            del self._wait_returns[notifier]
-        del self._waiting[notifier]
-        return retval
+        try:
+            async with timeout(timeout_seconds):
+                return await future
+        finally:
+            waiters = self._waiting.get(event_type)
+            if waiters is not None and future in waiters:
+                waiters.remove(future)
+                if len(waiters) == 0:
+                    del self._waiting[event_type]
 
     def __call__(self, event_object):
         self.c_call(event_object)
 
     cdef c_call(self, object event_object):
-        self._logged_events.get(type(event_object), self._generic_logged_events).append(event_object)
         event_object_type = type(event_object)
+        logged_events = self._logged_events.get(event_object_type)
+        if logged_events is None:
+            logged_events = deque(maxlen=self._max_events or DEFAULT_MAX_EVENTS_PER_TYPE)
+            self._logged_events[event_object_type] = logged_events
+        logged_events.append(event_object)
+        if event_object_type is not OrderFilledEvent:
+            self._generic_logged_events.append(event_object)
 
-        should_notify = []
-        for notifier, waiting_event_type in self._waiting.items():
-            if event_object_type is waiting_event_type:
-                should_notify.append(notifier)
-                self._wait_returns[notifier] = event_object
-        for notifier in should_notify:
-            notifier.set()
+        waiters = self._waiting.pop(event_object_type, None)
+        if waiters is not None:
+            for future in waiters:
+                if not future.done():
+                    future.set_result(event_object)
@@ -0,0 +1,255 @@
+from collections import deque
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+# Upper bounds (in milliseconds) of the latency histogram buckets
+LATENCY_BUCKETS_MS: Tuple[float, ...] = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 5000, float("inf"))
+# URL path segments at least this long are considered tokens (e.g. listen keys) and are not kept in the stream keys
+MIN_TOKEN_LENGTH = 32
+
+
+class DurationSamples:
+    """
+    Durations (in seconds) of an operation. The most recent `window_size` samples are kept to compute the percentiles
+    and the histogram, while the counters cover the whole run.
+    """
+
+    def __init__(self, window_size: int = 1000):
+        self._durations = deque(maxlen=window_size)
+        self._count = 0
+        self._total = 0.0
+        self._max = 0.0
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def average(self) -> float:
+        return self._total / self._count if self._count > 0 else 0.0
+
+    @property
+    def max(self) -> float:
+        return self._max
+
+    @property
+    def recent_average(self) -> float:
+        return sum(self._durations) / len(self._durations) if len(self._durations) > 0 else 0.0
+
+    def record(self, duration: float):
+        self._durations.append(duration)
+        self._count += 1
+        self._total += duration
+        self._max = max(self._max, duration)
+
+    def percentile(self, percentile: float) -> float:
+        """
+        :param percentile: percentile to calculate, between 0 and 100
+        :return: the duration percentile (in seconds) over the recent samples
+        """
+        if len(self._durations) == 0:
+            return 0.0
+        durations = sorted(self._durations)
+        index = min(len(durations) - 1, int(len(durations) * percentile / 100))
+        return durations[index]
+
+    def histogram(self) -> Dict[float, int]:
+        """
+        :return: the number of recent samples per duration bucket, keyed by the bucket upper bound in milliseconds
+        """
+        histogram = {bucket: 0 for bucket in LATENCY_BUCKETS_MS}
+        for duration in self._durations:
+            duration_ms = duration * 1e3
+            for bucket in LATENCY_BUCKETS_MS:
+                if duration_ms <= bucket:
+                    histogram[bucket] += 1
+                    break
+        return histogram
+
+    def reset(self):
+        self._durations.clear()
+        self._count = 0
+        self._total = 0.0
+        self._max = 0.0
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "count": self._count,
+            "avg_ms": self.average * 1e3,
+            "p50_ms": self.percentile(50) * 1e3,
+            "p99_ms": self.percentile(99) * 1e3,
+            "max_ms": self._max * 1e3,
+        }
+
+
+class RESTEndpointMetrics:
+    """
+    Metrics of the REST requests sent with a throttler limit id. The request latency is split in the time waiting for
+    the throttler, the network time (sending the request and reading the response) and the response decoding time.
+    """
+
+    def __init__(self, limit_id: str):
+        self.limit_id = limit_id
+        self.throttle_wait = DurationSamples()
+        self.network_time = DurationSamples()
+        self.decode_time = DurationSamples()
+        self.errors_count = 0
+        self.request_bytes = 0
+        self.response_bytes = 0
+
+    def record_response(self, network_time: float, request_bytes: int, response_bytes: int, is_error: bool):
+        self.network_time.record(network_time)
+        self.request_bytes += request_bytes
+        self.response_bytes += response_bytes
+        if is_error:
+            self.errors_count += 1
+
+    def reset(self):
+        self.throttle_wait.reset()
+        self.network_time.reset()
+        self.decode_time.reset()
+        self.errors_count = 0
+        self.request_bytes = 0
+        self.response_bytes = 0
+
+
+class WSStreamMetrics:
+    """
+    Metrics of the messages received through the websocket connections to a URL
+    """
+
+    def __init__(self, url: str):
+        self.url = url
+        self.inter_arrival = DurationSamples()
+        self.decode_time = DurationSamples()
+        self.messages_count = 0
+        self.received_bytes = 0
+        self._last_message_timestamp: Optional[float] = None
+
+    @property
+    def messages_rate(self) -> float:
+        """
+        :return: the number of messages per second received recently
+        """
+        average_inter_arrival = self.inter_arrival.recent_average
+        return 1 / average_inter_arrival if average_inter_arrival > 0 else 0.0
+
+    def record_message(self, timestamp: float, decode_time: float, size: int):
+        """
+        :param timestamp: monotonic time when the message was received
+        :param decode_time: time in seconds spent decoding the message
+        :param size: size of the message
+        """
+        if self._last_message_timestamp is not None:
+            self.inter_arrival.record(timestamp - self._last_message_timestamp)
+        self._last_message_timestamp = timestamp
+        self.decode_time.record(decode_time)
+        self.messages_count += 1
+        self.received_bytes += size
+
+    def reset_inter_arrival(self):
+        """
+        Called when a new connection is established, so the reconnection time is not taken as an inter arrival time
+        """
+        self._last_message_timestamp = None
+
+    def reset(self):
+        self.inter_arrival.reset()
+        self.decode_time.reset()
+        self.messages_count = 0
+        self.received_bytes = 0
+        self._last_message_timestamp = None
+
+
+class NetworkMetrics:
+    """
+    Collects the latency and throughput metrics of the REST requests (keyed by throttler limit id) and the websocket
+    streams (keyed by URL) of all the connectors. The throttler records the wait time of the requests, the
+    `RESTAssistant` the network and decoding times, and the `WSConnection` the websocket messages.
+    """
+
+    _shared_instance: Optional["NetworkMetrics"] = None
+
+    @classmethod
+    def get_instance(cls) -> "NetworkMetrics":
+        if cls._shared_instance is None:
+            cls._shared_instance = NetworkMetrics()
+        return cls._shared_instance
+
+    def __init__(self):
+        self._rest_endpoints: Dict[str, RESTEndpointMetrics] = {}
+        self._ws_streams: Dict[str, WSStreamMetrics] = {}
+
+    @property
+    def rest_endpoints(self) -> Dict[str, RESTEndpointMetrics]:
+        return dict(self._rest_endpoints)
+
+    @property
+    def ws_streams(self) -> Dict[str, WSStreamMetrics]:
+        return dict(self._ws_streams)
+
+    def rest_endpoint(self, limit_id: str) -> RESTEndpointMetrics:
+        metrics = self._rest_endpoints.get(limit_id)
+        if metrics is None:
+            metrics = RESTEndpointMetrics(limit_id=limit_id)
+            self._rest_endpoints[limit_id] = metrics
+        return metrics
+
+    def ws_stream(self, url: str) -> WSStreamMetrics:
+        url = self.ws_stream_key(url)
+        metrics = self._ws_streams.get(url)
+        if metrics is None:
+            metrics = WSStreamMetrics(url=url)
+            self._ws_streams[url] = metrics
+        return metrics
+
+    @staticmethod
+    def ws_stream_key(url: str) -> str:
+        """
+        :return: the URL without the query and without the path segments that look like tokens, so the streams
+            authenticated with a listen key are grouped and the keys are not displayed nor exported
+        """
+        parsed_url = urlparse(url)
+        path = "/".join("*" if len(segment) >= MIN_TOKEN_LENGTH else segment for segment in parsed_url.path.split("/"))
+        return f"{parsed_url.scheme}://{parsed_url.netloc}{path}"
+
+    def record_throttle_wait(self, limit_id: str, duration: float):
+        self.rest_endpoint(limit_id).throttle_wait.record(duration)
+
+    def reset(self):
+        """
+        Discards the collected metrics. The connections in use keep a reference to their metrics objects, so those are
+        reset instead of being removed.
+        """
+        for metrics in self._rest_endpoints.values():
+            metrics.reset()
+        for metrics in self._ws_streams.values():
+            metrics.reset()
+
+    def rest_endpoints_rows(self) -> List[Dict[str, Any]]:
+        rows = []
+        for limit_id, metrics in sorted(self._rest_endpoints.items()):
+            row = {"limit_id": limit_id,
+                   "requests": metrics.network_time.count,
+                   "errors": metrics.errors_count,
+                   "request_bytes": metrics.request_bytes,
+                   "response_bytes": metrics.response_bytes}
+            for name, samples in (("throttle_wait", metrics.throttle_wait),
+                                  ("network", metrics.network_time),
+                                  ("decode", metrics.decode_time)):
+                row.update({f"{name}_{key}": value for key, value in samples.summary().items() if key != "count"})
+            rows.append(row)
+        return rows
+
+    def ws_streams_rows(self) -> List[Dict[str, Any]]:
+        rows = []
+        for url, metrics in sorted(self._ws_streams.items()):
+            row = {"url": url,
+                   "messages": metrics.messages_count,
+                   "received_bytes": metrics.received_bytes,
+                   "messages_per_second": metrics.messages_rate}
+            for name, samples in (("inter_arrival", metrics.inter_arrival),
+                                  ("decode", metrics.decode_time)):
+                row.update({f"{name}_{key}": value for key, value in samples.summary().items() if key != "count"})
+            rows.append(row)
+        return rows
@@ -17,11 +17,21 @@ ctypedef pair[int64_t, EventListenersCollection] EventsPair
 cdef class PubSub:
     cdef:
         Events _events
+        unordered_set[int64_t] _events_with_dead_listeners
+        dict _listener_death_watches
         object __weakref__
 
     cdef c_log_exception(self, int64_t event_tag, object arg)
     cdef c_add_listener(self, int64_t event_tag, EventListener listener)
     cdef c_remove_listener(self, int64_t event_tag, EventListener listener)
     cdef c_remove_dead_listeners(self, int64_t event_tag)
+    cdef c_on_listener_death(self, int64_t event_tag, object death_watch_key)
     cdef c_get_listeners(self, int64_t event_tag)
     cdef c_trigger_event(self, int64_t event_tag, object arg)
+
+
+cdef class ListenerDeathCallback:
+    cdef:
+        object _pubsub_ref
+        int64_t _event_tag
+        object _death_watch_key
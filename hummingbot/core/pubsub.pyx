@@ -14,7 +14,6 @@ from cython.operator cimport(
 from libcpp.vector cimport vector
 from enum import Enum
 import logging
-import random
 from typing import List
 
 from hummingbot.logger import HummingbotLogger
@@ -26,25 +25,15 @@ class_logger = None
 
 cdef class PubSub:
     """
-    PubSub with weak references. This avoids the lapsed listener problem by periodically performing GC on dead
-    event listener.
+    PubSub with weak references. This avoids the lapsed listener problem by removing the dead event listeners.
 
-    Dead listener is done by calling c_remove_dead_listeners(), which checks whether the listener weak references are
-    alive or not, and removes the dead ones. Each call to c_remove_dead_listeners() takes O(n).
-
-    Here's how the dead listener GC is performed:
-
-    1. c_add_listener():
-       Randomly with ADD_LISTENER_GC_PROBABILITY. This assumes c_add_listener() is called frequently and so it doesn't
-       make sense to do the GC every time.
-    2. c_remove_listener():
-       Every time. This assumes c_remove_listener() is called infrequently.
-    3. c_get_listeners() and c_trigger_event():
-       Every time. Both functions take O(n) already.
+    Every listener is watched by a weak reference with a callback (see ListenerDeathCallback), which flags the event
+    tag as having dead listeners when the listener is garbage collected. The dead listeners of a tag are then removed
+    by c_remove_dead_listeners(), which takes O(n), on the next call to c_get_listeners(), c_trigger_event() or
+    c_remove_listener() for that tag. Triggering an event with no dead listener takes O(live listeners), without any
+    scan.
     """
 
-    ADD_LISTENER_GC_PROBABILITY = 0.005
-
     @classmethod
     def logger(cls) -> HummingbotLogger:
         global class_logger
@@ -52,6 +41,10 @@ cdef class PubSub:
             class_logger = logging.getLogger(__name__)
         return class_logger
 
+    def __cinit__(self, *args, **kwargs):
+        # Set up here rather than in __init__(), which subclasses do not always call
+        self._listener_death_watches = {}
+
     def __init__(self):
         self._events = Events()
 
@@ -84,8 +77,11 @@ cdef class PubSub:
             new_listeners.insert(listener_wrapper)
             self._events.insert(EventsPair(event_tag, new_listeners))
 
-        if random.random() < PubSub.ADD_LISTENER_GC_PROBABILITY:
-            self.c_remove_dead_listeners(event_tag)
+        death_watch_key = (event_tag, listener_weakref)
+        if death_watch_key not in self._listener_death_watches:
+            self._listener_death_watches[death_watch_key] = PyWeakref_NewRef(
+                listener, ListenerDeathCallback(self, event_tag, death_watch_key)
+            )
 
     cdef c_remove_listener(self, int64_t event_tag, EventListener listener):
         cdef:
@@ -100,6 +96,7 @@ cdef class PubSub:
         lit = deref(listeners_ptr).find(listener_wrapper)
         if lit != deref(listeners_ptr).end():
             deref(listeners_ptr).erase(lit)
+        self._listener_death_watches.pop((event_tag, listener_weakref), None)
         self.c_remove_dead_listeners(event_tag)
 
     cdef c_remove_dead_listeners(self, int64_t event_tag):
@@ -109,6 +106,7 @@ cdef class PubSub:
             object listener_weakref
             EventListenersIterator lit
             vector[EventListenersIterator] lit_to_remove
+        self._events_with_dead_listeners.erase(event_tag)
         if it == self._events.end():
             return
         listeners_ptr = address(deref(it).second)
@@ -123,8 +121,13 @@ cdef class PubSub:
         if deref(listeners_ptr).size() < 1:
             self._events.erase(it)
 
+    cdef c_on_listener_death(self, int64_t event_tag, object death_watch_key):
+        self._events_with_dead_listeners.insert(event_tag)
+        self._listener_death_watches.pop(death_watch_key, None)
+
     cdef c_get_listeners(self, int64_t event_tag):
-        self.c_remove_dead_listeners(event_tag)
+        if self._events_with_dead_listeners.count(event_tag) > 0:
+            self.c_remove_dead_listeners(event_tag)
 
         cdef:
             EventsIterator it = self._events.find(event_tag)
@@ -144,7 +147,8 @@ cdef class PubSub:
         return retval
 
     cdef c_trigger_event(self, int64_t event_tag, object arg):
-        self.c_remove_dead_listeners(event_tag)
+        if self._events_with_dead_listeners.count(event_tag) > 0:
+            self.c_remove_dead_listeners(event_tag)
 
         cdef:
             EventsIterator it = self._events.find(event_tag)
@@ -160,6 +164,9 @@ cdef class PubSub:
         for pyref in listeners:
             listener_weafref = <object>pyref.get()
             typed_listener = <object>PyWeakref_GetObject(listener_weafref)
+            # A listener can be garbage collected by one of the listeners called before it
+            if typed_listener is None:
+                continue
             try:
                 typed_listener.c_set_event_info(event_tag, self)
                 typed_listener.c_call(arg)
@@ -167,3 +174,20 @@ cdef class PubSub:
                 self.c_log_exception(event_tag, arg)
             finally:
                 typed_listener.c_set_event_info(0, None)
+
+
+cdef class ListenerDeathCallback:
+    """
+    Weak reference callback telling a PubSub that one of its listeners has been garbage collected. It only keeps a
+    weak reference to the PubSub, so the listeners never keep their publishers alive.
+    """
+
+    def __init__(self, PubSub pubsub, int64_t event_tag, object death_watch_key):
+        self._pubsub_ref = PyWeakref_NewRef(pubsub, None)
+        self._event_tag = event_tag
+        self._death_watch_key = death_watch_key
+
+    def __call__(self, death_watch):
+        pubsub = <object>PyWeakref_GetObject(self._pubsub_ref)
+        if pubsub is not None:
+            (<PubSub>pubsub).c_on_listener_death(self._event_tag, self._death_watch_key)
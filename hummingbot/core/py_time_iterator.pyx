@@ -8,3 +8,9 @@ cdef class PyTimeIterator(TimeIterator):
     cdef c_tick(self, double timestamp):
         TimeIterator.c_tick(self, timestamp)
         self.tick(timestamp)
+
+    def next_event_timestamp(self, timestamp: float) -> float:
+        return TimeIterator.c_next_event_timestamp(self, timestamp)
+
+    cdef double c_next_event_timestamp(self, double timestamp):
+        return self.next_event_timestamp(timestamp)
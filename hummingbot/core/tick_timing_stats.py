@@ -0,0 +1,86 @@
+from collections import deque
+from typing import Dict, Tuple
+
+# Upper bounds (in milliseconds) of the tick duration histogram buckets
+HISTOGRAM_BUCKETS_MS: Tuple[float, ...] = (1, 5, 10, 50, 100, 500, 1000, float("inf"))
+
+
+class TickTimingStats:
+    """
+    Timing statistics of the ticks of a clock child iterator. Durations are kept for the most recent `window_size`
+    ticks, to compute the rolling histogram and percentiles, while the counters cover the whole run.
+    """
+
+    def __init__(self, name: str, window_size: int = 1000):
+        self._name = name
+        self._durations = deque(maxlen=window_size)
+        self._ticks_count = 0
+        self._overruns = 0
+        self._total_duration = 0.0
+        self._max_duration = 0.0
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def ticks_count(self) -> int:
+        return self._ticks_count
+
+    @property
+    def overruns(self) -> int:
+        """
+        Number of ticks that took longer than the clock tick size
+        """
+        return self._overruns
+
+    @property
+    def last_duration(self) -> float:
+        return self._durations[-1] if len(self._durations) > 0 else 0.0
+
+    @property
+    def max_duration(self) -> float:
+        return self._max_duration
+
+    @property
+    def average_duration(self) -> float:
+        return self._total_duration / self._ticks_count if self._ticks_count > 0 else 0.0
+
+    def record(self, duration: float, tick_size: float):
+        self._durations.append(duration)
+        self._ticks_count += 1
+        self._total_duration += duration
+        self._max_duration = max(self._max_duration, duration)
+        if duration > tick_size:
+            self._overruns += 1
+
+    def percentile(self, percentile: float) -> float:
+        """
+        :param percentile: percentile to calculate, between 0 and 100
+        :return: the duration percentile (in seconds) over the recent ticks
+        """
+        if len(self._durations) == 0:
+            return 0.0
+        durations = sorted(self._durations)
+        index = min(len(durations) - 1, int(len(durations) * percentile / 100))
+        return durations[index]
+
+    def histogram(self) -> Dict[float, int]:
+        """
+        :return: the number of recent ticks per duration bucket, keyed by the bucket upper bound in milliseconds
+        """
+        histogram = {bucket: 0 for bucket in HISTOGRAM_BUCKETS_MS}
+        for duration in self._durations:
+            duration_ms = duration * 1e3
+            for bucket in HISTOGRAM_BUCKETS_MS:
+                if duration_ms <= bucket:
+                    histogram[bucket] += 1
+                    break
+        return histogram
+
+    def reset(self):
+        self._durations.clear()
+        self._ticks_count = 0
+        self._overruns = 0
+        self._total_duration = 0.0
+        self._max_duration = 0.0
@@ -8,7 +8,10 @@ cdef class TimeIterator(PubSub):
     cdef:
         double _current_timestamp
         Clock _clock
+        double _tick_interval
+        double _next_tick_timestamp
 
     cdef c_start(self, Clock clock, double timestamp)
     cdef c_stop(self, Clock clock)
     cdef c_tick(self, double timestamp)
+    cdef double c_next_event_timestamp(self, double timestamp)
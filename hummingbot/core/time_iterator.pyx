@@ -1,15 +1,20 @@
 # distutils: language=c++
 from typing import Optional
 
+from libc.math cimport isinf
+
 from hummingbot.core.clock import Clock
 
 NaN = float("nan")
+EVENT_DRIVEN = float("inf")
 
 
 cdef class TimeIterator(PubSub):
     def __init__(self):
         self._current_timestamp = NaN
         self._clock = None
+        self._tick_interval = 0
+        self._next_tick_timestamp = 0
 
     cdef c_start(self, Clock clock, double timestamp):
         self._clock = clock
@@ -25,6 +30,23 @@ cdef class TimeIterator(PubSub):
     def tick(self, timestamp: float):
         self.c_tick(timestamp)
 
+    cdef double c_next_event_timestamp(self, double timestamp):
+        """
+        Used by the clock in fast forward backtest mode to skip the ticks nobody needs.
+
+        :param timestamp: the current clock timestamp
+        :return: the earliest timestamp at which the iterator has to be ticked. Any value up to `timestamp` means
+        the iterator needs the next clock tick, and infinity means it has nothing scheduled.
+        """
+        if self._tick_interval == 0:
+            return timestamp
+        if isinf(self._tick_interval):
+            return self._tick_interval
+        return self._next_tick_timestamp
+
+    def next_event_timestamp(self, timestamp: float) -> float:
+        return self.c_next_event_timestamp(timestamp)
+
     @property
     def current_timestamp(self) -> float:
         return self._current_timestamp
@@ -33,6 +55,21 @@ cdef class TimeIterator(PubSub):
     def clock(self) -> Optional[Clock]:
         return self._clock
 
+    @property
+    def tick_interval(self) -> float:
+        """
+        Minimum time between two ticks of the iterator. 0 means the iterator is ticked on every clock tick, and
+        EVENT_DRIVEN (infinity) means the clock never ticks it.
+        """
+        return self._tick_interval
+
+    @tick_interval.setter
+    def tick_interval(self, value: float):
+        if not value >= 0:
+            raise ValueError(f"Invalid tick interval {value}. The tick interval can't be negative.")
+        self._tick_interval = value
+        self._next_tick_timestamp = 0
+
     def start(self, clock: Clock):
         self.c_start(clock, clock.current_timestamp)
 
@@ -1,8 +1,11 @@
 from typing import Optional
 
 import aiohttp
+from hummingbot.core.web_assistant.connections.data_types import HTTPClientConfig
+from hummingbot.core.web_assistant.connections.json_codec import JSONCodec
 from hummingbot.core.web_assistant.connections.rest_connection import RESTConnection
 from hummingbot.core.web_assistant.connections.ws_connection import WSConnection
+from hummingbot.core.web_assistant.connections.ws_frame_decompressor import WSFrameDecompressor
 
 
 class ConnectionsFactory:
@@ -17,19 +20,58 @@ class ConnectionsFactory:
     `aiohttp` and `WSConnection`s using `signalr_aio`.
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        http_client_config: Optional[HTTPClientConfig] = None,
+        json_codec: Optional[JSONCodec] = None,
+        ws_compress: int = 0,
+        ws_frame_decompressor: Optional[WSFrameDecompressor] = None,
+    ):
+        self._http_client_config = http_client_config or HTTPClientConfig()
+        self._json_codec = json_codec or JSONCodec()
+        self._ws_compress = ws_compress
+        self._ws_frame_decompressor = ws_frame_decompressor
         self._shared_client: Optional[aiohttp.ClientSession] = None
 
+    @property
+    def http_client_config(self) -> HTTPClientConfig:
+        return self._http_client_config
+
+    @property
+    def json_codec(self) -> JSONCodec:
+        return self._json_codec
+
+    def set_http_client_config(self, http_client_config: HTTPClientConfig):
+        """Changes the connection pool settings. They apply to the shared client created after the change, so this
+        should be called before requesting the first connection."""
+        self._http_client_config = http_client_config
+
     async def get_rest_connection(self) -> RESTConnection:
         shared_client = await self._get_shared_client()
-        connection = RESTConnection(aiohttp_client_session=shared_client)
+        connection = RESTConnection(aiohttp_client_session=shared_client, json_codec=self._json_codec)
         return connection
 
     async def get_ws_connection(self) -> WSConnection:
         shared_client = await self._get_shared_client()
-        connection = WSConnection(aiohttp_client_session=shared_client)
+        connection = WSConnection(
+            aiohttp_client_session=shared_client,
+            json_codec=self._json_codec,
+            compress=self._ws_compress,
+            frame_decompressor=self._ws_frame_decompressor,
+        )
         return connection
 
     async def _get_shared_client(self) -> aiohttp.ClientSession:
-        self._shared_client = self._shared_client or aiohttp.ClientSession()
+        self._shared_client = self._shared_client or aiohttp.ClientSession(connector=self._create_tcp_connector())
         return self._shared_client
+
+    def _create_tcp_connector(self) -> aiohttp.TCPConnector:
+        config = self._http_client_config
+        # aiohttp already sets TCP_NODELAY on the sockets it opens
+        return aiohttp.TCPConnector(
+            limit=config.limit,
+            limit_per_host=config.limit_per_host,
+            keepalive_timeout=config.keepalive_timeout,
+            use_dns_cache=config.dns_cache_ttl > 0,
+            ttl_dns_cache=config.dns_cache_ttl if config.dns_cache_ttl > 0 else None,
+        )
@@ -6,6 +6,8 @@ from typing import TYPE_CHECKING, Any, Mapping, Optional
 import aiohttp
 import ujson
 
+from hummingbot.core.web_assistant.connections.json_codec import JSONCodec
+
 if TYPE_CHECKING:
     from hummingbot.core.web_assistant.connections.ws_connection import WSConnection
 
@@ -87,8 +89,9 @@ class RESTResponse:
     status: int
     headers: Optional[Mapping[str, str]]
 
-    def __init__(self, aiohttp_response: aiohttp.ClientResponse):
+    def __init__(self, aiohttp_response: aiohttp.ClientResponse, json_codec: Optional[JSONCodec] = None):
         self._aiohttp_response = aiohttp_response
+        self._json_codec = json_codec or JSONCodec()
 
     @property
     def url(self) -> str:
@@ -110,8 +113,13 @@ class RESTResponse:
         headers_ = self._aiohttp_response.headers
         return headers_
 
+    async def read(self) -> bytes:
+        """Reads the response body. The body is kept, so it is not read again by `json()` or `text()`."""
+        body = await self._aiohttp_response.read()
+        return body
+
     async def json(self) -> Any:
-        json_ = await self._aiohttp_response.json()
+        json_ = await self._aiohttp_response.json(loads=self._json_codec.loads)
         return json_
 
     async def text(self) -> str:
@@ -148,3 +156,19 @@ class WSPlainTextRequest(WSRequest):
 @dataclass
 class WSResponse:
     data: Any
+
+
+@dataclass
+class HTTPClientConfig:
+    """Settings of the connection pool of the HTTP client shared by the connections of a factory.
+
+    `limit` and `limit_per_host` set the maximum number of simultaneous connections (0 for no limit).
+    `keepalive_timeout` is the time in seconds an idle connection is kept open to be reused, and `dns_cache_ttl` the
+    time in seconds resolved addresses are cached (0 disables the DNS cache). `warm_connections` is the number of
+    connections to open in advance when the connector starts.
+    """
+    limit: int = 100
+    limit_per_host: int = 0
+    keepalive_timeout: float = 60.0
+    dns_cache_ttl: int = 10
+    warm_connections: int = 0
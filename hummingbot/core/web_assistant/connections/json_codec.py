@@ -0,0 +1,73 @@
+import json
+from typing import Any, Union
+
+import ujson
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class JSONCodec:
+    """Encodes and decodes the JSON payloads of the REST and WebSocket connections.
+
+    This implementation uses the standard library `json` module. When `numbers_as_str` is enabled the JSON numbers are
+    kept as their text instead of being converted to `int` or `float`. That way the numbers that are never read are
+    not parsed, and the ones that are can be converted by the caller (e.g. to `Decimal`) without losing precision.
+
+    Subclasses can use a faster third-party library. Decoding errors must raise a subclass of `ValueError`.
+    """
+
+    def __init__(self, numbers_as_str: bool = False):
+        self._numbers_as_str = numbers_as_str
+        self._decoder = (json.JSONDecoder(parse_int=str, parse_float=str) if numbers_as_str
+                         else json.JSONDecoder())
+
+    @property
+    def numbers_as_str(self) -> bool:
+        return self._numbers_as_str
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        if isinstance(data, (bytes, bytearray)):
+            data = data.decode("utf-8")
+        return self._decoder.decode(data)
+
+    def dumps(self, obj: Any) -> str:
+        return json.dumps(obj)
+
+
+class UJSONCodec(JSONCodec):
+    """Codec using the `ujson` library. The encoded output has no whitespace between the separators."""
+
+    def __init__(self):
+        super().__init__(numbers_as_str=False)
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        return ujson.loads(data)
+
+    def dumps(self, obj: Any) -> str:
+        return ujson.dumps(obj)
+
+
+class ORJSONCodec(JSONCodec):
+    """Codec using the `orjson` library, when it is installed. The encoded output has no whitespace between the
+    separators."""
+
+    def __init__(self):
+        if orjson is None:
+            raise ImportError("The orjson library is required to use ORJSONCodec.")
+        super().__init__(numbers_as_str=False)
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        return orjson.loads(data)
+
+    def dumps(self, obj: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+
+
+def fast_json_codec() -> JSONCodec:
+    """
+    :return: the fastest codec available, `orjson` if it is installed or `ujson` otherwise
+    """
+    return ORJSONCodec() if orjson is not None else UJSONCodec()
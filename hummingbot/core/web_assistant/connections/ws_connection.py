@@ -1,20 +1,45 @@
 import asyncio
 import time
-from json import JSONDecodeError
-from typing import Any, Dict, Mapping, Optional
+import zlib
+from typing import Any, Dict, List, Mapping, Optional
 
 import aiohttp
 
+from hummingbot.core.network_metrics import NetworkMetrics, WSStreamMetrics
 from hummingbot.core.web_assistant.connections.data_types import WSRequest, WSResponse
+from hummingbot.core.web_assistant.connections.json_codec import JSONCodec
+from hummingbot.core.web_assistant.connections.ws_frame_decompressor import WSFrameDecompressor
+
+# The count of buffered messages relies on the reader queue of aiohttp 3 websockets, which is not part of its public API
+_AIOHTTP_READER_COUNT_SUPPORTED = aiohttp.__version__.split(".")[0] == "3"
 
 
 class WSConnection:
-    def __init__(self, aiohttp_client_session: aiohttp.ClientSession):
+    def __init__(
+        self,
+        aiohttp_client_session: aiohttp.ClientSession,
+        json_codec: Optional[JSONCodec] = None,
+        compress: int = 0,
+        frame_decompressor: Optional[WSFrameDecompressor] = None,
+    ):
+        """
+        :param aiohttp_client_session: the client session used to open the connection
+        :param json_codec: the codec used to encode and decode the JSON messages
+        :param compress: window size bits (9 to 15) to request the permessage-deflate extension when connecting,
+            0 to disable it. The frames compressed by the extension are decompressed by aiohttp
+        :param frame_decompressor: decompressor for the binary frames of the exchanges that compress their messages
+            at the application level. The decompressed frames are then decoded as the text frames
+        """
         self._client_session = aiohttp_client_session
+        self._json_codec = json_codec or JSONCodec()
+        self._compress = compress
+        self._frame_decompressor = frame_decompressor
         self._connection: Optional[aiohttp.ClientWebSocketResponse] = None
         self._connected = False
         self._message_timeout: Optional[float] = None
         self._last_recv_time = 0
+        self._pending_connection_error: Optional[ConnectionError] = None
+        self._metrics: Optional[WSStreamMetrics] = None
 
     @property
     def last_recv_time(self) -> float:
@@ -24,6 +49,10 @@ class WSConnection:
     def connected(self) -> bool:
         return self._connected
 
+    @property
+    def json_codec(self) -> JSONCodec:
+        return self._json_codec
+
     async def connect(
         self,
         ws_url: str,
@@ -37,9 +66,12 @@ class WSConnection:
             headers=ws_headers,
             autoping=False,
             heartbeat=ping_timeout,
+            compress=self._compress,
         )
         self._message_timeout = message_timeout
         self._connected = True
+        self._metrics = NetworkMetrics.get_instance().ws_stream(url=ws_url)
+        self._metrics.reset_inter_arrival()
 
     async def disconnect(self):
         if self._connection is not None and not self._connection.closed:
@@ -65,6 +97,48 @@ class WSConnection:
                 break
         return response
 
+    async def receive_batch(self, max_messages: int = 100) -> List[WSResponse]:
+        """Waits for the next message and then drains, without waiting, the messages already received and buffered
+        by the underlying library, up to `max_messages` in total.
+
+        If the connection is closed by the server while draining, the messages received before are returned and the
+        `ConnectionError` is raised on the next call. An empty list is returned once the connection is disconnected.
+        """
+        self._raise_pending_connection_error()
+        if not self._connected:
+            return []
+        responses = []
+        response = await self.receive()
+        if response is not None:
+            responses.append(response)
+        try:
+            while self._connected and len(responses) < max_messages and self._buffered_messages_count() > 0:
+                msg = await self._read_message()
+                msg = await self._process_message(msg)
+                if msg is not None:
+                    responses.append(self._build_resp(msg))
+        except ConnectionError as connection_error:
+            if len(responses) == 0:
+                raise
+            self._pending_connection_error = connection_error
+        return responses
+
+    def _raise_pending_connection_error(self):
+        if self._pending_connection_error is not None:
+            connection_error, self._pending_connection_error = self._pending_connection_error, None
+            raise connection_error
+
+    def _buffered_messages_count(self) -> int:
+        # aiohttp keeps the frames received and not read yet in the websocket reader queue. If the count is not
+        # available receive_batch falls back to return one message per call
+        if not _AIOHTTP_READER_COUNT_SUPPORTED:
+            return 0
+        reader = getattr(self._connection, "_reader", None)
+        try:
+            return len(reader)
+        except TypeError:
+            return 0
+
     def _ensure_not_connected(self):
         if self._connected:
             raise RuntimeError("WS is connected.")
@@ -117,19 +191,35 @@ class WSConnection:
         self._last_recv_time = time.time()
 
     async def _send_json(self, payload: Mapping[str, Any]):
-        await self._connection.send_json(payload)
+        await self._connection.send_json(payload, dumps=self._json_codec.dumps)
 
     async def _send_plain_text(self, payload: str):
         await self._connection.send_str(payload)
 
-    @staticmethod
-    def _build_resp(msg: aiohttp.WSMessage) -> WSResponse:
+    def _decode(self, text: str) -> Any:
+        try:
+            data = self._json_codec.loads(text)
+        except ValueError:
+            data = text
+        return data
+
+    def _decompress_frame(self, frame: bytes) -> Any:
+        try:
+            text = self._frame_decompressor.decompress(frame).decode("utf-8")
+        except (zlib.error, UnicodeDecodeError):
+            # Not a compressed frame, it is delivered unchanged
+            return frame
+        return self._decode(text)
+
+    def _build_resp(self, msg: aiohttp.WSMessage) -> WSResponse:
+        receive_timestamp = time.perf_counter()
         if msg.type == aiohttp.WSMsgType.BINARY:
-            data = msg.data
+            data = self._decompress_frame(msg.data) if self._frame_decompressor is not None else msg.data
         else:
-            try:
-                data = msg.json()
-            except JSONDecodeError:
-                data = msg.data
+            data = self._decode(msg.data)
+        if self._metrics is not None:
+            self._metrics.record_message(timestamp=receive_timestamp,
+                                         decode_time=time.perf_counter() - receive_timestamp,
+                                         size=len(msg.data) if isinstance(msg.data, (str, bytes)) else 0)
         response = WSResponse(data)
         return response
@@ -0,0 +1,44 @@
+import zlib
+
+# zlib window bits for each supported encoding. With 32 added, zlib detects the gzip and zlib headers.
+ENCODING_WBITS = {
+    "gzip": 16 + zlib.MAX_WBITS,
+    "zlib": zlib.MAX_WBITS,
+    "deflate": -zlib.MAX_WBITS,
+    "auto": 32 + zlib.MAX_WBITS,
+}
+
+
+class WSFrameDecompressor:
+    """Decompresses the binary websocket frames of the exchanges that send their messages compressed at the
+    application level (instead of negotiating the permessage-deflate extension).
+
+    The supported encodings are `gzip`, `zlib` and `deflate` (raw deflate data, without header). The `auto` encoding
+    detects gzip and zlib data by their header and considers any other frame to be raw deflate data.
+    """
+
+    def __init__(self, encoding: str = "auto"):
+        if encoding not in ENCODING_WBITS:
+            raise ValueError(f"Invalid encoding {encoding}. Supported encodings: {', '.join(ENCODING_WBITS)}.")
+        self._encoding = encoding
+        self._wbits = ENCODING_WBITS[encoding]
+
+    @property
+    def encoding(self) -> str:
+        return self._encoding
+
+    def decompress(self, data: bytes) -> bytes:
+        """
+        :raises zlib.error: if the data is not compressed with the decompressor encoding
+        """
+        wbits = ENCODING_WBITS["deflate"] if self._encoding == "auto" and not self._has_header(data) else self._wbits
+        # Unlike zlib.decompress, a decompress object accepts the data of a stream without its final block
+        decompressor = zlib.decompressobj(wbits)
+        return decompressor.decompress(data) + decompressor.flush()
+
+    @staticmethod
+    def _has_header(data: bytes) -> bool:
+        is_gzip = data[:2] == b"\x1f\x8b"
+        # zlib header: deflate compression method and a check value that makes the first two bytes a multiple of 31
+        is_zlib = len(data) >= 2 and data[0] & 0x0f == 8 and (data[0] << 8 | data[1]) % 31 == 0
+        return is_gzip or is_zlib
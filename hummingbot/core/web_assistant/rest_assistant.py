@@ -1,14 +1,16 @@
-import json
+import time
 from asyncio import wait_for
 from copy import deepcopy
 from typing import Any, Dict, List, Optional, Union
 
 from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
+from hummingbot.core.network_metrics import NetworkMetrics
 from hummingbot.core.web_assistant.auth import AuthBase
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod, RESTRequest, RESTResponse
 from hummingbot.core.web_assistant.connections.rest_connection import RESTConnection
 from hummingbot.core.web_assistant.rest_post_processors import RESTPostProcessorBase
 from hummingbot.core.web_assistant.rest_pre_processors import RESTPreProcessorBase
+from hummingbot.core.web_assistant.rest_request_coalescer import RESTRequestCoalescer
 
 
 class RESTAssistant:
@@ -17,6 +19,9 @@ class RESTAssistant:
     The class can be injected with additional functionality by passing a list of objects inheriting from
     the `RESTPreProcessorBase` and `RESTPostProcessorBase` classes. The pre-processors are applied to a request
     before it is sent out, while the post-processors are applied to a response before it is returned to the caller.
+
+    When a `RESTRequestCoalescer` is provided, the GET requests that do not require authentication are executed
+    through it, so the identical requests executed concurrently share a single call.
     """
     def __init__(
         self,
@@ -25,12 +30,14 @@ class RESTAssistant:
         rest_pre_processors: Optional[List[RESTPreProcessorBase]] = None,
         rest_post_processors: Optional[List[RESTPostProcessorBase]] = None,
         auth: Optional[AuthBase] = None,
+        request_coalescer: Optional[RESTRequestCoalescer] = None,
     ):
         self._connection = connection
         self._rest_pre_processors = rest_pre_processors or []
         self._rest_post_processors = rest_post_processors or []
         self._auth = auth
         self._throttler = throttler
+        self._request_coalescer = request_coalescer
 
     async def execute_request(
             self,
@@ -44,13 +51,50 @@ class RESTAssistant:
             timeout: Optional[float] = None,
             headers: Optional[Dict[str, Any]] = None) -> Union[str, Dict[str, Any]]:
 
+        if self._request_coalescer is not None and method == RESTMethod.GET and not is_auth_required:
+            return await self._request_coalescer.execute(
+                key=RESTRequestCoalescer.request_key(url=url, params=params, headers=headers, return_err=return_err),
+                request_function=lambda: self._execute_request(
+                    url=url,
+                    throttler_limit_id=throttler_limit_id,
+                    params=params,
+                    data=data,
+                    method=method,
+                    is_auth_required=is_auth_required,
+                    return_err=return_err,
+                    timeout=timeout,
+                    headers=headers),
+                timeout=timeout)
+        return await self._execute_request(
+            url=url,
+            throttler_limit_id=throttler_limit_id,
+            params=params,
+            data=data,
+            method=method,
+            is_auth_required=is_auth_required,
+            return_err=return_err,
+            timeout=timeout,
+            headers=headers)
+
+    async def _execute_request(
+            self,
+            url: str,
+            throttler_limit_id: str,
+            params: Optional[Dict[str, Any]] = None,
+            data: Optional[Dict[str, Any]] = None,
+            method: RESTMethod = RESTMethod.GET,
+            is_auth_required: bool = False,
+            return_err: bool = False,
+            timeout: Optional[float] = None,
+            headers: Optional[Dict[str, Any]] = None) -> Union[str, Dict[str, Any]]:
+
         headers = headers or {}
 
         local_headers = {
             "Content-Type": ("application/json" if method != RESTMethod.GET else "application/x-www-form-urlencoded")}
         local_headers.update(headers)
 
-        data = json.dumps(data) if data is not None else data
+        data = self._connection.json_codec.dumps(data) if data is not None else data
 
         request = RESTRequest(
             method=method,
@@ -62,8 +106,15 @@ class RESTAssistant:
             throttler_limit_id=throttler_limit_id
         )
 
+        metrics = NetworkMetrics.get_instance().rest_endpoint(limit_id=throttler_limit_id)
         async with self._throttler.execute_task(limit_id=throttler_limit_id):
+            network_start = time.perf_counter()
             response = await self.call(request=request, timeout=timeout)
+            body = await response.read()
+            metrics.record_response(network_time=time.perf_counter() - network_start,
+                                    request_bytes=len(data) if data is not None else 0,
+                                    response_bytes=len(body),
+                                    is_error=400 <= response.status)
 
             if 400 <= response.status:
                 if return_err:
@@ -74,7 +125,9 @@ class RESTAssistant:
                     error_text = "N/A" if "<html" in error_response else error_response
                     raise IOError(f"Error executing request {method.name} {url}. HTTP status is {response.status}. "
                                   f"Error: {error_text}")
+            decode_start = time.perf_counter()
             result = await response.json()
+            metrics.decode_time.record(time.perf_counter() - decode_start)
             return result
 
     async def call(self, request: RESTRequest, timeout: Optional[float] = None) -> RESTResponse:
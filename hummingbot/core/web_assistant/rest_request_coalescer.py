@@ -0,0 +1,113 @@
+import asyncio
+import time
+from copy import deepcopy
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+
+class _Flight:
+    def __init__(self, task: asyncio.Task):
+        self.task = task
+        self.waiters_count = 0
+
+
+class RESTRequestCoalescer:
+    """Merges identical requests executed concurrently by the `RESTAssistant`s of a factory into a single call.
+
+    The first request starts the call and the identical requests received while it is in flight wait for its result
+    instead of sending their own. When `cache_ttl` is greater than zero the results are also kept for that number of
+    seconds, and the identical requests received in that time get the cached result.
+
+    The `RESTAssistant` only coalesces the GET requests that do not require authentication. The callers sharing a
+    result get their own copy of it, so they can modify it.
+    """
+
+    def __init__(self, cache_ttl: float = 0):
+        """
+        :param cache_ttl: time in seconds to keep the results of the requests. Defaults to 0 (no cache)
+        """
+        if cache_ttl < 0:
+            raise ValueError("The cache TTL can't be negative.")
+        self._cache_ttl = cache_ttl
+        self._in_flight: Dict[Hashable, _Flight] = {}
+        self._cache: Dict[Hashable, Tuple[float, Any]] = {}
+
+    @property
+    def cache_ttl(self) -> float:
+        return self._cache_ttl
+
+    @property
+    def in_flight_count(self) -> int:
+        return len(self._in_flight)
+
+    @staticmethod
+    def request_key(url: str,
+                    params: Optional[Dict[str, Any]] = None,
+                    headers: Optional[Dict[str, Any]] = None,
+                    return_err: bool = False) -> Hashable:
+        params_key = tuple(sorted((str(key), str(value)) for key, value in (params or {}).items()))
+        headers_key = tuple(sorted((str(key), str(value)) for key, value in (headers or {}).items()))
+        return url, params_key, headers_key, return_err
+
+    async def execute(self,
+                      key: Hashable,
+                      request_function: Callable[[], Awaitable[Any]],
+                      timeout: Optional[float] = None) -> Any:
+        """
+        Returns the result of the request identified by `key`, calling `request_function` only if there is no
+        identical request in flight and no cached result
+
+        :param key: the request identifier, as built by `request_key`
+        :param request_function: the function that executes the request
+        :param timeout: maximum time to wait for the result, a timeout does not cancel the call for the other waiters
+        """
+        cached_result = self._cached_result(key)
+        if cached_result is not None:
+            return deepcopy(cached_result[1])
+
+        flight = self._in_flight.get(key)
+        if flight is None:
+            task = asyncio.ensure_future(self._execute_flight(key=key, request_function=request_function))
+            task.add_done_callback(self._retrieve_flight_exception)
+            flight = _Flight(task=task)
+            self._in_flight[key] = flight
+        flight.waiters_count += 1
+
+        result = await asyncio.wait_for(asyncio.shield(flight.task), timeout)
+        if flight.waiters_count > 1 or self._cache_ttl > 0:
+            result = deepcopy(result)
+        return result
+
+    def clear(self):
+        self._cache.clear()
+
+    async def _execute_flight(self, key: Hashable, request_function: Callable[[], Awaitable[Any]]) -> Any:
+        try:
+            result = await request_function()
+        finally:
+            # The requests received from now on start a new call
+            self._in_flight.pop(key, None)
+        if self._cache_ttl > 0:
+            self._purge_expired_results()
+            self._cache[key] = (self._time() + self._cache_ttl, result)
+        return result
+
+    def _cached_result(self, key: Hashable) -> Optional[Tuple[float, Any]]:
+        cached_result = self._cache.get(key)
+        if cached_result is not None and cached_result[0] <= self._time():
+            del self._cache[key]
+            cached_result = None
+        return cached_result
+
+    def _purge_expired_results(self):
+        now = self._time()
+        for key in [key for key, (expiration, _) in self._cache.items() if expiration <= now]:
+            del self._cache[key]
+
+    @staticmethod
+    def _retrieve_flight_exception(task: asyncio.Task):
+        # Avoids the "exception was never retrieved" warning when all the waiters timed out or were cancelled
+        if not task.cancelled():
+            task.exception()
+
+    def _time(self) -> float:
+        return time.monotonic()
@@ -3,9 +3,13 @@ from typing import List, Optional
 from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
 from hummingbot.core.web_assistant.auth import AuthBase
 from hummingbot.core.web_assistant.connections.connections_factory import ConnectionsFactory
+from hummingbot.core.web_assistant.connections.data_types import HTTPClientConfig
+from hummingbot.core.web_assistant.connections.json_codec import JSONCodec
+from hummingbot.core.web_assistant.connections.ws_frame_decompressor import WSFrameDecompressor
 from hummingbot.core.web_assistant.rest_assistant import RESTAssistant
 from hummingbot.core.web_assistant.rest_post_processors import RESTPostProcessorBase
 from hummingbot.core.web_assistant.rest_pre_processors import RESTPreProcessorBase
+from hummingbot.core.web_assistant.rest_request_coalescer import RESTRequestCoalescer
 from hummingbot.core.web_assistant.ws_assistant import WSAssistant
 from hummingbot.core.web_assistant.ws_post_processors import WSPostProcessorBase
 from hummingbot.core.web_assistant.ws_pre_processors import WSPreProcessorBase
@@ -19,6 +23,11 @@ class WebAssistantsFactory:
     lists. Consult the documentation of the relevant assistant and/or pre-/post-processor class for
     additional information.
 
+    Connectors can opt in to share a `RESTRequestCoalescer` between the `RESTAssistant`s created by a factory, so the
+    identical public GET requests executed concurrently by different components of the connector are sent only once.
+    It should only be enabled for connectors whose public GET responses do not depend on request headers added by
+    pre-processors, since the coalesced requests get the response of the first one.
+
     todo: integrate AsyncThrottler
     """
     def __init__(
@@ -29,14 +38,25 @@ class WebAssistantsFactory:
         ws_pre_processors: Optional[List[WSPreProcessorBase]] = None,
         ws_post_processors: Optional[List[WSPostProcessorBase]] = None,
         auth: Optional[AuthBase] = None,
+        http_client_config: Optional[HTTPClientConfig] = None,
+        json_codec: Optional[JSONCodec] = None,
+        rest_request_coalescer: Optional[RESTRequestCoalescer] = None,
+        ws_compress: int = 0,
+        ws_frame_decompressor: Optional[WSFrameDecompressor] = None,
     ):
-        self._connections_factory = ConnectionsFactory()
+        self._connections_factory = ConnectionsFactory(
+            http_client_config=http_client_config,
+            json_codec=json_codec,
+            ws_compress=ws_compress,
+            ws_frame_decompressor=ws_frame_decompressor,
+        )
         self._rest_pre_processors = rest_pre_processors or []
         self._rest_post_processors = rest_post_processors or []
         self._ws_pre_processors = ws_pre_processors or []
         self._ws_post_processors = ws_post_processors or []
         self._auth = auth
         self._throttler = throttler
+        self._rest_request_coalescer = rest_request_coalescer
 
     @property
     def throttler(self) -> AsyncThrottlerBase:
@@ -46,6 +66,21 @@ class WebAssistantsFactory:
     def auth(self) -> Optional[AuthBase]:
         return self._auth
 
+    @property
+    def http_client_config(self) -> HTTPClientConfig:
+        return self._connections_factory.http_client_config
+
+    @property
+    def rest_request_coalescer(self) -> Optional[RESTRequestCoalescer]:
+        return self._rest_request_coalescer
+
+    @property
+    def json_codec(self) -> JSONCodec:
+        return self._connections_factory.json_codec
+
+    def set_http_client_config(self, http_client_config: HTTPClientConfig):
+        self._connections_factory.set_http_client_config(http_client_config)
+
     async def get_rest_assistant(self) -> RESTAssistant:
         connection = await self._connections_factory.get_rest_connection()
         assistant = RESTAssistant(
@@ -53,7 +88,8 @@ class WebAssistantsFactory:
             throttler=self._throttler,
             rest_pre_processors=self._rest_pre_processors,
             rest_post_processors=self._rest_post_processors,
-            auth=self._auth
+            auth=self._auth,
+            request_coalescer=self._rest_request_coalescer,
         )
         return assistant
 
@@ -66,6 +66,15 @@ class WSAssistant:
                 response = await self._post_process_response(response)
                 yield response
 
+    async def iter_message_batches(self, max_messages: int = 100) -> AsyncGenerator[List[WSResponse], None]:
+        """Yields the received messages in batches, with all the messages already buffered when the first one of
+        the batch is read (up to `max_messages`). Stops when `WSDelegate.disconnect()` is called."""
+        while True:
+            responses = await self._connection.receive_batch(max_messages=max_messages)
+            if len(responses) == 0 and not self._connection.connected:
+                break
+            yield [await self._post_process_response(response) for response in responses]
+
     async def receive(self) -> Optional[WSResponse]:
         """This method will return `None` if `WSDelegate.disconnect()` is called while waiting for a response."""
         response = await self._connection.receive()
@@ -1,9 +1,9 @@
 from decimal import Decimal
 from typing import (
-    NamedTuple, Iterator
+    NamedTuple, Iterable, Iterator
 )
 from hummingbot.core.data_type.order_book import OrderBook
-from hummingbot.core.data_type.order_book_query_result import ClientOrderBookQueryResult
+from hummingbot.core.data_type.order_book_query_result import ClientOrderBookQueryResult, OrderBookVolumesQueryResult
 from hummingbot.core.data_type.order_book_row import ClientOrderBookRow
 from hummingbot.connector.exchange_base import ExchangeBase
 from hummingbot.core.data_type.common import PriceType
@@ -42,6 +42,9 @@ class MarketTradingPairTuple(NamedTuple):
     def get_vwap_for_volume(self, is_buy: bool, volume: Decimal) -> ClientOrderBookQueryResult:
         return self.market.get_vwap_for_volume(self.trading_pair, is_buy, volume)
 
+    def get_vwap_for_volumes(self, is_buy: bool, volumes: Iterable) -> OrderBookVolumesQueryResult:
+        return self.market.get_vwap_for_volumes(self.trading_pair, is_buy, volumes)
+
     def get_price_for_volume(self, is_buy: bool, volume: Decimal) -> ClientOrderBookQueryResult:
         return self.market.get_price_for_volume(self.trading_pair, is_buy, volume)
 
@@ -26,8 +26,10 @@ cdef class StrategyBase(TimeIterator):
         EventListener _sb_range_position_fee_collected_listener
         EventListener _sb_range_position_closed_listener
         bint _sb_delegate_lock
+        double _sb_next_action_timestamp
         public OrderTracker _sb_order_tracker
 
+    cdef c_schedule_next_action(self, double timestamp)
     cdef c_add_markets(self, list markets)
     cdef c_remove_markets(self, list markets)
     cdef c_did_create_buy_order(self, object order_created_event)
@@ -4,6 +4,8 @@ import pandas as pd
 from typing import (
     List)
 
+from libc.math cimport isnan
+
 from hummingbot.core.clock cimport Clock
 from hummingbot.core.event.events import MarketEvent, AccountEvent
 from hummingbot.core.event.event_listener cimport EventListener
@@ -160,6 +162,7 @@ cdef class StrategyBase(TimeIterator):
         self._sb_range_position_closed_listener = RangePositionClosedListener(self)
 
         self._sb_delegate_lock = False
+        self._sb_next_action_timestamp = NaN
 
         self._sb_order_tracker = OrderTracker()
 
@@ -305,6 +308,32 @@ cdef class StrategyBase(TimeIterator):
         TimeIterator.c_tick(self, timestamp)
         self._sb_order_tracker.c_tick(timestamp)
 
+    cdef c_schedule_next_action(self, double timestamp):
+        self._sb_next_action_timestamp = timestamp
+
+    def schedule_next_action(self, timestamp: float):
+        """
+        Declares that the strategy has nothing to do before `timestamp`, unless one of its markets has an event
+        earlier. In fast forward backtests the clock then skips the ticks in between. Strategies that never call it
+        are ticked on every clock tick, and a timestamp already reached also means every tick.
+
+        :param timestamp: the next timestamp at which the strategy has to be ticked, infinity to be ticked only for
+        the markets events
+        """
+        self.c_schedule_next_action(timestamp)
+
+    cdef double c_next_event_timestamp(self, double timestamp):
+        cdef:
+            ConnectorBase typed_market
+            double next_event = self._sb_next_action_timestamp
+
+        if isnan(next_event):
+            return TimeIterator.c_next_event_timestamp(self, timestamp)
+        for market in self._sb_markets:
+            typed_market = market
+            next_event = min(next_event, typed_market.c_next_event_timestamp(timestamp))
+        return next_event
+
     cdef c_stop(self, Clock clock):
         TimeIterator.c_stop(self, clock)
         self._sb_order_tracker.c_stop(clock)
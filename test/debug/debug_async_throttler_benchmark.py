@@ -0,0 +1,76 @@
+#!/usr/bin/env python
+
+"""
+Measures AsyncRequestContext.within_capacity() throughput with 1k and 10k logged tasks, compared to a scan of all
+the logged tasks.
+
+Usage: python test/debug/debug_async_throttler_benchmark.py
+"""
+
+import asyncio
+import time
+from decimal import Decimal
+
+from hummingbot.core.api_throttler.async_throttler import AsyncRequestContext
+from hummingbot.core.api_throttler.data_types import LinkedLimitWeightPair, RateLimit, TaskLog, TaskLogs
+
+SAFETY_MARGIN_PCT = 0.05
+
+REQUEST_WEIGHT = RateLimit(limit_id="REQUEST_WEIGHT", limit=1000000, time_interval=60)
+ORDERS = RateLimit(limit_id="ORDERS", limit=1000000, time_interval=10)
+ENDPOINT = RateLimit(limit_id="/api/v3/order", limit=1000000, time_interval=60, linked_limits=[
+    LinkedLimitWeightPair(REQUEST_WEIGHT.limit_id, 2),
+    LinkedLimitWeightPair(ORDERS.limit_id, 1),
+])
+
+
+def scan_capacity_used(task_logs, rate_limit: RateLimit, now: float) -> int:
+    return sum([task.weight
+                for task in task_logs
+                if rate_limit.limit_id == task.rate_limit.limit_id and
+                Decimal(str(now)) - Decimal(str(task.timestamp)) - Decimal(str(task.rate_limit.time_interval * SAFETY_MARGIN_PCT)) <= task.rate_limit.time_interval])
+
+
+def build_task_logs(tasks_count: int) -> TaskLogs:
+    task_logs = TaskLogs()
+    now = time.time()
+    for i in range(tasks_count // 3):
+        timestamp = now - 5 * i / tasks_count
+        task_logs.append(TaskLog(timestamp=timestamp, rate_limit=ENDPOINT, weight=1))
+        task_logs.append(TaskLog(timestamp=timestamp, rate_limit=REQUEST_WEIGHT, weight=2))
+        task_logs.append(TaskLog(timestamp=timestamp, rate_limit=ORDERS, weight=1))
+    return task_logs
+
+
+def run(tasks_count: int, checks_count: int):
+    task_logs = build_task_logs(tasks_count)
+    context = AsyncRequestContext(task_logs=task_logs,
+                                  rate_limit=ENDPOINT,
+                                  related_limits=[(REQUEST_WEIGHT, 2), (ORDERS, 1)],
+                                  lock=asyncio.Lock(),
+                                  safety_margin_pct=SAFETY_MARGIN_PCT)
+    start = time.perf_counter()
+    for _ in range(checks_count):
+        assert context.within_capacity()
+    elapsed = time.perf_counter() - start
+
+    all_task_logs = list(task_logs)
+    scan_checks_count = max(1, checks_count // 100)
+    now = time.time()
+    scan_start = time.perf_counter()
+    for _ in range(scan_checks_count):
+        for rate_limit in (ENDPOINT, REQUEST_WEIGHT, ORDERS):
+            scan_capacity_used(all_task_logs, rate_limit, now)
+    scan_elapsed = time.perf_counter() - scan_start
+    return checks_count / elapsed, scan_checks_count / scan_elapsed
+
+
+def main():
+    for tasks_count in (1000, 10000):
+        checks_per_second, scan_checks_per_second = run(tasks_count, checks_count=100000)
+        print(f"{tasks_count:>6} logged tasks: {checks_per_second:,.0f} capacity checks/s "
+              f"(full scan: {scan_checks_per_second:,.0f} checks/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python
+
+"""
+Measures the decoding throughput of the web assistant JSON codecs on depth update frames shaped like the ones sent by
+the Binance depth stream, with 10 and 100 levels changed per side.
+
+Usage: python test/debug/debug_json_codec_benchmark.py
+"""
+
+import json
+import random
+import time
+from typing import List
+
+from hummingbot.core.web_assistant.connections.json_codec import (
+    JSONCodec,
+    ORJSONCodec,
+    UJSONCodec,
+    orjson,
+)
+
+
+def build_depth_update_frames(frames_count: int, levels_count: int) -> List[str]:
+    random.seed(1)
+    frames = []
+    update_id = 3028345671
+    for i in range(frames_count):
+        mid_price = 20000 + random.uniform(-50, 50)
+        frame = {
+            "stream": "btcusdt@depth@100ms",
+            "data": {
+                "e": "depthUpdate",
+                "E": 1671012345678 + i * 100,
+                "s": "BTCUSDT",
+                "U": update_id,
+                "u": update_id + levels_count * 2,
+                "b": [[f"{mid_price - level * 0.01:.8f}", f"{random.uniform(0, 5):.8f}"]
+                      for level in range(levels_count)],
+                "a": [[f"{mid_price + level * 0.01:.8f}", f"{random.uniform(0, 5):.8f}"]
+                      for level in range(levels_count)],
+            }
+        }
+        update_id += levels_count * 2 + 1
+        frames.append(json.dumps(frame))
+    return frames
+
+
+def run(codec: JSONCodec, frames: List[str], rounds: int) -> float:
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for frame in frames:
+            codec.loads(frame)
+    elapsed = time.perf_counter() - start
+    return len(frames) * rounds / elapsed
+
+
+def main():
+    codecs = [("json", JSONCodec()),
+              ("json (numbers as str)", JSONCodec(numbers_as_str=True)),
+              ("ujson", UJSONCodec())]
+    if orjson is not None:
+        codecs.append(("orjson", ORJSONCodec()))
+
+    for levels_count in (10, 100):
+        frames = build_depth_update_frames(frames_count=1000, levels_count=levels_count)
+        average_size = sum(len(frame) for frame in frames) / len(frames)
+        print(f"{levels_count} levels per side ({average_size:.0f} bytes per frame)")
+        baseline = None
+        for codec_name, codec in codecs:
+            frames_per_second = run(codec, frames, rounds=20)
+            baseline = baseline or frames_per_second
+            print(f"  {codec_name:<22} {frames_per_second:>12,.0f} frames/s ({frames_per_second / baseline:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+#!/usr/bin/env python
+
+"""
+Compares the diff application speed of the set based OrderBook and the array based LadderOrderBook, and of the
+OrderBookRow and columnar (OrderBookMessage.bid_columns / ask_columns) diff ingestion paths.
+
+The diff stream can be a recording of Binance depth update websocket messages (one JSON message per line, as sent by
+the exchange in the `depthUpdate` stream), or a synthetic random walk stream when no recording is provided.
+
+Usage: python test/debug/debug_order_book_benchmark.py [recorded_depth_stream.jsonl]
+"""
+
+import json
+import random
+import sys
+import time
+from typing import List, Optional, Tuple
+
+from hummingbot.core.data_type.ladder_order_book import LadderOrderBook
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+
+DiffRows = Tuple[List[OrderBookRow], List[OrderBookRow], int]
+
+
+def load_recorded_stream(path: str) -> List[DiffRows]:
+    diffs = []
+    with open(path) as recording:
+        for line in recording:
+            msg = json.loads(line)
+            msg = msg.get("data", msg)
+            update_id = int(msg["u"])
+            bids = [OrderBookRow(float(price), float(amount), update_id) for price, amount in msg["b"]]
+            asks = [OrderBookRow(float(price), float(amount), update_id) for price, amount in msg["a"]]
+            diffs.append((bids, asks, update_id))
+    return diffs
+
+
+def synthetic_stream(levels: int = 5000, diffs_count: int = 100000, seed: int = 0) -> List[DiffRows]:
+    rng = random.Random(seed)
+    mid = 30000.0
+    tick = 0.1
+    diffs = [([OrderBookRow(mid - tick * (i + 1), 1.0, 0) for i in range(levels)],
+              [OrderBookRow(mid + tick * (i + 1), 1.0, 0) for i in range(levels)],
+              0)]
+    for update_id in range(1, diffs_count + 1):
+        mid += tick * rng.choice((-1, 0, 0, 1))
+        bids = []
+        asks = []
+        for _ in range(rng.randint(1, 10)):
+            # Most updates happen close to the touch
+            distance = int(rng.expovariate(0.05))
+            amount = 0.0 if rng.random() < 0.3 else round(rng.uniform(0.01, 5), 3)
+            if rng.random() < 0.5:
+                bids.append(OrderBookRow(round(mid - tick * (distance + 1), 1), amount, update_id))
+            else:
+                asks.append(OrderBookRow(round(mid + tick * (distance + 1), 1), amount, update_id))
+        diffs.append((bids, asks, update_id))
+    return diffs
+
+
+def to_messages(diffs: List[DiffRows]) -> List[OrderBookMessage]:
+    # Builds the messages with the string rows the exchanges send, as the data sources do
+    return [
+        OrderBookMessage(OrderBookMessageType.DIFF, {
+            "update_id": update_id,
+            "bids": [[str(row.price), str(row.amount)] for row in bids],
+            "asks": [[str(row.price), str(row.amount)] for row in asks],
+        })
+        for bids, asks, update_id in diffs[1:]
+    ]
+
+
+def run_messages(order_book: OrderBook, diffs: List[DiffRows], columnar: bool) -> float:
+    bids, asks, update_id = diffs[0]
+    order_book.apply_snapshot(bids, asks, update_id)
+    messages = to_messages(diffs)
+    start = time.perf_counter()
+    if columnar:
+        for message in messages:
+            order_book.apply_diff_columns(message.bid_columns, message.ask_columns, message.update_id)
+    else:
+        for message in messages:
+            order_book.apply_diffs(message.bids, message.asks, message.update_id)
+    return time.perf_counter() - start
+
+
+def run(order_book: OrderBook, diffs: List[DiffRows]) -> float:
+    bids, asks, update_id = diffs[0]
+    order_book.apply_snapshot(bids, asks, update_id)
+    start = time.perf_counter()
+    for bids, asks, update_id in diffs[1:]:
+        order_book.apply_diffs(bids, asks, update_id)
+    return time.perf_counter() - start
+
+
+def main(recording_path: Optional[str] = None):
+    diffs = load_recorded_stream(recording_path) if recording_path else synthetic_stream()
+    for order_book_class in (OrderBook, LadderOrderBook):
+        order_book = order_book_class()
+        elapsed = run(order_book, diffs)
+        top_of_book_start = time.perf_counter()
+        for _ in range(1000):
+            list(zip(range(20), order_book.bid_entries()))
+        top_of_book_elapsed = time.perf_counter() - top_of_book_start
+        print(f"{order_book_class.__name__:>16}: {len(diffs) - 1} diffs in {elapsed:.3f}s "
+              f"({(len(diffs) - 1) / elapsed:,.0f} diffs/s), "
+              f"top 20 iteration: {top_of_book_elapsed * 1000:.3f}us")
+    for columnar in (False, True):
+        elapsed = run_messages(OrderBook(), diffs, columnar)
+        print(f"{'columns' if columnar else 'rows':>16}: {len(diffs) - 1} messages in {elapsed:.3f}s "
+              f"({(len(diffs) - 1) / elapsed:,.0f} messages/s)")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1] if len(sys.argv) > 1 else None)
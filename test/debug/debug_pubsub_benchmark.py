@@ -0,0 +1,53 @@
+#!/usr/bin/env python
+
+"""
+Measures the PubSub event throughput with 1, 10 and 100 listeners per event tag.
+
+Usage: python test/debug/debug_pubsub_benchmark.py
+"""
+
+import time
+from enum import Enum
+from typing import List
+
+from hummingbot.core.event.event_listener import EventListener
+from hummingbot.core.pubsub import PubSub
+
+
+class BenchmarkEvent(Enum):
+    Tick = 1
+
+
+class CountingListener(EventListener):
+    def __init__(self):
+        super().__init__()
+        self.count = 0
+
+    def __call__(self, arg: any):
+        self.count += 1
+
+
+def run(listeners_count: int, events_count: int) -> float:
+    pubsub = PubSub()
+    listeners: List[CountingListener] = [CountingListener() for _ in range(listeners_count)]
+    for listener in listeners:
+        pubsub.add_listener(BenchmarkEvent.Tick, listener)
+    start = time.perf_counter()
+    for i in range(events_count):
+        pubsub.trigger_event(BenchmarkEvent.Tick, i)
+    elapsed = time.perf_counter() - start
+    assert all(listener.count == events_count for listener in listeners)
+    return elapsed
+
+
+def main():
+    for listeners_count in (1, 10, 100):
+        events_count = 1000000 // listeners_count
+        elapsed = run(listeners_count, events_count)
+        print(f"{listeners_count:>4} listeners: {events_count} events in {elapsed:.3f}s "
+              f"({events_count / elapsed:,.0f} events/s, {elapsed / (events_count * listeners_count) * 1e9:.0f}ns "
+              f"per delivery)")
+
+
+if __name__ == "__main__":
+    main()
@@ -90,9 +90,16 @@ class ConfigCommandTest(unittest.TestCase):
                            "    | ∟ global_token_name               | USDT                 |\n"
                            "    | ∟ global_token_symbol             | $                    |\n"
                            "    | rate_limits_share_pct             | 100                  |\n"
+                           "    | rate_limits_shared_budget         | False                |\n"
                            "    | commands_timeout                  |                      |\n"
                            "    | ∟ create_command_timeout          | 10                   |\n"
                            "    | ∟ other_commands_timeout          | 30                   |\n"
+                           "    | http_client                       |                      |\n"
+                           "    | ∟ connections_limit               | 100                  |\n"
+                           "    | ∟ connections_limit_per_host      | 0                    |\n"
+                           "    | ∟ keepalive_timeout               | 60.0                 |\n"
+                           "    | ∟ dns_cache_ttl                   | 10                   |\n"
+                           "    | ∟ warm_connections                | 0                    |\n"
                            "    | tables_format                     | psql                 |\n"
                            "    | tick_size                         | 1.0                  |\n"
                            "    | market_data_collection            |                      |\n"
@@ -0,0 +1,65 @@
+import asyncio
+import unittest
+from typing import Awaitable
+from unittest.mock import MagicMock, patch
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter, read_system_configs_from_yml
+from hummingbot.client.hummingbot_application import HummingbotApplication
+from hummingbot.core.network_metrics import NetworkMetrics
+
+
+class NetworkMetricsCommandTest(unittest.TestCase):
+    @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher")
+    def setUp(self, _: MagicMock) -> None:
+        super().setUp()
+        self.ev_loop = asyncio.get_event_loop()
+
+        self.async_run_with_timeout(read_system_configs_from_yml())
+        self.client_config_map = ClientConfigAdapter(ClientConfigMap())
+
+        self.app = HummingbotApplication(client_config_map=self.client_config_map)
+        self.network_metrics = NetworkMetrics()
+        NetworkMetrics._shared_instance = self.network_metrics
+
+    def tearDown(self) -> None:
+        NetworkMetrics._shared_instance = None
+        super().tearDown()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 1):
+        ret = self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    @patch("hummingbot.client.hummingbot_application.HummingbotApplication.notify")
+    def test_show_network_metrics(self, notify_mock):
+        captures = []
+        notify_mock.side_effect = lambda s: captures.append(s)
+
+        self.async_run_with_timeout(self.app.show_network_metrics())
+        self.assertEqual("\n  No network metrics collected yet.", captures[-1])
+
+        self.network_metrics.record_throttle_wait(limit_id="/api/v3/order", duration=0.25)
+        self.network_metrics.rest_endpoint(limit_id="/api/v3/order").record_response(
+            network_time=0.05, request_bytes=10, response_bytes=2000, is_error=False)
+        self.network_metrics.ws_stream(url="wss://stream.exchange.com/ws").record_message(
+            timestamp=1, decode_time=0.001, size=100)
+
+        self.async_run_with_timeout(self.app.show_network_metrics())
+
+        output = captures[-1]
+        self.assertIn("REST requests (times in ms):", output)
+        self.assertIn("/api/v3/order", output)
+        self.assertIn("250", output)
+        self.assertIn("WebSocket streams (times in ms):", output)
+        self.assertIn("wss://stream.exchange.com/ws", output)
+
+    @patch("hummingbot.client.hummingbot_application.HummingbotApplication.notify")
+    def test_reset_network_metrics(self, notify_mock):
+        captures = []
+        notify_mock.side_effect = lambda s: captures.append(s)
+        self.network_metrics.record_throttle_wait(limit_id="/api/v3/order", duration=0.25)
+
+        self.async_run_with_timeout(self.app.show_network_metrics(reset=True))
+
+        self.assertEqual("\n  Network metrics reset.", captures[-1])
+        self.assertEqual(0, self.network_metrics.rest_endpoints["/api/v3/order"].throttle_wait.count)
@@ -74,3 +74,22 @@ class StatusCommandTest(unittest.TestCase):
                 msg="\nA network error prevented the connection check to complete. See logs for more details."
             )
         )
+
+    def test_format_clock_tick_stats_uses_tables_format(self):
+        stats = MagicMock()
+        stats.name = "PureMarketMakingStrategy"
+        stats.ticks_count = 10
+        stats.average_duration = 0.5
+        stats.percentile.return_value = 1.5
+        stats.max_duration = 2
+        stats.overruns = 2
+        self.app.clock = MagicMock(tick_overruns=2, tick_size=1.0, tick_stats={"strategy": stats})
+        self.client_config_map.tables_format = "psql"
+
+        lines = self.app._format_clock_tick_stats().split("\n")
+
+        self.assertEqual("  Clock tick overruns: 2 (ticks longer than 1.0s)", lines[1])
+        # psql tables are drawn with borders, unlike the plain DataFrame output
+        self.assertTrue(lines[2].startswith("    +--"))
+        self.assertTrue(lines[3].startswith("    | Iterator "))
+        self.assertTrue(lines[5].startswith("    | PureMarketMakingStrategy |"))
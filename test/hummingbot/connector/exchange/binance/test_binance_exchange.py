@@ -12,6 +12,7 @@ from hummingbot.client.config.client_config_map import ClientConfigMap
 from hummingbot.client.config.config_helpers import ClientConfigAdapter
 from hummingbot.connector.exchange.binance import binance_constants as CONSTANTS, binance_web_utils as web_utils
 from hummingbot.connector.exchange.binance.binance_exchange import BinanceExchange
+from hummingbot.connector.exchange.binance.binance_order_book import BinanceOrderBook
 from hummingbot.connector.test_support.exchange_connector_test import AbstractExchangeConnectorTests
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.connector.utils import get_new_client_order_id
@@ -1157,6 +1158,27 @@ class BinanceExchangeTests(AbstractExchangeConnectorTests.ExchangeConnectorTests
                 price=Decimal("2"),
             ))
 
+    def test_order_book_tracker_modes_enabled(self):
+        tracker = self.exchange.order_book_tracker
+
+        self.assertTrue(tracker._parallel_init)
+        self.assertTrue(tracker._direct_diff_dispatch)
+        self.assertTrue(tracker._resync_on_gap)
+
+    def test_order_book_diff_sequence_gap_detection(self):
+        data_source = self.exchange.order_book_tracker.data_source
+
+        def diff_message(first_update_id: int, update_id: int):
+            return BinanceOrderBook.diff_message_from_exchange(
+                {"U": first_update_id, "u": update_id, "b": [], "a": []},
+                timestamp=1640000000,
+                metadata={"trading_pair": self.trading_pair})
+
+        self.assertFalse(data_source.is_sequence_gap(last_update_id=100, message=diff_message(101, 105)))
+        # Diffs overlapping the order book are not gaps
+        self.assertFalse(data_source.is_sequence_gap(last_update_id=100, message=diff_message(95, 105)))
+        self.assertTrue(data_source.is_sequence_gap(last_update_id=100, message=diff_message(102, 105)))
+
     def test_format_trading_rules__min_notional_present(self):
         trading_rules = [{
             "symbol": "COINALPHAHBOT",
@@ -17,3 +17,11 @@ class BinanceUtilTestCases(unittest.TestCase):
         domain = "com"
         expected_url = CONSTANTS.REST_URL.format(domain) + CONSTANTS.PRIVATE_API_VERSION + path_url
         self.assertEqual(expected_url, web_utils.private_rest_url(path_url, domain))
+
+    def test_api_factory_coalesces_public_requests(self):
+        api_factory = web_utils.build_api_factory()
+        self.assertIsNotNone(api_factory.rest_request_coalescer)
+
+        api_factory = web_utils.build_api_factory_without_time_synchronizer_pre_processor(
+            throttler=web_utils.create_throttler())
+        self.assertIsNone(api_factory.rest_request_coalescer)
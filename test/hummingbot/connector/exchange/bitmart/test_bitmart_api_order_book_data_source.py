@@ -161,7 +161,7 @@ class BitmartAPIOrderBookDataSourceUnitTests(unittest.TestCase):
             asyncio.gather(self.data_source.get_new_order_book(self.trading_pair)))
         order_book: OrderBook = results[0]
 
-        self.assertTrue(type(order_book) == OrderBook)
+        self.assertIsInstance(order_book, OrderBook)
         self.assertEqual(order_book.snapshot_uid, mock_response["data"]["timestamp"])
 
         self.assertEqual(mock_response["data"]["timestamp"], order_book.snapshot_uid)
@@ -323,6 +323,37 @@ class BitmartAPIOrderBookDataSourceUnitTests(unittest.TestCase):
 
         self.assertEqual(trade_event, trade_message)
 
+    @patch("aiohttp.ClientSession.ws_connect", new_callable=AsyncMock)
+    def test_undecodable_binary_messages_are_logged_and_skipped(self, ws_connect_mock):
+        ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
+        invalid_message = b"\xff\xff"
+        trade_event = {
+            "table": CONSTANTS.PUBLIC_TRADE_CHANNEL_NAME,
+            "data": [{"symbol": self.ex_trading_pair, "price": "162.12", "side": "buy", "size": "11.085",
+                      "s_t": 1542337219}]
+        }
+
+        self.mocking_assistant.add_websocket_aiohttp_message(
+            websocket_mock=ws_connect_mock.return_value,
+            message=invalid_message,
+            message_type=WSMsgType.BINARY)
+        self.mocking_assistant.add_websocket_aiohttp_message(
+            websocket_mock=ws_connect_mock.return_value,
+            message=bitmart_utils.compress_ws_message(json.dumps(trade_event)),
+            message_type=WSMsgType.BINARY)
+
+        self.listening_task = self.ev_loop.create_task(self.data_source.listen_for_subscriptions())
+
+        self.mocking_assistant.run_until_all_aiohttp_messages_delivered(ws_connect_mock.return_value)
+
+        trade_message = self.async_run_with_timeout(
+            self.data_source._message_queue[self.data_source._trade_messages_queue_key].get())
+
+        self.assertEqual(trade_event, trade_message)
+        self.assertTrue(self._is_logged(
+            "WARNING",
+            f"Undecodable binary message received through the order book data source connection ({invalid_message})"))
+
     def test_listen_for_trades(self):
         msg_queue: asyncio.Queue = asyncio.Queue()
         mock_queue = AsyncMock()
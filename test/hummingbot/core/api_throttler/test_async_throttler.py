@@ -11,7 +11,14 @@ from unittest.mock import patch
 from hummingbot.client.config.client_config_map import ClientConfigMap
 from hummingbot.client.config.config_helpers import ClientConfigAdapter
 from hummingbot.core.api_throttler.async_throttler import AsyncRequestContext, AsyncThrottler
-from hummingbot.core.api_throttler.data_types import LinkedLimitWeightPair, RateLimit, TaskLog
+from hummingbot.core.api_throttler.async_throttler_base import request_priority
+from hummingbot.core.api_throttler.data_types import (
+    LinkedLimitWeightPair,
+    RateLimit,
+    RequestPriority,
+    TaskLog,
+    TaskLogs,
+)
 from hummingbot.logger.struct_logger import METRICS_LOG_LEVEL
 
 TEST_PATH_URL = "/hummingbot"
@@ -108,10 +115,10 @@ class AsyncThrottlerUnitTests(unittest.TestCase):
     def test_flush_only_elapsed_tasks_are_flushed(self):
         lock = asyncio.Lock()
         rate_limit = self.rate_limits[0]
-        self.throttler._task_logs = [
+        self.throttler._task_logs = TaskLogs([
             TaskLog(timestamp=1.0, rate_limit=rate_limit, weight=rate_limit.weight),
             TaskLog(timestamp=time.time(), rate_limit=rate_limit, weight=rate_limit.weight)
-        ]
+        ])
 
         self.assertEqual(2, len(self.throttler._task_logs))
         context = AsyncRequestContext(task_logs=self.throttler._task_logs,
@@ -122,6 +129,27 @@ class AsyncThrottlerUnitTests(unittest.TestCase):
         context.flush()
         self.assertEqual(1, len(self.throttler._task_logs))
 
+    def test_task_logs_sliding_windows(self):
+        pool_limit, weighted_pool_limit = self.rate_limits[0], self.rate_limits[2]
+        task_logs = TaskLogs()
+        for timestamp in (1.0, 2.0, 3.0):
+            task_logs.append(TaskLog(timestamp=timestamp, rate_limit=pool_limit, weight=1))
+            task_logs.append(TaskLog(timestamp=timestamp, rate_limit=weighted_pool_limit, weight=5))
+
+        self.assertEqual(6, len(task_logs))
+        self.assertEqual(3, task_logs.capacity_used(pool_limit.limit_id, now=6.0, safety_margin_pct=0))
+        self.assertEqual(15, task_logs.capacity_used(weighted_pool_limit.limit_id, now=7.0, safety_margin_pct=0.2))
+        self.assertEqual(10, task_logs.capacity_used(weighted_pool_limit.limit_id, now=7.0, safety_margin_pct=0))
+        self.assertEqual(0, task_logs.capacity_used("UNKNOWN", now=7.0, safety_margin_pct=0))
+
+        task_logs.flush(now=7.5, safety_margin_pct=0)
+        self.assertEqual(2, len(task_logs))
+        self.assertEqual([3.0, 3.0], [task_log.timestamp for task_log in task_logs])
+
+        task_logs.flush(now=9.0, safety_margin_pct=0)
+        self.assertEqual(0, len(task_logs))
+        self.assertEqual(0, task_logs.capacity_used(pool_limit.limit_id, now=9.0, safety_margin_pct=0))
+
     def test_within_capacity_singular_non_weighted_task_returns_false(self):
         rate_limit, _ = self.throttler.get_related_limits(limit_id=TEST_POOL_ID)
         self.throttler._task_logs.append(
@@ -243,7 +271,7 @@ class AsyncThrottlerUnitTests(unittest.TestCase):
         ])
 
         # Scenario where one specific task was executed at 0 milliseconds
-        tasks_log = []
+        tasks_log = TaskLogs()
         tasks_log.append(TaskLog(timestamp=1640000000.0000, rate_limit=per_millisecond_limit, weight=1))
         tasks_log.append(TaskLog(timestamp=1640000000.0000, rate_limit=per_second_limit, weight=1))
 
@@ -278,3 +306,43 @@ class AsyncThrottlerUnitTests(unittest.TestCase):
         time_mock.return_value = 1640000000.2100
         result = context.within_capacity()
         self.assertTrue(result)
+
+    def test_request_priority(self):
+        self.assertEqual(RequestPriority.MARKET_DATA, self.throttler.execute_task(TEST_POOL_ID).priority)
+        self.assertEqual(RequestPriority.CREATE,
+                         self.throttler.execute_task(TEST_POOL_ID, priority=RequestPriority.CREATE).priority)
+
+        with request_priority(RequestPriority.CANCEL):
+            self.assertEqual(RequestPriority.CANCEL, self.throttler.execute_task(TEST_POOL_ID).priority)
+            self.assertEqual(RequestPriority.HOUSEKEEPING,
+                             self.throttler.execute_task(TEST_POOL_ID, priority=RequestPriority.HOUSEKEEPING).priority)
+        self.assertEqual(RequestPriority.MARKET_DATA, self.throttler.execute_task(TEST_POOL_ID).priority)
+
+    def test_higher_priority_requests_get_capacity_first(self):
+        rate_limit = RateLimit(limit_id="LIMIT", limit=1, time_interval=0.3)
+        throttler = AsyncThrottler(rate_limits=[rate_limit], retry_interval=0.01, limits_share_percentage=Decimal("100"))
+        throttler._task_logs.append(TaskLog(timestamp=time.time(), rate_limit=rate_limit, weight=1))
+        executed_requests = []
+
+        async def execute_request(priority: RequestPriority):
+            async with throttler.execute_task(rate_limit.limit_id, priority=priority):
+                executed_requests.append(priority)
+
+        async def execute_requests():
+            housekeeping_task = asyncio.get_event_loop().create_task(execute_request(RequestPriority.HOUSEKEEPING))
+            await asyncio.sleep(0.05)
+            await asyncio.gather(housekeeping_task, execute_request(RequestPriority.CANCEL))
+
+        self.ev_loop.run_until_complete(asyncio.wait_for(execute_requests(), 2))
+
+        self.assertEqual([RequestPriority.CANCEL, RequestPriority.HOUSEKEEPING], executed_requests)
+        self.assertEqual(set(), throttler._waiting_requests)
+
+    def test_requests_only_yield_to_higher_priority_requests_on_the_same_limits(self):
+        waiting_cancel = self.throttler.execute_task(TEST_PATH_URL, priority=RequestPriority.CANCEL)
+        self.throttler._waiting_requests.add(waiting_cancel)
+
+        self.assertTrue(self.throttler.execute_task(TEST_POOL_ID).yields_to_higher_priority())
+        self.assertFalse(self.throttler.execute_task(
+            TEST_POOL_ID, priority=RequestPriority.CANCEL).yields_to_higher_priority())
+        self.assertFalse(self.throttler.execute_task(TEST_WEIGHTED_POOL_ID).yields_to_higher_priority())
@@ -0,0 +1,119 @@
+import asyncio
+import os
+import tempfile
+import time
+import unittest
+from decimal import Decimal
+from unittest.mock import patch
+
+from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
+from hummingbot.core.api_throttler.data_types import RateLimit
+from hummingbot.core.api_throttler.shared_rate_limit_budget import SharedRateLimitBudget
+
+
+class SharedRateLimitBudgetTests(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.directory = tempfile.TemporaryDirectory()
+        self.budget_directory = os.path.join(self.directory.name, "test_exchange")
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+        super().tearDown()
+
+    def _budget(self, heartbeat_interval: float = SharedRateLimitBudget.HEARTBEAT_INTERVAL) -> SharedRateLimitBudget:
+        return SharedRateLimitBudget(
+            budget_id="test_exchange", directory=self.budget_directory, heartbeat_interval=heartbeat_interval)
+
+    def test_participants_count(self):
+        budget = self._budget()
+        other_budget = self._budget()
+
+        budget.register()
+        self.assertEqual(1, budget.participants_count)
+
+        other_budget.register()
+        self.assertEqual(2, other_budget.participants_count)
+        # The participants count is only updated once per heartbeat interval
+        self.assertEqual(1, budget.refresh())
+        self.assertEqual(2, budget.refresh(force=True))
+
+        other_budget.unregister()
+        self.assertEqual(1, budget.refresh(force=True))
+        self.assertEqual(1, len(os.listdir(self.budget_directory)))
+
+    def test_stale_participants_are_removed(self):
+        budget = self._budget()
+        budget.register()
+        stale_participant_path = os.path.join(self.budget_directory, "stale-participant")
+        with open(stale_participant_path, "w"):
+            pass
+        stale_timestamp = time.time() - budget.HEARTBEAT_INTERVAL * (budget.STALE_HEARTBEATS + 1)
+        os.utime(stale_participant_path, (stale_timestamp, stale_timestamp))
+
+        self.assertEqual(1, budget.refresh(force=True))
+        self.assertFalse(os.path.exists(stale_participant_path))
+
+    def test_throttler_uses_its_part_of_the_shared_budget(self):
+        rate_limits = [RateLimit(limit_id="LIMIT", limit=100, time_interval=1)]
+        throttler = AsyncThrottler(rate_limits=rate_limits, limits_share_percentage=Decimal("50"))
+        other_throttler = AsyncThrottler(rate_limits=rate_limits, limits_share_percentage=Decimal("100"))
+
+        throttler.set_shared_budget(self._budget())
+        self.assertEqual(50, throttler._id_to_limit_map["LIMIT"].limit)
+
+        other_throttler.set_shared_budget(self._budget())
+        self.assertEqual(50, other_throttler._id_to_limit_map["LIMIT"].limit)
+        throttler.update_shared_budget_share(throttler._shared_budget.refresh(force=True))
+        self.assertEqual(25, throttler._id_to_limit_map["LIMIT"].limit)
+
+        other_throttler.set_shared_budget(None)
+        throttler.update_shared_budget_share(throttler._shared_budget.refresh(force=True))
+        self.assertEqual(50, throttler._id_to_limit_map["LIMIT"].limit)
+        self.assertEqual(100, other_throttler._id_to_limit_map["LIMIT"].limit)
+
+    def test_unregistered_budget_does_not_send_heartbeats(self):
+        budget = self._budget()
+        budget.register()
+        budget.unregister()
+
+        self.assertEqual(1, budget.refresh(force=True))
+        self.assertEqual(0, len(os.listdir(self.budget_directory)))
+
+    def test_execute_task_does_not_refresh_the_shared_budget(self):
+        throttler = AsyncThrottler(rate_limits=[RateLimit(limit_id="LIMIT", limit=100, time_interval=1)],
+                                   limits_share_percentage=Decimal("100"))
+        throttler.set_shared_budget(self._budget())
+
+        with patch.object(SharedRateLimitBudget, "refresh") as refresh_mock:
+            throttler.execute_task("LIMIT")
+
+        refresh_mock.assert_not_called()
+        throttler.set_shared_budget(None)
+
+    def test_background_task_sends_heartbeats_and_updates_the_share_without_requests(self):
+        rate_limits = [RateLimit(limit_id="LIMIT", limit=100, time_interval=1)]
+        throttler = AsyncThrottler(rate_limits=rate_limits, limits_share_percentage=Decimal("100"))
+        heartbeat_interval = 0.05
+
+        async def run():
+            throttler.set_shared_budget(self._budget(heartbeat_interval=heartbeat_interval))
+            self.assertIsNotNone(throttler._shared_budget_task)
+            heartbeat_path = throttler._shared_budget._heartbeat_path
+            first_heartbeat = os.path.getmtime(heartbeat_path)
+
+            other_budget = self._budget(heartbeat_interval=heartbeat_interval)
+            other_budget.register()
+            await asyncio.sleep(heartbeat_interval * 3)
+
+            self.assertEqual(50, throttler._id_to_limit_map["LIMIT"].limit)
+            self.assertGreater(os.path.getmtime(heartbeat_path), first_heartbeat)
+
+            task = throttler._shared_budget_task
+            throttler.set_shared_budget(None)
+            await asyncio.sleep(0)
+            self.assertTrue(task.cancelled())
+            self.assertIsNone(throttler._shared_budget_task)
+            other_budget.unregister()
+
+        asyncio.get_event_loop().run_until_complete(run())
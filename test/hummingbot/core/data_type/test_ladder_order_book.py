@@ -0,0 +1,187 @@
+import random
+import unittest
+
+import numpy as np
+
+from hummingbot.core.data_type.ladder_order_book import LadderOrderBook
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+
+
+class LadderOrderBookUnitTest(unittest.TestCase):
+
+    @staticmethod
+    def _random_rows(rng: random.Random, mid: int, is_bid: bool, count: int, update_id: int):
+        rows = []
+        for _ in range(count):
+            offset = int(rng.expovariate(0.1))
+            price = (mid - 1 - offset) if is_bid else (mid + 1 + offset)
+            amount = 0.0 if rng.random() < 0.3 else round(rng.uniform(0.1, 10), 2)
+            rows.append(OrderBookRow(float(price), amount, update_id))
+        return rows
+
+    def assert_books_equal(self, expected: OrderBook, actual: OrderBook):
+        self.assertEqual(list(expected.bid_entries()), list(actual.bid_entries()))
+        self.assertEqual(list(expected.ask_entries()), list(actual.ask_entries()))
+        self.assertEqual(expected.get_price(True), actual.get_price(True))
+        self.assertEqual(expected.get_price(False), actual.get_price(False))
+        self.assertEqual(expected.snapshot_uid, actual.snapshot_uid)
+        self.assertEqual(expected.last_diff_uid, actual.last_diff_uid)
+
+    def test_matches_set_based_order_book_on_random_diff_stream(self):
+        rng = random.Random(42)
+        for dex in (False, True):
+            order_book = OrderBook(dex=dex)
+            ladder_order_book = LadderOrderBook(dex=dex)
+            mid = 1000
+            bids = self._random_rows(rng, mid, True, 200, 1)
+            asks = self._random_rows(rng, mid, False, 200, 1)
+            order_book.apply_snapshot(bids, asks, 1)
+            ladder_order_book.apply_snapshot(bids, asks, 1)
+            self.assert_books_equal(order_book, ladder_order_book)
+
+            for update_id in range(2, 2000):
+                mid += rng.choice((-1, 0, 1))
+                bids = self._random_rows(rng, mid, True, rng.randint(0, 5), update_id)
+                asks = self._random_rows(rng, mid, False, rng.randint(0, 5), update_id)
+                order_book.apply_diffs(bids, asks, update_id)
+                ladder_order_book.apply_diffs(bids, asks, update_id)
+            self.assert_books_equal(order_book, ladder_order_book)
+            for volume in (0.5, 10, 100, 1e9):
+                for is_buy in (True, False):
+                    np.testing.assert_equal(order_book.get_vwap_for_volume(is_buy, volume).result_price,
+                                            ladder_order_book.get_vwap_for_volume(is_buy, volume).result_price)
+                    np.testing.assert_equal(order_book.get_price_for_volume(is_buy, volume).result_price,
+                                            ladder_order_book.get_price_for_volume(is_buy, volume).result_price)
+            for depth in (None, 20):
+                for expected_side, actual_side in zip(order_book.snapshot_arrays(depth),
+                                                      ladder_order_book.snapshot_arrays(depth)):
+                    np.testing.assert_array_equal(expected_side, actual_side)
+            volumes = np.array([100, 0.5, 1e9, 10])
+            for is_buy in (True, False):
+                expected = order_book.get_vwap_for_volumes(is_buy, volumes)
+                actual = ladder_order_book.get_vwap_for_volumes(is_buy, volumes)
+                for expected_values, actual_values in zip(expected, actual):
+                    np.testing.assert_array_equal(expected_values, actual_values)
+
+    def test_depth_index_matches_walking_queries(self):
+        rng = random.Random(7)
+        order_book = LadderOrderBook()
+        indexed_order_book = LadderOrderBook(depth_index=True)
+        self.assertFalse(order_book.depth_index)
+        self.assertTrue(indexed_order_book.depth_index)
+        mid = 1000
+        bids = self._random_rows(rng, mid, True, 300, 1)
+        asks = self._random_rows(rng, mid, False, 300, 1)
+        order_book.apply_snapshot(bids, asks, 1)
+        indexed_order_book.apply_snapshot(bids, asks, 1)
+
+        for update_id in range(2, 500):
+            mid += rng.choice((-1, 0, 1))
+            bids = self._random_rows(rng, mid, True, rng.randint(0, 5), update_id)
+            asks = self._random_rows(rng, mid, False, rng.randint(0, 5), update_id)
+            order_book.apply_diffs(bids, asks, update_id)
+            indexed_order_book.apply_diffs(bids, asks, update_id)
+            if update_id % 10 != 0:
+                continue
+            for is_buy in (True, False):
+                for volume in (0.5, 7.3, 55, 1e9):
+                    for query in ("get_price_for_volume",
+                                  "get_vwap_for_volume",
+                                  "get_price_for_quote_volume",
+                                  "get_quote_volume_for_base_amount"):
+                        query_volume = volume * mid if query == "get_price_for_quote_volume" else volume
+                        expected = getattr(order_book, query)(is_buy, query_volume)
+                        actual = getattr(indexed_order_book, query)(is_buy, query_volume)
+                        np.testing.assert_allclose(expected.result_price, actual.result_price, rtol=1e-9)
+                        np.testing.assert_allclose(expected.result_volume, actual.result_volume, rtol=1e-9)
+                for price_offset in (-30, -5, 0, 5, 30):
+                    for query in ("get_volume_for_price", "get_quote_volume_for_price"):
+                        expected = getattr(order_book, query)(is_buy, mid + price_offset)
+                        actual = getattr(indexed_order_book, query)(is_buy, mid + price_offset)
+                        np.testing.assert_equal(expected.result_price, actual.result_price)
+                        np.testing.assert_allclose(expected.result_volume, actual.result_volume, rtol=1e-9)
+
+    def test_snapshot_keeps_first_entry_for_duplicated_price(self):
+        order_book = LadderOrderBook()
+        order_book.apply_snapshot([OrderBookRow(10, 1, 1), OrderBookRow(10, 2, 1), OrderBookRow(9, 3, 1)],
+                                  [OrderBookRow(11, 1, 1)],
+                                  1)
+
+        self.assertEqual([OrderBookRow(10, 1, 1), OrderBookRow(9, 3, 1)], list(order_book.bid_entries()))
+        self.assertEqual(10, order_book.get_price(False))
+        self.assertEqual(11, order_book.get_price(True))
+
+    def test_diff_updates_and_removes_levels(self):
+        order_book = LadderOrderBook()
+        order_book.apply_snapshot([OrderBookRow(10, 1, 1), OrderBookRow(9, 1, 1)],
+                                  [OrderBookRow(11, 1, 1), OrderBookRow(12, 1, 1)],
+                                  1)
+        order_book.apply_diffs([OrderBookRow(10, 0, 2), OrderBookRow(9, 5, 2), OrderBookRow(8, 0, 2)],
+                               [OrderBookRow(10.5, 2, 2)],
+                               2)
+
+        self.assertEqual([OrderBookRow(9, 5, 2)], list(order_book.bid_entries()))
+        self.assertEqual([OrderBookRow(10.5, 2, 2), OrderBookRow(11, 1, 1), OrderBookRow(12, 1, 1)],
+                         list(order_book.ask_entries()))
+        self.assertEqual(9, order_book.get_price(False))
+        self.assertEqual(10.5, order_book.get_price(True))
+        self.assertEqual(2, order_book.last_diff_uid)
+
+    def test_truncate_overlap_entries_dex(self):
+        order_book = LadderOrderBook(dex=True)
+        bids_array = np.array([[1, 1, 1], [2, 1, 2], [3, 1, 3], [50, 0.01, 4]], dtype=np.float64)
+        asks_array = np.array([[4, 1, 1], [5, 1, 2], [6, 1, 3], [7, 1, 4]], dtype=np.float64)
+        order_book.apply_numpy_snapshot(bids_array, asks_array)
+        bids, asks = order_book.snapshot
+        self.assertEqual([3., 1., 3.], bids.iloc[0].tolist())
+        self.assertEqual([4., 1., 1.], asks.iloc[0].tolist())
+
+        order_book.apply_numpy_diffs(np.array([[3.5, 1, 5]]), np.array([[2, 0.1, 5]]))
+        bids, asks = order_book.snapshot
+        self.assertEqual([3.5, 1., 5.], bids.iloc[0].tolist())
+        self.assertEqual([4., 1., 1.], asks.iloc[0].tolist())
+
+    def test_truncate_overlap_entries_cex(self):
+        order_book = LadderOrderBook(dex=False)
+        bids_array = np.array([[1, 1, 1], [2, 1, 2], [3, 1, 3]], dtype=np.float64)
+        asks_array = np.array([[4, 1, 1], [5, 1, 2], [6, 1, 3], [7, 1, 4]], dtype=np.float64)
+        order_book.apply_numpy_snapshot(bids_array, asks_array)
+
+        order_book.apply_numpy_diffs(np.array([[50, 0.01, 6]]), np.array([[2, 0.1, 5]]))
+        bids, asks = order_book.snapshot
+        self.assertEqual([50., 0.01, 6.], bids.iloc[0].tolist())
+        self.assertEqual(0, len(asks))
+
+    def test_get_price_raises_when_empty(self):
+        order_book = LadderOrderBook()
+
+        with self.assertRaises(EnvironmentError):
+            order_book.get_price(True)
+        with self.assertRaises(EnvironmentError):
+            order_book.get_price(False)
+
+    def test_max_depth_matches_set_based_order_book(self):
+        rng = random.Random(3)
+        order_book = OrderBook(max_depth=10, depth_margin=5)
+        ladder_order_book = LadderOrderBook(depth_index=True, max_depth=10, depth_margin=5)
+        mid = 1000
+        bids = self._random_rows(rng, mid, True, 100, 1)
+        asks = self._random_rows(rng, mid, False, 100, 1)
+        order_book.apply_snapshot(bids, asks, 1)
+        ladder_order_book.apply_snapshot(bids, asks, 1)
+        self.assert_books_equal(order_book, ladder_order_book)
+        self.assertLessEqual(len(list(ladder_order_book.bid_entries())), 15)
+
+        for update_id in range(2, 500):
+            mid += rng.choice((-1, 0, 1))
+            bids = self._random_rows(rng, mid, True, rng.randint(0, 5), update_id)
+            asks = self._random_rows(rng, mid, False, rng.randint(0, 5), update_id)
+            order_book.apply_diffs(bids, asks, update_id)
+            ladder_order_book.apply_diffs(bids, asks, update_id)
+        self.assert_books_equal(order_book, ladder_order_book)
+        self.assertLessEqual(len(list(ladder_order_book.ask_entries())), 15)
+        for is_buy in (True, False):
+            np.testing.assert_allclose(order_book.get_vwap_for_volume(is_buy, 20).result_price,
+                                       ladder_order_book.get_vwap_for_volume(is_buy, 20).result_price,
+                                       rtol=1e-9)
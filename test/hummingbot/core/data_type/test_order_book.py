@@ -1,8 +1,11 @@
 #!/usr/bin/env python
 
+import asyncio
 import logging
 import unittest
 from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import OrderBookEvent
 import numpy as np
 
 
@@ -50,6 +53,210 @@ class OrderBookUnitTest(unittest.TestCase):
         self.assertEqual(best_bid, [50., 0.01, 6.])
         self.assertEqual(best_ask, 0)
 
+    def test_depth_queries(self):
+        order_book = OrderBook()
+        bids_array = np.array([[99, 1, 1], [98, 2, 1], [97, 3, 1]], dtype=np.float64)
+        asks_array = np.array([[101, 1, 1], [102, 2, 1], [103, 3, 1]], dtype=np.float64)
+        order_book.apply_numpy_snapshot(bids_array, asks_array)
+
+        result = order_book.get_price_for_volume(True, 2)
+        self.assertEqual(102, result.result_price)
+        self.assertEqual(2, result.result_volume)
+        result = order_book.get_price_for_volume(False, 10)
+        self.assertTrue(np.isnan(result.result_price))
+        self.assertEqual(6, result.result_volume)
+
+        result = order_book.get_vwap_for_volume(True, 2)
+        self.assertAlmostEqual((101 + 102) / 2, result.result_price)
+        self.assertEqual(2, result.result_volume)
+        result = order_book.get_vwap_for_volume(False, 4)
+        self.assertAlmostEqual((99 + 98 * 2 + 97) / 4, result.result_price)
+        self.assertEqual(4, result.result_volume)
+
+        result = order_book.get_price_for_quote_volume(True, 200)
+        self.assertEqual(102, result.result_price)
+        self.assertEqual(200, result.result_volume)
+        result = order_book.get_price_for_quote_volume(False, 99)
+        self.assertEqual(99, result.result_price)
+
+        result = order_book.get_quote_volume_for_base_amount(True, 2)
+        self.assertEqual(101 + 102, result.result_volume)
+        result = order_book.get_quote_volume_for_base_amount(False, 100)
+        self.assertEqual(99 + 98 * 2 + 97 * 3, result.result_volume)
+
+        result = order_book.get_volume_for_price(True, 102.5)
+        self.assertEqual(102, result.result_price)
+        self.assertEqual(3, result.result_volume)
+        result = order_book.get_volume_for_price(False, 98)
+        self.assertEqual(98, result.result_price)
+        self.assertEqual(3, result.result_volume)
+        result = order_book.get_volume_for_price(False, 100)
+        self.assertTrue(np.isnan(result.result_price))
+        self.assertEqual(0, result.result_volume)
+
+        result = order_book.get_quote_volume_for_price(True, 102)
+        self.assertEqual(102, result.result_price)
+        self.assertEqual(101 + 102 * 2, result.result_volume)
+        result = order_book.get_quote_volume_for_price(False, 97)
+        self.assertEqual(97, result.result_price)
+        self.assertEqual(99 + 98 * 2 + 97 * 3, result.result_volume)
+
+    def test_get_vwap_for_volumes(self):
+        order_book = OrderBook()
+        bids_array = np.array([[99, 1, 1], [98, 2, 1], [97, 3, 1]], dtype=np.float64)
+        asks_array = np.array([[101, 1, 1], [102, 2, 1], [103, 3, 1]], dtype=np.float64)
+        order_book.apply_numpy_snapshot(bids_array, asks_array)
+        volumes = np.array([4, 0.5, 100, 1, 6])
+
+        for is_buy in (True, False):
+            result = order_book.get_vwap_for_volumes(is_buy, volumes)
+
+            np.testing.assert_array_equal(volumes, result.query_volumes)
+            for i, volume in enumerate(volumes):
+                np.testing.assert_allclose(order_book.get_vwap_for_volume(is_buy, volume).result_price,
+                                           result.result_vwaps[i])
+                np.testing.assert_equal(order_book.get_price_for_volume(is_buy, volume).result_price,
+                                        result.result_prices[i])
+                self.assertEqual(order_book.get_vwap_for_volume(is_buy, volume).result_volume, result.result_volumes[i])
+
+        result = order_book.get_vwap_for_volumes(True, [])
+        self.assertEqual(0, len(result.result_prices))
+
+    def test_snapshot_arrays(self):
+        order_book = OrderBook()
+        bids_array = np.array([[97, 3, 1], [99, 1, 2], [98, 2, 1]], dtype=np.float64)
+        asks_array = np.array([[103, 3, 1], [101, 1, 2], [102, 2, 1]], dtype=np.float64)
+        order_book.apply_numpy_snapshot(bids_array, asks_array)
+
+        bids, asks = order_book.snapshot_arrays()
+        np.testing.assert_array_equal([[99, 1, 2], [98, 2, 1], [97, 3, 1]], bids)
+        np.testing.assert_array_equal([[101, 1, 2], [102, 2, 1], [103, 3, 1]], asks)
+        self.assertEqual(np.float64, bids.dtype)
+
+        bids, asks = order_book.snapshot_arrays(depth=2)
+        np.testing.assert_array_equal([[99, 1, 2], [98, 2, 1]], bids)
+        np.testing.assert_array_equal([[101, 1, 2], [102, 2, 1]], asks)
+
+        bids, asks = order_book.snapshot_arrays(depth=0)
+        self.assertEqual((0, 3), bids.shape)
+        self.assertEqual((0, 3), asks.shape)
+
+        bids_df, asks_df = order_book.snapshot
+        np.testing.assert_array_equal(order_book.snapshot_arrays()[0], bids_df.values)
+        np.testing.assert_array_equal(order_book.snapshot_arrays()[1], asks_df.values)
+
+        bids, asks = OrderBook().snapshot_arrays(depth=20)
+        self.assertEqual((0, 3), bids.shape)
+        self.assertEqual((0, 3), asks.shape)
+
+    def test_apply_diff_columns(self):
+        order_book = OrderBook()
+        order_book.apply_snapshot_columns(
+            (np.array([99, 98], dtype=np.float64), np.array([1, 2], dtype=np.float64)),
+            (np.array([101, 102], dtype=np.float64), np.array([1, 2], dtype=np.float64)),
+            1)
+        order_book.apply_diff_columns(
+            (np.array([99.5, 99], dtype=np.float64), np.array([3, 0], dtype=np.float64)),
+            (np.array([102], dtype=np.float64), np.array([5], dtype=np.float64)),
+            2)
+
+        bids, asks = order_book.snapshot_arrays()
+        np.testing.assert_array_equal([[99.5, 3, 2], [98, 2, 1]], bids)
+        np.testing.assert_array_equal([[101, 1, 1], [102, 5, 2]], asks)
+        self.assertEqual(2, order_book.last_diff_uid)
+
+        with self.assertRaises(ValueError):
+            order_book.apply_diff_columns(
+                (np.array([99], dtype=np.float64), np.array([1, 2], dtype=np.float64)),
+                (np.empty(0, dtype=np.float64), np.empty(0, dtype=np.float64)),
+                3)
+
+    def test_max_depth(self):
+        order_book = OrderBook(max_depth=2, depth_margin=1)
+        self.assertEqual(2, order_book.max_depth)
+        self.assertEqual(1, order_book.depth_margin)
+        bids_array = np.array([[99, 1, 1], [98, 1, 1], [97, 1, 1], [96, 1, 1]], dtype=np.float64)
+        asks_array = np.array([[101, 1, 1], [102, 1, 1], [103, 1, 1], [104, 1, 1]], dtype=np.float64)
+        order_book.apply_numpy_snapshot(bids_array, asks_array)
+
+        bids, asks = order_book.snapshot_arrays()
+        np.testing.assert_array_equal([99, 98, 97], bids[:, 0])
+        np.testing.assert_array_equal([101, 102, 103], asks[:, 0])
+
+        # The margin level refills the book when a level close to the top is removed
+        order_book.apply_numpy_diffs(np.array([[99, 0, 2], [95, 1, 2]], dtype=np.float64),
+                                     np.array([[100.5, 1, 2]], dtype=np.float64))
+        bids, asks = order_book.snapshot_arrays()
+        np.testing.assert_array_equal([98, 97, 95], bids[:, 0])
+        np.testing.assert_array_equal([100.5, 101, 102], asks[:, 0])
+        self.assertEqual(100.5, order_book.get_price(True))
+
+        order_book.set_max_depth(1, 0)
+        bids, asks = order_book.snapshot_arrays()
+        np.testing.assert_array_equal([98], bids[:, 0])
+        np.testing.assert_array_equal([100.5], asks[:, 0])
+
+        order_book.set_max_depth(None)
+        self.assertIsNone(order_book.max_depth)
+        order_book.apply_numpy_diffs(np.array([[97, 1, 3]], dtype=np.float64), np.array([[101, 1, 3]], dtype=np.float64))
+        self.assertEqual((2, 3), order_book.snapshot_arrays()[0].shape)
+
+        with self.assertRaises(ValueError):
+            order_book.set_max_depth(0)
+
+    def test_top_of_book_changed_events(self):
+        order_book = OrderBook()
+        event_logger = EventLogger()
+        order_book.add_listener(OrderBookEvent.TopOfBookChangedEvent, event_logger)
+        bids_array = np.array([[99, 1, 1], [98, 2, 1]], dtype=np.float64)
+        asks_array = np.array([[101, 1, 1], [102, 2, 1]], dtype=np.float64)
+        order_book.apply_numpy_snapshot(bids_array, asks_array)
+
+        self.assertEqual(1, len(event_logger.event_log))
+        event = event_logger.event_log[0]
+        self.assertEqual((99, 101, 1), (event.best_bid, event.best_ask, event.update_id))
+
+        # Changes below the top of book don't trigger events
+        order_book.apply_numpy_diffs(np.array([[98, 5, 2]], dtype=np.float64), np.array([[102, 0, 2]], dtype=np.float64))
+        self.assertEqual(1, len(event_logger.event_log))
+
+        order_book.apply_numpy_diffs(np.array([[99, 0, 3]], dtype=np.float64), np.empty((0, 3)))
+        self.assertEqual(2, len(event_logger.event_log))
+        event = event_logger.event_log[1]
+        self.assertEqual((98, 101, 3), (event.best_bid, event.best_ask, event.update_id))
+
+        order_book.top_of_book_event_interval = 1000
+        order_book.apply_numpy_diffs(np.array([[98.5, 1, 4]]), np.empty((0, 3)))
+        self.assertEqual(2, len(event_logger.event_log))
+
+        # The held back change is published once the interval has elapsed
+        order_book.top_of_book_event_interval = 0
+        order_book.publish_pending_top_of_book()
+        self.assertEqual(3, len(event_logger.event_log))
+        event = event_logger.event_log[2]
+        self.assertEqual((98.5, 101, 4), (event.best_bid, event.best_ask, event.update_id))
+
+    def test_throttled_top_of_book_change_published_when_book_goes_quiet(self):
+        order_book = OrderBook()
+        event_logger = EventLogger()
+        order_book.add_listener(OrderBookEvent.TopOfBookChangedEvent, event_logger)
+        order_book.top_of_book_event_interval = 0.05
+
+        async def apply_updates_and_wait():
+            order_book.apply_numpy_snapshot(np.array([[99, 1, 1]], dtype=np.float64),
+                                            np.array([[101, 1, 1]], dtype=np.float64))
+            order_book.apply_numpy_diffs(np.array([[99.5, 1, 2]], dtype=np.float64), np.empty((0, 3)))
+            order_book.apply_numpy_diffs(np.array([[100, 1, 3]], dtype=np.float64), np.empty((0, 3)))
+            self.assertEqual(1, len(event_logger.event_log))
+            # No more updates arrive, the last top of book is published at the end of the interval
+            await asyncio.sleep(0.1)
+
+        asyncio.get_event_loop().run_until_complete(apply_updates_and_wait())
+
+        self.assertEqual(2, len(event_logger.event_log))
+        event = event_logger.event_log[1]
+        self.assertEqual((100, 101, 3), (event.best_bid, event.best_ask, event.update_id))
+
 
 def main():
     logging.basicConfig(level=logging.INFO)
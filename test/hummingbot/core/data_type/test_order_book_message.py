@@ -248,3 +248,30 @@ class OrderBookMessageTest(unittest.TestCase):
         self.assertTrue(diff1 < snapshot2)  # based on id
         self.assertTrue(trade1 < snapshot1)  # based on timestamp
         self.assertTrue(diff2 < trade1)  # if same ts, ob messages < trade messages
+
+    def test_bid_and_ask_columns(self):
+        msg = OrderBookMessage(
+            message_type=OrderBookMessageType.DIFF,
+            content={
+                "update_id": 2,
+                "bids": [["99.5", "3"], ["99", "0"]],
+                "asks": [["101", "1.5", "extra"]],
+            },
+            timestamp=time.time(),
+        )
+
+        bid_prices, bid_amounts = msg.bid_columns
+        ask_prices, ask_amounts = msg.ask_columns
+        self.assertEqual([99.5, 99], bid_prices.tolist())
+        self.assertEqual([3, 0], bid_amounts.tolist())
+        self.assertEqual([101], ask_prices.tolist())
+        self.assertEqual([1.5], ask_amounts.tolist())
+        self.assertIs(msg.bid_columns, msg.bid_columns)
+
+        msg = OrderBookMessage(
+            message_type=OrderBookMessageType.SNAPSHOT,
+            content={"update_id": 1, "bids": [], "asks": []},
+            timestamp=time.time(),
+        )
+        self.assertEqual(0, len(msg.bid_columns.prices))
+        self.assertEqual(0, len(msg.ask_columns.amounts))
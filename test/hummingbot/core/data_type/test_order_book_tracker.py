@@ -0,0 +1,180 @@
+import asyncio
+import unittest
+from typing import Awaitable, Dict
+from unittest.mock import AsyncMock, MagicMock
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_tracker import OrderBookDiffDispatcher, OrderBookTracker
+from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+
+
+class OrderBookTrackerTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop = asyncio.get_event_loop()
+        cls.trading_pairs = ["COINALPHA-HBOT", "COINBETA-HBOT", "COINGAMMA-HBOT"]
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.snapshot_requests: Dict[str, asyncio.Future] = {}
+        self.data_source = MagicMock()
+        self.data_source.get_new_order_book.side_effect = self._get_new_order_book
+
+    def tearDown(self) -> None:
+        for task in self.tracker._tracking_tasks.values():
+            task.cancel()
+        super().tearDown()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 1):
+        return self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+
+    async def _wait_for_snapshot_request(self, trading_pair: str):
+        while trading_pair not in self.snapshot_requests:
+            await asyncio.sleep(0)
+
+    def _get_new_order_book(self, trading_pair: str) -> asyncio.Future:
+        self.snapshot_requests[trading_pair] = self.ev_loop.create_future()
+        return self.snapshot_requests[trading_pair]
+
+    def test_parallel_init_marks_each_order_book_ready(self):
+        self.tracker = OrderBookTracker(self.data_source, self.trading_pairs, parallel_init=True)
+        init_task = self.ev_loop.create_task(self.tracker._init_order_books())
+        for trading_pair in self.trading_pairs:
+            self.async_run_with_timeout(self._wait_for_snapshot_request(trading_pair))
+
+        # All the snapshots are requested without waiting for the previous ones
+        self.assertEqual(set(self.trading_pairs), set(self.snapshot_requests))
+        self.assertEqual([], self.tracker.ready_trading_pairs)
+
+        self.snapshot_requests["COINBETA-HBOT"].set_result(OrderBook())
+        self.async_run_with_timeout(self.tracker.wait_order_book_ready("COINBETA-HBOT"))
+
+        self.assertEqual(["COINBETA-HBOT"], self.tracker.ready_trading_pairs)
+        self.assertTrue(self.tracker.is_order_book_ready("COINBETA-HBOT"))
+        self.assertFalse(self.tracker.is_order_book_ready("COINALPHA-HBOT"))
+        self.assertFalse(self.tracker.ready)
+
+        for trading_pair in ("COINALPHA-HBOT", "COINGAMMA-HBOT"):
+            self.snapshot_requests[trading_pair].set_result(OrderBook())
+        self.async_run_with_timeout(init_task)
+
+        self.assertTrue(self.tracker.ready)
+        self.assertEqual(self.trading_pairs, self.tracker.ready_trading_pairs)
+
+        self.tracker.stop()
+        self.assertEqual([], self.tracker.ready_trading_pairs)
+
+    def test_sequential_init_requests_one_snapshot_at_a_time(self):
+        self.tracker = OrderBookTracker(self.data_source, self.trading_pairs)
+        self.tracker._sleep = MagicMock(side_effect=lambda delay: asyncio.sleep(0))
+        init_task = self.ev_loop.create_task(self.tracker._init_order_books())
+        self.async_run_with_timeout(self._wait_for_snapshot_request("COINALPHA-HBOT"))
+
+        self.assertEqual(["COINALPHA-HBOT"], list(self.snapshot_requests))
+        for trading_pair in self.trading_pairs:
+            self.async_run_with_timeout(self._wait_for_snapshot_request(trading_pair))
+            self.assertEqual(trading_pair, list(self.snapshot_requests)[-1])
+            self.snapshot_requests[trading_pair].set_result(OrderBook())
+            self.async_run_with_timeout(self.tracker.wait_order_book_ready(trading_pair))
+        self.async_run_with_timeout(init_task)
+
+        self.assertTrue(self.tracker.ready)
+        self.assertEqual(self.trading_pairs, self.tracker.ready_trading_pairs)
+
+    def _diff_message(self, trading_pair: str, update_id: int, bid_price: float, bid_amount: float):
+        return OrderBookMessage(OrderBookMessageType.DIFF, {
+            "trading_pair": trading_pair,
+            "update_id": update_id,
+            "bids": [[bid_price, bid_amount]],
+            "asks": [],
+        }, timestamp=update_id)
+
+    def test_direct_diff_dispatch(self):
+        trading_pair = self.trading_pairs[0]
+        self.tracker = OrderBookTracker(self.data_source, [trading_pair], direct_diff_dispatch=True)
+        dispatcher = OrderBookDiffDispatcher(self.tracker._dispatch_diff_message)
+
+        # Diffs received before the order book is initialized are saved
+        dispatcher.put_nowait(self._diff_message(trading_pair, 2, 99, 1))
+        self.assertEqual(1, self.tracker.diff_metrics(trading_pair).queue_depth)
+
+        order_book = OrderBook()
+        order_book.apply_snapshot([], [], 1)
+        self.tracker._order_books[trading_pair] = order_book
+        self.tracker._tracking_message_queues[trading_pair] = asyncio.Queue()
+
+        # The saved diff has to be processed first, so the new one is queued behind it
+        self.async_run_with_timeout(dispatcher.put(self._diff_message(trading_pair, 3, 98, 1)))
+        metrics = self.tracker.diff_metrics(trading_pair)
+        self.assertEqual(2, metrics.queue_depth)
+        self.assertEqual(1, metrics.diffs_queued)
+        self.assertEqual(0, metrics.diffs_applied_directly)
+
+        self.tracker._tracking_tasks[trading_pair] = self.ev_loop.create_task(
+            self.tracker._track_single_book(trading_pair))
+        self.async_run_with_timeout(asyncio.sleep(0.01))
+        self.assertEqual(0, self.tracker.diff_metrics(trading_pair).queue_depth)
+        self.assertEqual(3, order_book.last_diff_uid)
+        self.assertGreater(self.tracker.diff_metrics(trading_pair).last_lag, 0)
+
+        # With nothing pending the diff is applied right away
+        dispatcher.put_nowait(self._diff_message(trading_pair, 4, 100, 2))
+        self.assertEqual(4, order_book.last_diff_uid)
+        self.assertEqual(100, order_book.get_price(False))
+        metrics = self.tracker.diff_metrics(trading_pair)
+        self.assertEqual(1, metrics.diffs_applied_directly)
+        self.assertEqual(0, metrics.queue_depth)
+        self.assertEqual([2, 3, 4], [message.update_id for message in self.tracker._past_diffs_windows[trading_pair]])
+
+        # Diffs older than the snapshot are dropped
+        order_book.apply_snapshot([], [], 10)
+        dispatcher.put_nowait(self._diff_message(trading_pair, 5, 101, 2))
+        self.assertEqual(4, order_book.last_diff_uid)
+
+    def test_sequence_gap_triggers_single_pair_resync(self):
+        trading_pair = self.trading_pairs[0]
+        self.tracker = OrderBookTracker(self.data_source, [trading_pair], direct_diff_dispatch=True, resync_on_gap=True)
+        snapshot = OrderBookMessage(OrderBookMessageType.SNAPSHOT, {
+            "trading_pair": trading_pair,
+            "update_id": 20,
+            "bids": [[90, 1]],
+            "asks": [[110, 1]],
+        }, timestamp=20)
+        self.data_source.get_order_book_snapshot_message = AsyncMock(return_value=snapshot)
+        self.data_source.is_sequence_gap.side_effect = (
+            lambda last_update_id, message: OrderBookTrackerDataSource.is_sequence_gap(
+                self.data_source, last_update_id=last_update_id, message=message))
+        order_book = OrderBook()
+        order_book.apply_snapshot([], [], 1)
+        self.tracker._order_books[trading_pair] = order_book
+        self.tracker._tracking_message_queues[trading_pair] = asyncio.Queue()
+        self.tracker._tracking_tasks[trading_pair] = self.ev_loop.create_task(
+            self.tracker._track_single_book(trading_pair))
+        dispatcher = OrderBookDiffDispatcher(self.tracker._dispatch_diff_message)
+
+        diff = self._diff_message(trading_pair, 3, 99, 1)
+        diff.content["first_update_id"] = 2
+        dispatcher.put_nowait(diff)
+        self.assertEqual(0, self.tracker.diff_metrics(trading_pair).sequence_gaps)
+
+        diff = self._diff_message(trading_pair, 8, 98, 1)
+        diff.content["first_update_id"] = 6
+        dispatcher.put_nowait(diff)
+        diff = self._diff_message(trading_pair, 10, 97, 1)
+        diff.content["first_update_id"] = 10
+        dispatcher.put_nowait(diff)
+        self.assertEqual(2, self.tracker.diff_metrics(trading_pair).sequence_gaps)
+
+        self.async_run_with_timeout(asyncio.sleep(0.01))
+
+        # The second gap happened while the first resync was in progress
+        self.data_source.get_order_book_snapshot_message.assert_awaited_once_with(trading_pair)
+        self.assertEqual(20, order_book.snapshot_uid)
+        self.assertEqual(90, order_book.get_price(False))
+        self.assertEqual(110, order_book.get_price(True))
+
+        # Diffs without first update ID are not checked
+        dispatcher.put_nowait(self._diff_message(trading_pair, 30, 95, 1))
+        self.assertEqual(2, self.tracker.diff_metrics(trading_pair).sequence_gaps)
@@ -0,0 +1,60 @@
+import asyncio
+import unittest
+from typing import List, Tuple
+
+from hummingbot.core.event.event_forwarder import BatchEventForwarder
+from hummingbot.core.pubsub import PubSub
+from test.mock.mock_events import MockEvent, MockEventType
+
+
+class BatchEventListenerTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.ev_loop = asyncio.get_event_loop()
+        self.pubsub = PubSub()
+        self.other_pubsub = PubSub()
+        self.batches: List[Tuple[int, PubSub, List[MockEvent]]] = []
+
+    def _register_batch(self, event_tag: int, pubsub: PubSub, events: List[MockEvent]):
+        self.batches.append((event_tag, pubsub, events))
+
+    def test_events_delivered_in_batches_on_next_loop_iteration(self):
+        forwarder = BatchEventForwarder(self._register_batch)
+        for pubsub in (self.pubsub, self.other_pubsub):
+            pubsub.add_listener(MockEventType.EVENT_ZERO, forwarder)
+        self.pubsub.add_listener(MockEventType.EVENT_ONE, forwarder)
+
+        self.pubsub.trigger_event(MockEventType.EVENT_ZERO, MockEvent(payload=1))
+        self.pubsub.trigger_event(MockEventType.EVENT_ONE, MockEvent(payload=2))
+        self.pubsub.trigger_event(MockEventType.EVENT_ZERO, MockEvent(payload=3))
+        self.other_pubsub.trigger_event(MockEventType.EVENT_ZERO, MockEvent(payload=4))
+
+        self.assertEqual([], self.batches)
+        self.assertEqual(4, forwarder.pending_events_count)
+
+        self.ev_loop.run_until_complete(asyncio.sleep(0))
+
+        self.assertEqual(
+            [
+                (MockEventType.EVENT_ZERO.value, self.pubsub, [MockEvent(payload=1), MockEvent(payload=3)]),
+                (MockEventType.EVENT_ONE.value, self.pubsub, [MockEvent(payload=2)]),
+                (MockEventType.EVENT_ZERO.value, self.other_pubsub, [MockEvent(payload=4)]),
+            ],
+            self.batches)
+        self.assertEqual(0, forwarder.pending_events_count)
+        self.assertEqual(0, forwarder.current_event_tag)
+
+    def test_max_batch_size_flushes_right_away(self):
+        forwarder = BatchEventForwarder(self._register_batch, flush_interval=60, max_batch_size=2)
+        self.pubsub.add_listener(MockEventType.EVENT_ZERO, forwarder)
+
+        for payload in range(3):
+            self.pubsub.trigger_event(MockEventType.EVENT_ZERO, MockEvent(payload=payload))
+
+        self.assertEqual(
+            [(MockEventType.EVENT_ZERO.value, self.pubsub, [MockEvent(payload=0), MockEvent(payload=1)])],
+            self.batches)
+        self.assertEqual(1, forwarder.pending_events_count)
+
+        forwarder.flush()
+        self.assertEqual([MockEvent(payload=2)], self.batches[-1][2])
+        self.assertEqual(0, forwarder.pending_events_count)
@@ -7,7 +7,29 @@ from hummingbot.core.clock import (
     Clock,
     ClockMode
 )
-from hummingbot.core.time_iterator import TimeIterator
+from hummingbot.core.py_time_iterator import PyTimeIterator
+from hummingbot.core.time_iterator import EVENT_DRIVEN, TimeIterator
+
+
+class MockTimeIterator(PyTimeIterator):
+    def __init__(self, tick_duration: float = 0):
+        super().__init__()
+        self.ticks = []
+        self.tick_duration = tick_duration
+
+    def tick(self, timestamp: float):
+        self.ticks.append(timestamp)
+        if self.tick_duration > 0:
+            time.sleep(self.tick_duration)
+
+
+class ScheduledTimeIterator(MockTimeIterator):
+    def __init__(self, event_timestamps):
+        super().__init__()
+        self.event_timestamps = event_timestamps
+
+    def next_event_timestamp(self, timestamp: float) -> float:
+        return next((event for event in self.event_timestamps if event > timestamp), float("inf"))
 
 
 class ClockUnitTest(unittest.TestCase):
@@ -124,3 +146,83 @@ class ClockUnitTest(unittest.TestCase):
         self.clock_backtest.backtest_til(self.backtest_start_timestamp + self.tick_size)
         self.assertGreater(self.clock_backtest.current_timestamp, self.clock_backtest.start_time)
         self.assertLess(self.clock_backtest.current_timestamp, self.backtest_end_timestamp)
+
+    def test_iterators_ticked_at_their_tick_interval(self):
+        fast_iterator = MockTimeIterator()
+        slow_iterator = MockTimeIterator()
+        slow_iterator.tick_interval = 5
+        event_driven_iterator = MockTimeIterator()
+        event_driven_iterator.tick_interval = EVENT_DRIVEN
+        for iterator in (fast_iterator, slow_iterator, event_driven_iterator):
+            self.clock_backtest.add_iterator(iterator)
+
+        self.clock_backtest.backtest_til(self.backtest_start_timestamp + 30)
+
+        self.assertEqual(30, len(fast_iterator.ticks))
+        self.assertEqual(
+            [self.backtest_start_timestamp + offset for offset in (1, 6, 11, 16, 21, 26)],
+            slow_iterator.ticks)
+        self.assertEqual([], event_driven_iterator.ticks)
+
+    def test_invalid_tick_interval(self):
+        with self.assertRaises(ValueError):
+            TimeIterator().tick_interval = -1
+
+    def test_tick_timing_stats_and_overruns(self):
+        clock = Clock(ClockMode.REALTIME, tick_size=0.1)
+        fast_iterator = MockTimeIterator()
+        slow_iterator = MockTimeIterator(tick_duration=0.15)
+        for iterator in (fast_iterator, slow_iterator):
+            clock.add_iterator(iterator)
+
+        with clock, self.assertLogs(logger=Clock.logger().name, level="WARNING") as logs:
+            self.ev_loop.run_until_complete(clock.run_til(time.time() + 0.5))
+
+        self.assertGreater(clock.tick_overruns, 0)
+        fast_stats = clock.tick_stats[fast_iterator]
+        slow_stats = clock.tick_stats[slow_iterator]
+        self.assertEqual("MockTimeIterator", slow_stats.name)
+        self.assertEqual(len(slow_iterator.ticks), slow_stats.ticks_count)
+        self.assertEqual(slow_stats.ticks_count, slow_stats.overruns)
+        self.assertEqual(0, fast_stats.overruns)
+        self.assertGreaterEqual(slow_stats.max_duration, 0.15)
+        self.assertEqual(1, len(logs.records))
+        self.assertIn("Slowest iterator: MockTimeIterator", logs.records[0].getMessage())
+
+        clock.remove_iterator(slow_iterator)
+        self.assertNotIn(slow_iterator, clock.tick_stats)
+        clock.reset_tick_stats()
+        self.assertEqual(0, clock.tick_overruns)
+        self.assertEqual({}, clock.tick_stats)
+
+    def test_backtest_fast_forward(self):
+        start = self.backtest_start_timestamp
+        clock = Clock(ClockMode.BACKTEST, self.tick_size, start, start + 3600, fast_forward=True)
+        scheduled_iterator = ScheduledTimeIterator([start + 10.5, start + 100])
+        slow_iterator = MockTimeIterator()
+        slow_iterator.tick_interval = 600
+        for iterator in (scheduled_iterator, slow_iterator):
+            clock.add_iterator(iterator)
+
+        clock.backtest()
+
+        self.assertTrue(clock.fast_forward)
+        self.assertEqual(start + 3600, clock.current_timestamp)
+        self.assertEqual(
+            [start + offset for offset in (1, 11, 100, 601, 1201, 1801, 2401, 3001, 3600)],
+            scheduled_iterator.ticks)
+        self.assertEqual([start + offset for offset in (1, 601, 1201, 1801, 2401, 3001)], slow_iterator.ticks)
+
+    def test_backtest_fast_forward_stops_when_nothing_is_scheduled(self):
+        clock = Clock(ClockMode.BACKTEST, self.tick_size, self.backtest_start_timestamp, float("nan"), fast_forward=True)
+        scheduled_iterator = ScheduledTimeIterator([self.backtest_start_timestamp + 5])
+        event_driven_iterator = MockTimeIterator()
+        event_driven_iterator.tick_interval = EVENT_DRIVEN
+        for iterator in (scheduled_iterator, event_driven_iterator):
+            clock.add_iterator(iterator)
+
+        clock.backtest()
+
+        self.assertEqual(self.backtest_start_timestamp + 5, clock.current_timestamp)
+        self.assertEqual([self.backtest_start_timestamp + 5], scheduled_iterator.ticks)
+        self.assertEqual([], event_driven_iterator.ticks)
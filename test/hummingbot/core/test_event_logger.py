@@ -0,0 +1,87 @@
+import asyncio
+import unittest
+from decimal import Decimal
+from typing import Awaitable
+
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import OrderCancelledEvent, OrderExpiredEvent, OrderFilledEvent
+
+
+class EventLoggerTest(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.ev_loop = asyncio.get_event_loop()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 1):
+        return self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+
+    def _fill_event(self, timestamp: float) -> OrderFilledEvent:
+        return OrderFilledEvent(
+            timestamp=timestamp,
+            order_id=f"OID{timestamp}",
+            trading_pair="COINALPHA-HBOT",
+            trade_type=TradeType.BUY,
+            order_type=OrderType.LIMIT,
+            price=Decimal("10"),
+            amount=Decimal("1"),
+            trade_fee=AddedToCostTradeFee())
+
+    def test_order_fill_events_are_all_kept_by_default(self):
+        event_logger = EventLogger()
+        for i in range(100):
+            event_logger(self._fill_event(i))
+            event_logger(OrderCancelledEvent(i, f"OID{i}"))
+
+        self.assertEqual(100, len(event_logger.events_of_type(OrderFilledEvent)))
+        self.assertEqual(50, len(event_logger.events_of_type(OrderCancelledEvent)))
+        self.assertEqual(150, len(event_logger.event_log))
+
+    def test_bounded_event_logs(self):
+        event_logger = EventLogger(max_events=10)
+        for i in range(100):
+            event_logger(self._fill_event(i))
+            event_logger(OrderCancelledEvent(i, f"OID{i}"))
+        event_logger(OrderExpiredEvent(100, "OID100"))
+
+        fills = event_logger.events_of_type(OrderFilledEvent)
+        self.assertEqual(list(range(90, 100)), [event.timestamp for event in fills])
+        cancels = event_logger.events_of_type(OrderCancelledEvent)
+        self.assertEqual(list(range(90, 100)), [event.timestamp for event in cancels])
+        self.assertEqual([OrderExpiredEvent(100, "OID100")], event_logger.events_of_type(OrderExpiredEvent))
+        self.assertEqual(20, len(event_logger.event_log))
+
+        event_logger.clear()
+        self.assertEqual([], event_logger.event_log)
+        self.assertEqual([], event_logger.events_of_type(OrderCancelledEvent))
+
+    def test_wait_for_event(self):
+        event_logger = EventLogger()
+        waiters = [self.ev_loop.create_task(event_logger.wait_for(OrderCancelledEvent)) for _ in range(2)]
+        fill_waiter = self.ev_loop.create_task(event_logger.wait_for(OrderFilledEvent))
+        self.async_run_with_timeout(asyncio.sleep(0))
+
+        event = OrderCancelledEvent(1, "OID1")
+        event_logger(OrderExpiredEvent(1, "OID1"))
+        event_logger(event)
+
+        for waiter in waiters:
+            self.assertIs(event, self.async_run_with_timeout(waiter))
+        self.assertFalse(fill_waiter.done())
+        fill_waiter.cancel()
+
+    def test_wait_for_timeout_removes_waiter(self):
+        event_logger = EventLogger()
+
+        with self.assertRaises(asyncio.TimeoutError):
+            self.async_run_with_timeout(event_logger.wait_for(OrderCancelledEvent, timeout_seconds=0.01))
+
+        # The timed out waiter is no longer notified, and new waiters still are
+        waiter = self.ev_loop.create_task(event_logger.wait_for(OrderCancelledEvent))
+        self.async_run_with_timeout(asyncio.sleep(0))
+        event = OrderCancelledEvent(1, "OID1")
+        event_logger(event)
+
+        self.assertIs(event, self.async_run_with_timeout(waiter))
+        self.assertEqual([event], event_logger.event_log)
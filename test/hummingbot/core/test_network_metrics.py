@@ -0,0 +1,91 @@
+import unittest
+
+from hummingbot.core.network_metrics import DurationSamples, NetworkMetrics, WSStreamMetrics
+
+
+class DurationSamplesTest(unittest.TestCase):
+    def test_record_and_summary(self):
+        samples = DurationSamples(window_size=3)
+        for duration in (0.004, 0.002, 0.1, 0.02):
+            samples.record(duration)
+
+        self.assertEqual(4, samples.count)
+        self.assertAlmostEqual(0.0315, samples.average)
+        self.assertAlmostEqual(0.1, samples.max)
+        # Only the last 3 samples are kept for the percentiles and the histogram
+        self.assertAlmostEqual(0.002, samples.percentile(0))
+        self.assertAlmostEqual(0.02, samples.percentile(50))
+        self.assertAlmostEqual(0.1, samples.percentile(99))
+        histogram = samples.histogram()
+        self.assertEqual(1, histogram[5])
+        self.assertEqual(1, histogram[25])
+        self.assertEqual(1, histogram[100])
+        self.assertEqual(3, sum(histogram.values()))
+
+        samples.reset()
+        self.assertEqual(0, samples.count)
+        self.assertEqual(0, samples.percentile(50))
+
+
+class NetworkMetricsTest(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.metrics = NetworkMetrics()
+
+    def test_rest_endpoint_rows(self):
+        self.metrics.record_throttle_wait(limit_id="/order", duration=0.5)
+        endpoint = self.metrics.rest_endpoint(limit_id="/order")
+        endpoint.record_response(network_time=0.1, request_bytes=20, response_bytes=300, is_error=False)
+        endpoint.record_response(network_time=0.3, request_bytes=20, response_bytes=100, is_error=True)
+        endpoint.decode_time.record(0.001)
+
+        rows = self.metrics.rest_endpoints_rows()
+
+        self.assertEqual(1, len(rows))
+        row = rows[0]
+        self.assertEqual("/order", row["limit_id"])
+        self.assertEqual(2, row["requests"])
+        self.assertEqual(1, row["errors"])
+        self.assertEqual(40, row["request_bytes"])
+        self.assertEqual(400, row["response_bytes"])
+        self.assertAlmostEqual(500, row["throttle_wait_avg_ms"])
+        self.assertAlmostEqual(200, row["network_avg_ms"])
+        self.assertAlmostEqual(300, row["network_max_ms"])
+        self.assertAlmostEqual(1, row["decode_avg_ms"])
+
+    def test_ws_stream_metrics(self):
+        stream = self.metrics.ws_stream(url="wss://stream.exchange.com/ws")
+        stream.record_message(timestamp=10.0, decode_time=0.001, size=100)
+        stream.record_message(timestamp=10.5, decode_time=0.003, size=50)
+        stream.reset_inter_arrival()
+        stream.record_message(timestamp=20.0, decode_time=0.002, size=50)
+
+        self.assertIs(stream, self.metrics.ws_stream(url="wss://stream.exchange.com/ws"))
+        self.assertEqual(3, stream.messages_count)
+        self.assertEqual(1, stream.inter_arrival.count)
+        self.assertAlmostEqual(2, stream.messages_rate)
+        row = self.metrics.ws_streams_rows()[0]
+        self.assertEqual(200, row["received_bytes"])
+        self.assertAlmostEqual(2, row["decode_avg_ms"])
+
+    def test_ws_stream_key_hides_tokens(self):
+        listen_key = "pqia91ma19a5s61cv6a81va65sdf19v8a65a1a5s61cv6a81va65sdf19v8a65a1"
+
+        key = NetworkMetrics.ws_stream_key(f"wss://stream.exchange.com:9443/ws/{listen_key}?token=secret")
+
+        self.assertEqual("wss://stream.exchange.com:9443/ws/*", key)
+
+    def test_reset_keeps_metrics_objects(self):
+        stream = self.metrics.ws_stream(url="wss://stream.exchange.com/ws")
+        stream.record_message(timestamp=10.0, decode_time=0.001, size=100)
+        self.metrics.record_throttle_wait(limit_id="/order", duration=0.5)
+
+        self.metrics.reset()
+
+        self.assertIs(stream, self.metrics.ws_streams["wss://stream.exchange.com/ws"])
+        self.assertEqual(0, stream.messages_count)
+        self.assertEqual(0, self.metrics.rest_endpoints["/order"].throttle_wait.count)
+
+    def test_shared_instance(self):
+        self.assertIs(NetworkMetrics.get_instance(), NetworkMetrics.get_instance())
+        self.assertIsInstance(WSStreamMetrics(url="url").inter_arrival, DurationSamples)
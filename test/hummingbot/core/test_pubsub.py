@@ -89,6 +89,38 @@ class PubSubTest(unittest.TestCase):
         listeners = self.pubsub.get_listeners(self.event_tag_zero)
         self.assertEqual(0, len(listeners))
 
+    def test_lapsed_listener_remove_on_trigger_event(self):
+        self.pubsub.add_listener(self.event_tag_zero, self.listener_zero)
+        self.pubsub.add_listener(self.event_tag_zero, self.listener_one)
+        self.listener_zero = None  # remove strong reference
+        gc.collect()
+
+        self.pubsub.trigger_event(self.event_tag_zero, self.event)
+        self.assertEqual([self.event], self.listener_one.event_log)
+        listeners = self.pubsub.get_listeners(self.event_tag_zero)
+        self.assertEqual([self.listener_one], listeners)
+
+    def test_lapsed_listener_added_again(self):
+        self.pubsub.add_listener(self.event_tag_zero, self.listener_zero)
+        self.pubsub.add_listener(self.event_tag_zero, self.listener_zero)
+        self.pubsub.remove_listener(self.event_tag_zero, self.listener_zero)
+        self.pubsub.add_listener(self.event_tag_zero, self.listener_zero)
+        self.listener_zero = None  # remove strong reference
+        gc.collect()
+
+        self.assertEqual(0, len(self.pubsub.get_listeners(self.event_tag_zero)))
+
+    def test_listeners_do_not_keep_pubsub_alive(self):
+        self.pubsub.add_listener(self.event_tag_zero, self.listener_zero)
+        pubsub_weakref = weakref.ref(self.pubsub)
+        self.pubsub = None
+        gc.collect()
+        self.assertIsNone(pubsub_weakref())
+
+        # The death of the listener after the pubsub must not fail
+        self.listener_zero = None
+        gc.collect()
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,28 @@
+import unittest
+
+from hummingbot.core.tick_timing_stats import TickTimingStats
+
+
+class TickTimingStatsTest(unittest.TestCase):
+    def test_record_ticks(self):
+        stats = TickTimingStats(name="TestIterator", window_size=4)
+        for duration in (0.0005, 0.003, 0.02, 1.5, 0.2):
+            stats.record(duration, tick_size=1.0)
+
+        self.assertEqual("TestIterator", stats.name)
+        self.assertEqual(5, stats.ticks_count)
+        self.assertEqual(1, stats.overruns)
+        self.assertEqual(0.2, stats.last_duration)
+        self.assertEqual(1.5, stats.max_duration)
+        self.assertAlmostEqual(1.7235 / 5, stats.average_duration)
+        # The percentiles and the histogram only cover the 4 most recent ticks
+        self.assertEqual(0.003, stats.percentile(0))
+        self.assertEqual(1.5, stats.percentile(99))
+        self.assertEqual(
+            {1: 0, 5: 1, 10: 0, 50: 1, 100: 0, 500: 1, 1000: 0, float("inf"): 1},
+            stats.histogram())
+
+        stats.reset()
+        self.assertEqual(0, stats.ticks_count)
+        self.assertEqual(0, stats.overruns)
+        self.assertEqual(0.0, stats.percentile(50))
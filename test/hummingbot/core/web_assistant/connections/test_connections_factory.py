@@ -2,9 +2,11 @@ import asyncio
 import unittest
 from typing import Awaitable
 
+from hummingbot.client.config.client_config_map import HTTPClientConfigMap
 from hummingbot.core.web_assistant.connections.connections_factory import (
     ConnectionsFactory
 )
+from hummingbot.core.web_assistant.connections.data_types import HTTPClientConfig
 from hummingbot.core.web_assistant.connections.rest_connection import (
     RESTConnection
 )
@@ -34,3 +36,30 @@ class ConnectionsFactoryTest(unittest.TestCase):
         rest_connection = self.async_run_with_timeout(factory.get_ws_connection())
 
         self.assertIsInstance(rest_connection, WSConnection)
+
+    def test_shared_client_uses_http_client_config(self):
+        factory = ConnectionsFactory(http_client_config=HTTPClientConfig(
+            limit=20, limit_per_host=5, keepalive_timeout=90, dns_cache_ttl=300))
+
+        shared_client = self.async_run_with_timeout(factory._get_shared_client())
+        connector = shared_client.connector
+
+        self.assertEqual(20, connector.limit)
+        self.assertEqual(5, connector.limit_per_host)
+        self.assertEqual(90, connector._keepalive_timeout)
+        self.assertTrue(connector.use_dns_cache)
+        self.assertEqual(300, connector._cached_hosts._ttl)
+        self.async_run_with_timeout(shared_client.close())
+
+    def test_client_config_defaults_match_http_client_config_defaults(self):
+        self.assertEqual(HTTPClientConfig(), HTTPClientConfigMap().build_http_client_config())
+
+    def test_dns_cache_disabled_with_zero_ttl(self):
+        factory = ConnectionsFactory()
+        factory.set_http_client_config(HTTPClientConfig(dns_cache_ttl=0))
+
+        shared_client = self.async_run_with_timeout(factory._get_shared_client())
+
+        self.assertFalse(shared_client.connector.use_dns_cache)
+        self.assertEqual(0, factory.http_client_config.dns_cache_ttl)
+        self.async_run_with_timeout(shared_client.close())
@@ -0,0 +1,35 @@
+import unittest
+from decimal import Decimal
+
+from hummingbot.core.web_assistant.connections.json_codec import JSONCodec, UJSONCodec, fast_json_codec
+
+
+class JSONCodecTest(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.message = '{"e": "depthUpdate", "U": 157, "b": [["0.0024", "10"]], "p": 0.1, "ok": true}'
+        self.expected = {"e": "depthUpdate", "U": 157, "b": [["0.0024", "10"]], "p": 0.1, "ok": True}
+
+    def test_codecs_decode_text_and_bytes(self):
+        for codec in (JSONCodec(), UJSONCodec(), fast_json_codec()):
+            self.assertEqual(self.expected, codec.loads(self.message))
+            self.assertEqual(self.expected, codec.loads(self.message.encode("utf-8")))
+
+    def test_codecs_round_trip(self):
+        payload = {"method": "SUBSCRIBE", "params": ["coinalpha@depth"], "id": 1}
+        for codec in (JSONCodec(), UJSONCodec(), fast_json_codec()):
+            self.assertEqual(payload, codec.loads(codec.dumps(payload)))
+
+    def test_codecs_raise_value_error_for_invalid_json(self):
+        for codec in (JSONCodec(), JSONCodec(numbers_as_str=True), UJSONCodec(), fast_json_codec()):
+            with self.assertRaises(ValueError):
+                codec.loads("not a json")
+
+    def test_numbers_as_str(self):
+        codec = JSONCodec(numbers_as_str=True)
+
+        decoded = codec.loads('{"U": 157, "p": 0.1000000000000000055}')
+
+        self.assertTrue(codec.numbers_as_str)
+        self.assertEqual({"U": "157", "p": "0.1000000000000000055"}, decoded)
+        self.assertEqual(Decimal("0.1000000000000000055"), Decimal(decoded["p"]))
@@ -1,14 +1,19 @@
 import asyncio
+import gzip
 import json
 import unittest
 from typing import Awaitable, List
 from unittest.mock import AsyncMock, patch
 
 import aiohttp
+from aiohttp import web
+from aiohttp.test_utils import TestServer
 
 from hummingbot.connector.test_support.network_mocking_assistant import NetworkMockingAssistant
 from hummingbot.core.web_assistant.connections.data_types import WSJSONRequest, WSResponse
+from hummingbot.core.web_assistant.connections.json_codec import JSONCodec
 from hummingbot.core.web_assistant.connections.ws_connection import WSConnection
+from hummingbot.core.web_assistant.connections.ws_frame_decompressor import WSFrameDecompressor
 
 
 class WSConnectionTest(unittest.TestCase):
@@ -121,6 +126,139 @@ class WSConnectionTest(unittest.TestCase):
         self.assertEqual(data, response.data)
         self.assertNotEqual(0, self.ws_connection.last_recv_time)
 
+    @patch("aiohttp.client.ClientSession.ws_connect", new_callable=AsyncMock)
+    def test_receive_decodes_with_json_codec(self, ws_connect_mock):
+        ws_connection = WSConnection(self.client_session, json_codec=JSONCodec(numbers_as_str=True))
+        ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
+        self.async_run_with_timeout(ws_connection.connect(self.ws_url))
+        self.mocking_assistant.add_websocket_aiohttp_message(
+            ws_connect_mock.return_value, message='{"one": 1, "price": 0.1}'
+        )
+        self.mocking_assistant.add_websocket_aiohttp_message(
+            ws_connect_mock.return_value, message="not a json"
+        )
+
+        response = self.async_run_with_timeout(ws_connection.receive())
+        self.assertEqual({"one": "1", "price": "0.1"}, response.data)
+
+        response = self.async_run_with_timeout(ws_connection.receive())
+        self.assertEqual("not a json", response.data)
+
+    @patch("aiohttp.client.ClientSession.ws_connect", new_callable=AsyncMock)
+    def test_connect_requests_permessage_deflate(self, ws_connect_mock):
+        ws_connection = WSConnection(self.client_session, compress=15)
+        ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
+
+        self.async_run_with_timeout(ws_connection.connect(self.ws_url))
+
+        self.assertEqual(15, ws_connect_mock.call_args.kwargs["compress"])
+
+    @patch("aiohttp.client.ClientSession.ws_connect", new_callable=AsyncMock)
+    def test_receive_decompresses_binary_frames(self, ws_connect_mock):
+        ws_connection = WSConnection(self.client_session, frame_decompressor=WSFrameDecompressor(encoding="gzip"))
+        ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
+        self.async_run_with_timeout(ws_connection.connect(self.ws_url))
+        data = {"one": 1}
+        self.mocking_assistant.add_websocket_aiohttp_message(
+            ws_connect_mock.return_value,
+            message=gzip.compress(json.dumps(data).encode()),
+            message_type=aiohttp.WSMsgType.BINARY,
+        )
+        self.mocking_assistant.add_websocket_aiohttp_message(
+            ws_connect_mock.return_value, message=b"not compressed", message_type=aiohttp.WSMsgType.BINARY
+        )
+        self.mocking_assistant.add_websocket_aiohttp_message(
+            ws_connect_mock.return_value, message=json.dumps(data)
+        )
+
+        response = self.async_run_with_timeout(ws_connection.receive())
+        self.assertEqual(data, response.data)
+
+        response = self.async_run_with_timeout(ws_connection.receive())
+        self.assertEqual(b"not compressed", response.data)
+
+        response = self.async_run_with_timeout(ws_connection.receive())
+        self.assertEqual(data, response.data)
+
+    def _patch_buffered_messages_count(self, ws_mock):
+        queue = self.mocking_assistant._incoming_websocket_aiohttp_queues[ws_mock]
+        self.ws_connection._buffered_messages_count = lambda: queue.qsize()
+
+    @patch("aiohttp.client.ClientSession.ws_connect", new_callable=AsyncMock)
+    def test_receive_batch_drains_buffered_messages(self, ws_connect_mock):
+        ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
+        self.async_run_with_timeout(self.ws_connection.connect(self.ws_url))
+        self._patch_buffered_messages_count(ws_connect_mock.return_value)
+        for i in range(5):
+            self.mocking_assistant.add_websocket_aiohttp_message(
+                ws_connect_mock.return_value, message=json.dumps({"id": i})
+            )
+        self.mocking_assistant.add_websocket_aiohttp_message(
+            ws_connect_mock.return_value, message="", message_type=aiohttp.WSMsgType.PONG
+        )
+
+        responses = self.async_run_with_timeout(self.ws_connection.receive_batch(max_messages=3))
+        self.assertEqual([{"id": 0}, {"id": 1}, {"id": 2}], [response.data for response in responses])
+
+        # The PONG is consumed without producing a response
+        responses = self.async_run_with_timeout(self.ws_connection.receive_batch())
+        self.assertEqual([{"id": 3}, {"id": 4}], [response.data for response in responses])
+
+        self.async_run_with_timeout(self.ws_connection.disconnect())
+        self.assertEqual([], self.async_run_with_timeout(self.ws_connection.receive_batch()))
+
+    def test_buffered_messages_count_with_aiohttp_websocket(self):
+        async def handler(request: web.Request) -> web.WebSocketResponse:
+            ws = web.WebSocketResponse()
+            await ws.prepare(request)
+            for i in range(3):
+                await ws.send_str(json.dumps({"id": i}))
+            await ws.receive()
+            return ws
+
+        async def run():
+            app = web.Application()
+            app.router.add_get("/ws", handler)
+            async with TestServer(app) as server, aiohttp.ClientSession() as client_session:
+                ws_connection = WSConnection(client_session)
+                await ws_connection.connect(str(server.make_url("/ws")))
+                self.assertIsInstance(ws_connection._connection, aiohttp.ClientWebSocketResponse)
+                while ws_connection._buffered_messages_count() < 3:
+                    await asyncio.sleep(0.01)
+
+                responses = await ws_connection.receive_batch()
+
+                self.assertEqual([{"id": 0}, {"id": 1}, {"id": 2}], [response.data for response in responses])
+                self.assertEqual(0, ws_connection._buffered_messages_count())
+                await ws_connection.disconnect()
+
+        self.async_run_with_timeout(run(), timeout=5)
+
+    def test_buffered_messages_count_without_reader_queue_length(self):
+        self.ws_connection._connection = object()
+        self.assertEqual(0, self.ws_connection._buffered_messages_count())
+
+    @patch("aiohttp.client.ClientSession.ws_connect", new_callable=AsyncMock)
+    def test_receive_batch_raises_close_after_returning_previous_messages(self, ws_connect_mock):
+        ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
+        ws_connect_mock.return_value.close_code = 1111
+        self.async_run_with_timeout(self.ws_connection.connect(self.ws_url))
+        self._patch_buffered_messages_count(ws_connect_mock.return_value)
+        self.mocking_assistant.add_websocket_aiohttp_message(
+            ws_connect_mock.return_value, message=json.dumps({"one": 1})
+        )
+        self.mocking_assistant.add_websocket_aiohttp_message(
+            ws_connect_mock.return_value, message="", message_type=aiohttp.WSMsgType.CLOSE
+        )
+
+        responses = self.async_run_with_timeout(self.ws_connection.receive_batch())
+
+        self.assertEqual([{"one": 1}], [response.data for response in responses])
+        self.assertFalse(self.ws_connection.connected)
+        with self.assertRaises(ConnectionError):
+            self.async_run_with_timeout(self.ws_connection.receive_batch())
+        self.assertEqual([], self.async_run_with_timeout(self.ws_connection.receive_batch()))
+
     @patch("aiohttp.client.ClientSession.ws_connect", new_callable=AsyncMock)
     def test_receive_disconnects_and_raises_on_aiohttp_closed(self, ws_connect_mock):
         ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
@@ -0,0 +1,54 @@
+import gzip
+import unittest
+import zlib
+
+from hummingbot.core.web_assistant.connections.ws_frame_decompressor import WSFrameDecompressor
+
+
+class WSFrameDecompressorTest(unittest.TestCase):
+    message = b'{"channel": "depth", "data": [["100.5", "1.2"]]}'
+
+    @staticmethod
+    def _deflate(data: bytes) -> bytes:
+        compressor = zlib.compressobj(wbits=-zlib.MAX_WBITS)
+        return compressor.compress(data) + compressor.flush()
+
+    def test_gzip(self):
+        decompressor = WSFrameDecompressor(encoding="gzip")
+
+        self.assertEqual(self.message, decompressor.decompress(gzip.compress(self.message)))
+
+    def test_zlib(self):
+        decompressor = WSFrameDecompressor(encoding="zlib")
+
+        self.assertEqual(self.message, decompressor.decompress(zlib.compress(self.message)))
+
+    def test_deflate(self):
+        decompressor = WSFrameDecompressor(encoding="deflate")
+
+        self.assertEqual(self.message, decompressor.decompress(self._deflate(self.message)))
+
+    def test_deflate_stream_without_final_block(self):
+        decompressor = WSFrameDecompressor(encoding="deflate")
+        compressor = zlib.compressobj(wbits=-zlib.MAX_WBITS)
+        data = compressor.compress(self.message) + compressor.flush(zlib.Z_SYNC_FLUSH)
+
+        self.assertEqual(self.message, decompressor.decompress(data))
+
+    def test_auto_detects_encoding(self):
+        decompressor = WSFrameDecompressor()
+
+        self.assertEqual("auto", decompressor.encoding)
+        self.assertEqual(self.message, decompressor.decompress(gzip.compress(self.message)))
+        self.assertEqual(self.message, decompressor.decompress(zlib.compress(self.message)))
+        self.assertEqual(self.message, decompressor.decompress(self._deflate(self.message)))
+
+    def test_wrong_encoding_raises(self):
+        decompressor = WSFrameDecompressor(encoding="gzip")
+
+        with self.assertRaises(zlib.error):
+            decompressor.decompress(self._deflate(self.message))
+
+    def test_invalid_encoding_raises(self):
+        with self.assertRaises(ValueError):
+            WSFrameDecompressor(encoding="brotli")
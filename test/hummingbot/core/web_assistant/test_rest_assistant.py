@@ -8,12 +8,15 @@ import aiohttp
 from aioresponses import aioresponses
 
 from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
+from hummingbot.core.api_throttler.data_types import RateLimit
+from hummingbot.core.network_metrics import NetworkMetrics
 from hummingbot.core.web_assistant.auth import AuthBase
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod, RESTRequest, RESTResponse, WSRequest
 from hummingbot.core.web_assistant.connections.rest_connection import RESTConnection
 from hummingbot.core.web_assistant.rest_assistant import RESTAssistant
 from hummingbot.core.web_assistant.rest_post_processors import RESTPostProcessorBase
 from hummingbot.core.web_assistant.rest_pre_processors import RESTPreProcessorBase
+from hummingbot.core.web_assistant.rest_request_coalescer import RESTRequestCoalescer
 
 
 class RESTAssistantTest(unittest.TestCase):
@@ -100,3 +103,52 @@ class RESTAssistantTest(unittest.TestCase):
         self.assertIsNotNone(call_request)
         self.assertIsNotNone(call_request.headers)
         self.assertEqual(call_request.headers, auth_header)
+
+    @aioresponses()
+    def test_concurrent_identical_public_gets_are_coalesced(self, mocked_api):
+        url = "https://www.test.com/url"
+        mocked_api.get(url, body=json.dumps({"one": 1}).encode())
+        mocked_api.get(url, body=json.dumps({"two": 2}).encode())
+        connection = RESTConnection(aiohttp.ClientSession())
+        assistant = RESTAssistant(
+            connection=connection,
+            throttler=AsyncThrottler(rate_limits=[RateLimit(limit_id="limit", limit=10, time_interval=1)]),
+            request_coalescer=RESTRequestCoalescer())
+
+        async def execute_concurrently():
+            return await asyncio.gather(
+                assistant.execute_request(url=url, throttler_limit_id="limit"),
+                assistant.execute_request(url=url, throttler_limit_id="limit"))
+
+        first_result, second_result = self.async_run_with_timeout(execute_concurrently())
+
+        self.assertEqual({"one": 1}, first_result)
+        self.assertEqual({"one": 1}, second_result)
+        self.assertIsNot(first_result, second_result)
+
+        # Once the first call is done an identical request is sent again
+        result = self.async_run_with_timeout(assistant.execute_request(url=url, throttler_limit_id="limit"))
+        self.assertEqual({"two": 2}, result)
+
+    @aioresponses()
+    def test_execute_request_records_network_metrics(self, mocked_api):
+        url = "https://www.test.com/url"
+        body = json.dumps({"one": 1})
+        mocked_api.post(url, body=body.encode())
+        network_metrics = NetworkMetrics()
+        connection = RESTConnection(aiohttp.ClientSession())
+        assistant = RESTAssistant(
+            connection=connection,
+            throttler=AsyncThrottler(rate_limits=[RateLimit(limit_id="limit", limit=10, time_interval=1)]))
+
+        with patch.object(NetworkMetrics, "get_instance", return_value=network_metrics):
+            self.async_run_with_timeout(assistant.execute_request(
+                url=url, throttler_limit_id="limit", method=RESTMethod.POST, data={"two": 2}))
+
+        metrics = network_metrics.rest_endpoint(limit_id="limit")
+        self.assertEqual(1, metrics.throttle_wait.count)
+        self.assertEqual(1, metrics.network_time.count)
+        self.assertEqual(1, metrics.decode_time.count)
+        self.assertEqual(len(json.dumps({"two": 2})), metrics.request_bytes)
+        self.assertEqual(len(body), metrics.response_bytes)
+        self.assertEqual(0, metrics.errors_count)
@@ -0,0 +1,123 @@
+import asyncio
+import unittest
+from typing import Awaitable
+
+from hummingbot.core.web_assistant.rest_request_coalescer import RESTRequestCoalescer
+
+
+class RESTRequestCoalescerTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop = asyncio.get_event_loop()
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.calls_count = 0
+        self.response_event = asyncio.Event()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 1):
+        return self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+
+    async def _request(self):
+        self.calls_count += 1
+        await self.response_event.wait()
+        return {"calls": self.calls_count}
+
+    async def _failing_request(self):
+        self.calls_count += 1
+        await self.response_event.wait()
+        raise IOError("Request failed")
+
+    def test_request_key_ignores_params_order(self):
+        self.assertEqual(
+            RESTRequestCoalescer.request_key(url="url", params={"a": 1, "b": 2}),
+            RESTRequestCoalescer.request_key(url="url", params={"b": 2, "a": 1}))
+        self.assertNotEqual(
+            RESTRequestCoalescer.request_key(url="url", params={"a": 1}),
+            RESTRequestCoalescer.request_key(url="url", params={"a": 2}))
+        self.assertNotEqual(
+            RESTRequestCoalescer.request_key(url="url"),
+            RESTRequestCoalescer.request_key(url="url", return_err=True))
+
+    def test_concurrent_requests_share_one_call(self):
+        coalescer = RESTRequestCoalescer()
+        key = RESTRequestCoalescer.request_key(url="url")
+
+        async def execute_concurrently():
+            tasks = [asyncio.ensure_future(coalescer.execute(key=key, request_function=self._request))
+                     for _ in range(3)]
+            await asyncio.sleep(0)
+            self.assertEqual(1, coalescer.in_flight_count)
+            self.response_event.set()
+            return await asyncio.gather(*tasks)
+
+        results = self.async_run_with_timeout(execute_concurrently())
+
+        self.assertEqual(1, self.calls_count)
+        self.assertEqual([{"calls": 1}] * 3, results)
+        # Each waiter gets its own copy of the result
+        results[0]["calls"] = 10
+        self.assertEqual({"calls": 1}, results[1])
+        self.assertEqual(0, coalescer.in_flight_count)
+
+        # Without cache the next request is sent again
+        result = self.async_run_with_timeout(coalescer.execute(key=key, request_function=self._request))
+        self.assertEqual({"calls": 2}, result)
+
+    def test_errors_are_raised_to_all_waiters(self):
+        coalescer = RESTRequestCoalescer()
+        key = RESTRequestCoalescer.request_key(url="url")
+
+        async def execute_concurrently():
+            tasks = [asyncio.ensure_future(coalescer.execute(key=key, request_function=self._failing_request))
+                     for _ in range(2)]
+            await asyncio.sleep(0)
+            self.response_event.set()
+            return await asyncio.gather(*tasks, return_exceptions=True)
+
+        results = self.async_run_with_timeout(execute_concurrently())
+
+        self.assertEqual(1, self.calls_count)
+        self.assertTrue(all(isinstance(result, IOError) for result in results))
+        self.assertEqual(0, coalescer.in_flight_count)
+
+    def test_waiter_timeout_does_not_cancel_the_call(self):
+        coalescer = RESTRequestCoalescer()
+        key = RESTRequestCoalescer.request_key(url="url")
+
+        async def execute_with_timeout():
+            waiting_task = asyncio.ensure_future(coalescer.execute(key=key, request_function=self._request))
+            with self.assertRaises(asyncio.TimeoutError):
+                await coalescer.execute(key=key, request_function=self._request, timeout=0.01)
+            self.response_event.set()
+            return await waiting_task
+
+        result = self.async_run_with_timeout(execute_with_timeout())
+
+        self.assertEqual({"calls": 1}, result)
+        self.assertEqual(1, self.calls_count)
+
+    def test_results_cached_for_ttl(self):
+        coalescer = RESTRequestCoalescer(cache_ttl=5)
+        now = 1000.0
+        coalescer._time = lambda: now
+        key = RESTRequestCoalescer.request_key(url="url")
+        self.response_event.set()
+
+        first_result = self.async_run_with_timeout(coalescer.execute(key=key, request_function=self._request))
+        first_result["calls"] = 10
+        second_result = self.async_run_with_timeout(coalescer.execute(key=key, request_function=self._request))
+
+        self.assertEqual({"calls": 1}, second_result)
+        self.assertEqual(1, self.calls_count)
+
+        now += 5
+        third_result = self.async_run_with_timeout(coalescer.execute(key=key, request_function=self._request))
+
+        self.assertEqual({"calls": 2}, third_result)
+        self.assertEqual(2, self.calls_count)
+
+    def test_negative_ttl_raises(self):
+        with self.assertRaises(ValueError):
+            RESTRequestCoalescer(cache_ttl=-1)
@@ -4,6 +4,7 @@ from typing import Awaitable
 
 from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
 from hummingbot.core.web_assistant.rest_assistant import RESTAssistant
+from hummingbot.core.web_assistant.rest_request_coalescer import RESTRequestCoalescer
 from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
 from hummingbot.core.web_assistant.ws_assistant import WSAssistant
 
@@ -31,3 +32,21 @@ class WebAssistantsFactoryTest(unittest.TestCase):
         ws_assistant = self.async_run_with_timeout(factory.get_ws_assistant())
 
         self.assertIsInstance(ws_assistant, WSAssistant)
+
+    def test_request_coalescer_disabled_by_default(self):
+        factory = WebAssistantsFactory(throttler=AsyncThrottler(rate_limits=[]))
+
+        rest_assistant = self.async_run_with_timeout(factory.get_rest_assistant())
+
+        self.assertIsNone(factory.rest_request_coalescer)
+        self.assertIsNone(rest_assistant._request_coalescer)
+
+    def test_rest_assistants_share_the_configured_request_coalescer(self):
+        coalescer = RESTRequestCoalescer()
+        factory = WebAssistantsFactory(throttler=AsyncThrottler(rate_limits=[]), rest_request_coalescer=coalescer)
+
+        first_assistant = self.async_run_with_timeout(factory.get_rest_assistant())
+        second_assistant = self.async_run_with_timeout(factory.get_rest_assistant())
+
+        self.assertIs(coalescer, first_assistant._request_coalescer)
+        self.assertIs(coalescer, second_assistant._request_coalescer)
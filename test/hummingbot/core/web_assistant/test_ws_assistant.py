@@ -200,3 +200,24 @@ class WSAssistantTest(unittest.TestCase):
 
         with self.assertRaises(StopAsyncIteration):
             self.async_run_with_timeout(iter_messages_iterator.__anext__())
+
+    @patch(
+        "hummingbot.core.web_assistant.connections.ws_connection.WSConnection.connected",
+        new_callable=PropertyMock,
+    )
+    @patch("hummingbot.core.web_assistant.connections.ws_connection.WSConnection.receive_batch")
+    def test_iter_message_batches(self, receive_batch_mock, connected_mock):
+        connected_mock.return_value = True
+        receive_batch_mock.return_value = [WSResponse({"one": 1}), WSResponse({"two": 2})]
+        iter_message_batches_iterator = self.ws_assistant.iter_message_batches(max_messages=10)
+
+        responses = self.async_run_with_timeout(iter_message_batches_iterator.__anext__())
+
+        self.assertEqual([{"one": 1}, {"two": 2}], [response.data for response in responses])
+        receive_batch_mock.assert_called_with(max_messages=10)
+
+        connected_mock.return_value = False
+        receive_batch_mock.return_value = []
+
+        with self.assertRaises(StopAsyncIteration):
+            self.async_run_with_timeout(iter_message_batches_iterator.__anext__())
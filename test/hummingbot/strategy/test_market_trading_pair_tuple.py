@@ -288,6 +288,20 @@ class MarketTradingPairTupleUnitTest(unittest.TestCase):
 
         self.assertAlmostEqual(expected_vwap, self.market_info.get_vwap_for_volume(False, order_volume).result_price, 3)
 
+    def test_vwap_for_volumes(self):
+        volumes = [Decimal("15"), Decimal("5"), Decimal("1000000")]
+        for is_buy in (True, False):
+            result = self.market_info.get_vwap_for_volumes(is_buy, volumes)
+
+            for i, volume in enumerate(volumes[:2]):
+                self.assertAlmostEqual(self.market_info.get_vwap_for_volume(is_buy, volume).result_price,
+                                       Decimal(str(result.result_vwaps[i])), 3)
+                self.assertAlmostEqual(self.market_info.get_price_for_volume(is_buy, volume).result_price,
+                                       Decimal(str(result.result_prices[i])), 3)
+                self.assertEqual(float(volume), result.result_volumes[i])
+            self.assertTrue(math.isnan(result.result_vwaps[2]))
+            self.assertTrue(math.isnan(result.result_prices[2]))
+
     def test_get_price_for_volume(self):
         # Check price on BUY sell
         order_volume: Decimal = Decimal("15")
@@ -8,6 +8,7 @@ from typing import Union
 from hummingbot.client.config.client_config_map import ClientConfigMap
 from hummingbot.client.config.config_helpers import ClientConfigAdapter
 from hummingbot.connector.test_support.mock_paper_exchange import MockPaperExchange
+from hummingbot.core.clock import Clock, ClockMode
 from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.data_type.market_order import MarketOrder
@@ -63,6 +64,21 @@ class MockPyStrategy(StrategyPyBase):
         self.events_queue.append(funding_payment_completed_event)
 
 
+class ScheduledPyStrategy(StrategyPyBase):
+    """
+    Acts every `action_interval` seconds and records the timestamps at which it is ticked
+    """
+
+    def __init__(self, action_interval: float):
+        super().__init__()
+        self.action_interval = action_interval
+        self.ticks = []
+
+    def tick(self, timestamp: float):
+        self.ticks.append(timestamp)
+        self.schedule_next_action(timestamp + self.action_interval)
+
+
 class StrategyPyBaseUnitTests(unittest.TestCase):
 
     @classmethod
@@ -317,3 +333,26 @@ class StrategyPyBaseUnitTests(unittest.TestCase):
         event = self.strategy.events_queue.popleft()
 
         self.assertIsInstance(event, FundingPaymentCompletedEvent)
+
+    def test_fast_forward_backtest_skips_ticks_until_next_scheduled_action(self):
+        start = 1640000000.0
+        clock = Clock(ClockMode.BACKTEST, 1.0, start, start + 1000, fast_forward=True)
+        strategy = ScheduledPyStrategy(action_interval=100)
+        strategy.add_markets([self.market])
+        clock.add_iterator(self.market)
+        clock.add_iterator(strategy)
+
+        clock.backtest()
+
+        self.assertEqual(start + 1000, clock.current_timestamp)
+        self.assertEqual([start + offset for offset in (1, 101, 201, 301, 401, 501, 601, 701, 801, 901, 1000)],
+                         strategy.ticks)
+
+    def test_next_event_timestamp_uses_scheduled_action(self):
+        start = 1640000000.0
+
+        # Without a scheduled action the strategy needs every tick
+        self.assertEqual(start, self.strategy.next_event_timestamp(start))
+
+        self.strategy.schedule_next_action(start + 5)
+        self.assertEqual(start + 5, self.strategy.next_event_timestamp(start))